@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+"""엔드포인트별 입장 제어(admission control)와 부하 차단(load shedding).
+
+- 엔드포인트(그룹)마다 동시 처리 수(concurrency)와 대기열 길이(queue)를 둡니다.
+  - 자리가 있으면 바로 입장, 없으면 FIFO 대기열에서 최대 max_wait_ms까지 기다립니다.
+  - 대기열이 가득 찼거나 너무 오래 기다리면 `AdmissionRejected`(-> 503 + Retry-After)로 바로 돌려보냅니다.
+  몰린 요청이 서버 안에서 쌓여 전부 타임아웃되는 대신, 처리할 수 있는 만큼만 받고 나머지는 빨리 거절합니다.
+- Retry-After(초)는 (대기 + 처리 중 요청 수) x 평균 처리 시간(EWMA) / concurrency로 추정합니다(1~60초).
+- 설정(환경 변수, NAME은 그룹 이름 대문자. 예: ANALYSIS)
+  - SAJU_ADMISSION_CONCURRENCY / SAJU_ADMISSION_QUEUE / SAJU_ADMISSION_MAX_WAIT_MS: 전체 기본값
+  - SAJU_ADMISSION_<NAME>_CONCURRENCY / _QUEUE / _MAX_WAIT_MS: 그룹별 값
+  - concurrency 0이면 그 그룹은 제한하지 않습니다.
+- 계측: saju_admission_wait_seconds{endpoint}, saju_admission_rejected_total{endpoint, reason},
+  saju_admission_active{endpoint}, saju_admission_queued{endpoint}
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+from .metrics import ADMISSION_REJECTED, ADMISSION_WAIT, register_collector
+
+_DEFAULT_CONCURRENCY = 32
+_DEFAULT_QUEUE = 64
+_DEFAULT_MAX_WAIT_MS = 5000.0
+# 무거운 그룹의 기본값(concurrency, queue)
+_GROUP_DEFAULTS: Dict[str, tuple] = {
+    "compatibility": (4, 16),
+    "stats": (2, 4),
+}
+_MIN_RETRY_AFTER = 1
+_MAX_RETRY_AFTER = 60
+_EWMA_ALPHA = 0.2
+
+
+class AdmissionRejected(RuntimeError):
+    def __init__(self, endpoint: str, reason: str, retry_after: int) -> None:
+        super().__init__(f"{endpoint} is overloaded ({reason}), retry after {retry_after}s")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class AdmissionConfig:
+    concurrency: int = _DEFAULT_CONCURRENCY
+    queue: int = _DEFAULT_QUEUE
+    max_wait_ms: float = _DEFAULT_MAX_WAIT_MS
+
+    @classmethod
+    def from_env(cls, name: str) -> "AdmissionConfig":
+        concurrency, queue = _GROUP_DEFAULTS.get(name, (_DEFAULT_CONCURRENCY, _DEFAULT_QUEUE))
+
+        def value(suffix: str, default: str) -> str:
+            specific = os.environ.get(f"SAJU_ADMISSION_{name.upper()}_{suffix}")
+            return specific if specific is not None else os.environ.get(f"SAJU_ADMISSION_{suffix}", default)
+
+        return cls(
+            concurrency=max(0, int(value("CONCURRENCY", str(concurrency)))),
+            queue=max(0, int(value("QUEUE", str(queue)))),
+            max_wait_ms=max(0.0, float(value("MAX_WAIT_MS", str(_DEFAULT_MAX_WAIT_MS)))),
+        )
+
+
+class AdmissionGate:
+    def __init__(self, name: str, config: Optional[AdmissionConfig] = None) -> None:
+        self.name = name
+        self.config = config or AdmissionConfig()
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        # 평균 처리 시간(초, EWMA). Retry-After 추정에만 씁니다.
+        self.service_seconds = 0.05
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        concurrency = max(1, self.config.concurrency)
+        estimate = (self.active + self.queued) * self.service_seconds / concurrency
+        return min(_MAX_RETRY_AFTER, max(_MIN_RETRY_AFTER, math.ceil(estimate)))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        ADMISSION_REJECTED.inc(endpoint=self.name, reason=reason)
+        return AdmissionRejected(self.name, reason, self.retry_after())
+
+    async def acquire(self) -> None:
+        """자리를 얻을 때까지 기다립니다. 대기열이 가득 찼거나 max_wait_ms를 넘으면 AdmissionRejected."""
+
+        if self.config.concurrency <= 0:
+            return
+        if self.active < self.config.concurrency and not self._waiters:
+            self.active += 1
+            ADMISSION_WAIT.observe(0.0, endpoint=self.name)
+            return
+        if len(self._waiters) >= self.config.queue:
+            raise self._reject("queue_full")
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, self.config.max_wait_ms / 1000.0)
+        except asyncio.TimeoutError:
+            self._discard(future)
+            raise self._reject("timeout") from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 취소되면 다음 대기자에게 넘깁니다.
+                self._hand_over()
+            else:
+                self._discard(future)
+            raise
+        ADMISSION_WAIT.observe(time.perf_counter() - start, endpoint=self.name)
+
+    def release(self, held_seconds: Optional[float] = None) -> None:
+        if self.config.concurrency <= 0:
+            return
+        if held_seconds is not None:
+            self.service_seconds += _EWMA_ALPHA * (held_seconds - self.service_seconds)
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        # 자리는 그대로 두고(active 유지) 다음 대기자에게 넘깁니다. 대기자가 없으면 반납.
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, future: "asyncio.Future[None]") -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+
+class AdmissionController:
+    """그룹 이름 -> AdmissionGate(처음 쓸 때 환경 변수로 설정)."""
+
+    def __init__(self) -> None:
+        self._gates: Dict[str, AdmissionGate] = {}
+
+    def gate(self, name: str) -> AdmissionGate:
+        gate = self._gates.get(name)
+        if gate is None:
+            gate = self._gates[name] = AdmissionGate(name, AdmissionConfig.from_env(name))
+        return gate
+
+    def collect(self):
+        gates = sorted(self._gates.items())
+        yield (
+            "saju_admission_active",
+            "gauge",
+            "Requests holding an admission slot.",
+            [({"endpoint": name}, gate.active) for name, gate in gates],
+        )
+        yield (
+            "saju_admission_queued",
+            "gauge",
+            "Requests waiting for an admission slot.",
+            [({"endpoint": name}, gate.queued) for name, gate in gates],
+        )
+
+
+admission = AdmissionController()
+register_collector(admission.collect)
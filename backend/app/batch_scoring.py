@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+"""대량 원국/오행 점수(CSV 작업의 청크 계산 경로).
+
+입력 행은 ChartInput과 같은 이름의 열(문자열)입니다. 행마다 `calculate_chart`/`calculate_elements`를
+부르는 대신 청크 단위 배열 연산으로 계산하고, 결과는 두 함수와 같습니다.
+
+- 벡터 경로: Asia/Seoul 행(역사적 오프셋, 경도(진태양시) 포함)
+  - 4주: `vectorized.chart_indices_at`(절기 테이블 이분 탐색), 시간 미상은 그 날짜 23:59:59 기준 연/월주
+  - 오행: `compatibility.element_raw_scores` 후 calculate_elements와 같은 반올림/상태/정렬
+- 행별 경로: 다른 타임존, 절기 테이블/균시차 표 범위 밖, 테이블을 쓸 수 없는 환경(폴백 엔진)
+- 잘못된 행은 error 열에 사유를 적고 나머지 결과 열은 비웁니다(작업 전체는 계속).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .civil_time import wall_minutes_to_kst_minutes
+from .compatibility import element_raw_scores
+from .relations import chart_indices
+from .saju import (
+    BRANCHES,
+    ELEMENTS,
+    STEMS,
+    _normalize_calendar_type,
+    _normalize_timezone,
+    calculate_chart,
+    resolve_birth_date,
+)
+from .solar_term_table import solar_term_table_or_none
+from .solar_time import EOT_FIRST_DATE, EOT_LAST_DATE, resolve_longitude, true_solar_minutes
+from .vectorized import (
+    chart_indices_at,
+    day_indices_for_ordinals,
+    kst_minutes_to_ordinals,
+    ordinals_to_kst_minutes,
+    year_month_indices_at_utc,
+)
+
+PILLAR_COLUMNS = ["year_pillar", "month_pillar", "day_pillar", "hour_pillar"]
+RESULT_COLUMNS = PILLAR_COLUMNS + list(ELEMENTS) + ["deficiency", "excess", "error"]
+REQUIRED_COLUMNS = ("birth_date",)
+
+_PILLAR_NAMES = [STEMS[i % 10] + BRANCHES[i % 12] for i in range(60)]
+_TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+_FALSE_VALUES = {"", "0", "false", "f", "no", "n"}
+_KST_OFFSET_SECONDS = 9 * 3600
+
+
+@dataclass
+class BirthRow:
+    birth_date: date  # 양력(음력 입력은 변환됨), 역사적 오프셋 적용 전
+    hour: Optional[int]
+    minute: int
+    timezone: str
+    historical_offset: bool
+    longitude: Optional[float]
+
+    @property
+    def birth_time(self) -> Optional[str]:
+        return None if self.hour is None else f"{self.hour:02d}:{self.minute:02d}"
+
+
+def _flag(value: Optional[str], column: str) -> bool:
+    text = (value or "").strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{column} must be true or false")
+
+
+def parse_row(row: Mapping[str, Optional[str]]) -> BirthRow:
+    """CSV 행(열 이름 -> 문자열) -> BirthRow. 잘못된 값은 ValueError(사유 문구)."""
+
+    try:
+        year, month, day = (int(part) for part in (row.get("birth_date") or "").strip().split("-"))
+    except ValueError as exc:
+        raise ValueError("birth_date must be YYYY-MM-DD") from exc
+    calendar_type = row.get("calendar_type")
+    if _normalize_calendar_type(calendar_type) == "LUNAR":
+        # 음력 변환 오류는 lunar_to_solar의 사유 문구 그대로
+        leap = _flag(row.get("is_leap_month"), "is_leap_month")
+        birth_date = resolve_birth_date((year, month, day), calendar_type, leap)
+    else:
+        try:
+            birth_date = resolve_birth_date((year, month, day), calendar_type)
+        except ValueError as exc:
+            raise ValueError("birth_date must be YYYY-MM-DD") from exc
+
+    hour: Optional[int] = None
+    minute = 0
+    text = (row.get("birth_time") or "").strip()
+    if text:
+        try:
+            hour, minute = (int(part) for part in text.split(":"))
+        except ValueError as exc:
+            raise ValueError("birth_time must be HH:MM") from exc
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError("birth_time must be HH:MM")
+
+    longitude_text = (row.get("longitude") or "").strip()
+    try:
+        longitude = float(longitude_text) if longitude_text else None
+    except ValueError as exc:
+        raise ValueError("longitude must be a number") from exc
+    longitude = resolve_longitude(longitude, (row.get("city") or "").strip() or None)
+
+    timezone, _ = _normalize_timezone((row.get("timezone") or "").strip() or None)
+    return BirthRow(
+        birth_date=birth_date,
+        hour=hour,
+        minute=minute,
+        timezone=timezone,
+        historical_offset=_flag(row.get("use_historical_offset"), "use_historical_offset"),
+        longitude=longitude,
+    )
+
+
+def _vector_charts(rows: Sequence[BirthRow], table) -> tuple:
+    """Asia/Seoul 행들 -> ((N, 4) 인덱스, 벡터 경로로 계산된 행 마스크)."""
+
+    n = len(rows)
+    ordinals = np.array([r.birth_date.toordinal() for r in rows], dtype=np.int64)
+    known = np.array([r.hour is not None for r in rows], dtype=bool)
+    wall = ordinals_to_kst_minutes(ordinals) + np.array([(r.hour or 0) * 60 + r.minute for r in rows], dtype=np.int64)
+    offset = np.array([r.historical_offset for r in rows], dtype=bool) & known
+    longitude = np.array([np.nan if r.longitude is None else r.longitude for r in rows], dtype=np.float64)
+    solar = ~np.isnan(longitude) & known
+
+    # 시각이 있으면 실제 순간(KST 분), 없으면 그 날짜 23:59:59(calculate_chart의 대표 시각)
+    kst = wall.copy()
+    if offset.any():
+        kst[offset] = wall_minutes_to_kst_minutes(wall[offset])
+    seconds = np.where(
+        known,
+        (kst * 60 - _KST_OFFSET_SECONDS).astype(np.float64),
+        ((ordinals_to_kst_minutes(ordinals) + 1439) * 60 + 59 - _KST_OFFSET_SECONDS).astype(np.float64),
+    )
+
+    ipchun_first = table.ipchun_arrays[1][0] if len(table.ipchun_arrays[1]) else np.inf
+    covered = (seconds >= max(float(table.when_utc[0]), ipchun_first)) & (seconds <= table.end_utc)
+    kst_ordinals = kst_minutes_to_ordinals(kst)
+    eot_ok = (kst_ordinals >= EOT_FIRST_DATE.toordinal()) & (kst_ordinals <= EOT_LAST_DATE.toordinal())
+    vector = covered & (~solar | eot_ok)
+
+    indices = np.full((n, 4), -1, dtype=np.int16)
+    day_minutes = kst.copy()
+    use_solar = solar & vector
+    if use_solar.any():
+        day_minutes[use_solar] = true_solar_minutes(kst[use_solar], longitude[use_solar])
+    timed = vector & known
+    if timed.any():
+        indices[timed] = chart_indices_at(table, kst[timed], day_minutes[timed])
+    untimed = vector & ~known
+    if untimed.any():
+        year_index, month_index = year_month_indices_at_utc(table, seconds[untimed])
+        indices[untimed, 0] = year_index
+        indices[untimed, 1] = month_index
+        indices[untimed, 2] = day_indices_for_ordinals(ordinals[untimed])
+    return indices, vector
+
+
+def _element_columns(indices: np.ndarray) -> List[Dict[str, Any]]:
+    raw = element_raw_scores(indices)
+    ratio = raw / raw.sum(axis=1, keepdims=True)
+    results = []
+    for row in ratio:
+        # calculate_elements와 같은 연산 순서/반올림(round(value / total * 100, 2))
+        norm = [round(float(v) * 100, 2) for v in row]
+        order = sorted(range(len(ELEMENTS)), key=norm.__getitem__)
+        result: Dict[str, Any] = dict(zip(ELEMENTS, norm))
+        result["deficiency"] = ELEMENTS[order[0]]
+        result["excess"] = ELEMENTS[order[-1]]
+        results.append(result)
+    return results
+
+
+def _pillar_columns(indices: np.ndarray) -> List[Dict[str, str]]:
+    return [
+        {column: _PILLAR_NAMES[i] if i >= 0 else "" for column, i in zip(PILLAR_COLUMNS, row.tolist())}
+        for row in indices
+    ]
+
+
+def _single(row: BirthRow) -> Dict[str, Any]:
+    chart = calculate_chart(
+        row.birth_date,
+        row.birth_time,
+        timezone=row.timezone,
+        historical_offset=row.historical_offset,
+        longitude=row.longitude,
+    )
+    indices = chart_indices(chart).reshape(1, 4)
+    return {**_pillar_columns(indices)[0], **_element_columns(indices)[0]}
+
+
+def score_rows(rows: Sequence[Mapping[str, Optional[str]]]) -> List[Dict[str, Any]]:
+    """CSV 행 청크 -> 행별 결과 열(RESULT_COLUMNS) dict 목록(입력 순서)."""
+
+    results: List[Dict[str, Any]] = [{} for _ in rows]
+    parsed: List[Optional[BirthRow]] = []
+    for i, row in enumerate(rows):
+        try:
+            parsed.append(parse_row(row))
+        except ValueError as exc:
+            parsed.append(None)
+            results[i] = {"error": str(exc)}
+
+    table = solar_term_table_or_none()
+    seoul = [i for i, r in enumerate(parsed) if r is not None and r.timezone == "Asia/Seoul"]
+    vectorized: set = set()
+    if table is not None and seoul:
+        indices, mask = _vector_charts([parsed[i] for i in seoul], table)
+        done = [seoul[j] for j in np.flatnonzero(mask)]
+        for i, pillars, elements in zip(done, _pillar_columns(indices[mask]), _element_columns(indices[mask])):
+            results[i] = {**pillars, **elements}
+        vectorized.update(done)
+
+    for i, row in enumerate(parsed):
+        if row is None or i in vectorized:
+            continue
+        try:
+            results[i] = _single(row)
+        except ValueError as exc:
+            results[i] = {"error": str(exc)}
+    return results
+
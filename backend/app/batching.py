@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+"""마이크로 배칭: 짧은 시간 창 안에 들어온 개별 요청을 엔진 호출 하나로 묶습니다.
+
+- `MicroBatcher.submit(item)`은 항목을 대기열에 넣고, 창(window_ms)이 끝나거나 max_size가 차면
+  모인 항목 전체를 배치 함수(handler) 한 번으로 실행해 각 요청의 future를 채웁니다.
+- 배치 함수는 동기 함수 `handler(items) -> results`(항목 순서 그대로)입니다. 항목별 실패는
+  예외 객체를 결과 자리에 넣어 돌려주면 그 요청에만 예외로 전달됩니다.
+  배치 호출 자체가 실패하면(예: EngineOverloaded) 묶인 요청 모두가 같은 예외를 받습니다.
+- 실행은 `run(handler, items)`(기본: executor.engine.run)으로 하므로 요청마다 드는
+  실행기 왕복(스레드 전환, 프로세스 풀 pickle/IPC)과 대기열 슬롯을 배치 하나가 나눠 씁니다.
+- 지연 상한: 대기 window_ms + 배치 하나의 계산 시간(max_size로 제한). 배치는 여러 개가 동시에 돌 수 있습니다.
+- 설정(환경 변수)
+  - SAJU_BATCH_WINDOW_MS: 모으는 시간(기본 2ms, 0이면 같은 이벤트 루프 틱에 들어온 요청만 묶음)
+  - SAJU_BATCH_MAX_SIZE: 배치 최대 크기(기본 32, 1이면 묶지 않음)
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    window_ms: float = 2.0
+    max_size: int = 32
+
+    @classmethod
+    def from_env(cls) -> "BatchConfig":
+        return cls(
+            window_ms=max(0.0, float(os.environ.get("SAJU_BATCH_WINDOW_MS", "2"))),
+            max_size=max(1, int(os.environ.get("SAJU_BATCH_MAX_SIZE", "32"))),
+        )
+
+
+async def _run_inline(fn: Callable[..., Any], *args: Any) -> Any:
+    return fn(*args)
+
+
+class MicroBatcher(Generic[T, R]):
+    def __init__(
+        self,
+        handler: Callable[[List[T]], List[Any]],
+        config: Optional[BatchConfig] = None,
+        *,
+        run: Optional[Callable[..., Awaitable[Any]]] = None,
+    ) -> None:
+        self.handler = handler
+        self.config = config or BatchConfig()
+        self._run = run or _run_inline
+        self._queue: List[Tuple[T, "asyncio.Future[R]"]] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._running: Set["asyncio.Task"] = set()
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+
+    async def submit(self, item: T) -> R:
+        """item을 다음 배치에 넣고 그 결과를 기다립니다."""
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[R]" = loop.create_future()
+        self._queue.append((item, future))
+        if len(self._queue) >= self.config.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.config.window_ms / 1000.0, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        # 기다리던 요청이 이미 끊긴 항목은 계산하지 않습니다.
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        task = asyncio.ensure_future(self._execute(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, batch: List[Tuple[T, "asyncio.Future[R]"]]) -> None:
+        try:
+            results = await self._run(self.handler, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "largest_batch": self.largest_batch,
+            "mean_batch": round(self.items / self.batches, 2) if self.batches else 0.0,
+        }
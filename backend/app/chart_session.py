@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+"""차트 편집 세션: 출생 시각만 바뀌면 시주/경계 판정만 다시 합니다(WebSocket /ws/chart).
+
+사용자가 출생 시각을 1분씩 바꿔 보는 동안 매번 원국 전체(입춘/절기 조회 포함)를 계산하지 않도록
+세션이 날짜별 문맥을 들고 있습니다.
+
+- 날짜 문맥(`_DayContext`): (역사적 오프셋 적용 후 날짜, 타임존)마다 그 현지 하루 안의 절기 경계(15°) 시각.
+  연주/월주는 이 경계 사이(구간)에서 변하지 않으므로 구간별로 한 번만 계산해 둡니다.
+  - 타임존이 KST가 아니면 하루 안의 KST 자정도 구간 경계로 둡니다(연주 폴백이 KST 날짜를 씀).
+- 시각 변경: 벽시계 -> KST 순간 -> 구간(이분 탐색)으로 연/월주를 찾고, 일주/시주(진태양시 포함)와
+  오행/십신/관계만 다시 계산합니다. 결과는 `calculate_chart`와 같습니다.
+- 날짜/타임존/오프셋/경도가 바뀌면 새 문맥을 만듭니다(세션당 최근 8개 보관).
+- `update`는 직전 상태와 달라진 필드만 돌려줍니다(`SessionUpdate.changes`).
+"""
+
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import CACHE_REQUESTS, STAGE_SECONDS
+from .relations import pillar_relations, ten_gods
+from .saju import (
+    DEFAULT_POLICY,
+    Chart,
+    Pillar,
+    _chart_for_policy,
+    _ChartLookups,
+    _day_pillar_time,
+    _local_wall_to_kst,
+    _normalize_timezone,
+    _parse_birth_time,
+    _stem_branch_from_index,
+    _year_date_for_pillar,
+    _year_index,
+    apply_historical_offset,
+    calculate_elements,
+    calculate_month_pillars_policy_c,
+)
+
+MAX_DAY_CONTEXTS = 8
+# 시간 미상 구간 키
+_UNKNOWN_TIME = -1
+
+
+@dataclass
+class _Segment:
+    year_pillar: Pillar
+    year_stem_index: int
+    month_pillar: Pillar
+
+
+@dataclass
+class _DayContext:
+    birth_date: date
+    timezone: str
+    boundaries: List[datetime]
+    segments: Dict[int, _Segment] = field(default_factory=dict)
+
+
+@dataclass
+class SessionUpdate:
+    seq: int
+    full: bool  # True면 changes가 전체 상태
+    changes: Dict[str, Any]
+    reused_context: bool  # 연/월주를 캐시된 구간에서 가져왔는지
+    elapsed_us: float
+
+
+def _day_boundaries(birth_date: date, timezone: str) -> List[datetime]:
+    """현지 하루 안에서 연/월주가 바뀔 수 있는 KST 순간(절기 경계 + KST 자정), 정렬됨."""
+
+    try:
+        from .solar_terms import find_crossings_for_local_date
+
+        instants = [c.when_kst for c in find_crossings_for_local_date(birth_date, timezone)]
+    except Exception:
+        # 절기 엔진 폴백: 경계가 없으면 하루 전체가 한 구간입니다(calculate_chart도 같은 폴백).
+        instants = []
+    if timezone != "Asia/Seoul":
+        day_start = datetime(birth_date.year, birth_date.month, birth_date.day)
+        start = _local_wall_to_kst(day_start, timezone)
+        end = _local_wall_to_kst(day_start + timedelta(days=1), timezone)
+        midnight = start.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        while midnight < end:
+            instants.append(midnight)
+            midnight += timedelta(days=1)
+    return sorted(instants)
+
+
+def _pillar_state(pillar: Optional[Pillar]) -> Optional[Dict[str, str]]:
+    return None if pillar is None else {"stem": pillar.stem, "branch": pillar.branch}
+
+
+def chart_state(chart: Chart) -> Dict[str, Any]:
+    """세션이 클라이언트에 보내는 상태(필드 단위로 비교해 바뀐 것만 보냅니다)."""
+
+    score = calculate_elements(chart)
+    return {
+        "year": _pillar_state(chart.year),
+        "month": _pillar_state(chart.month),
+        "day": _pillar_state(chart.day),
+        "hour": _pillar_state(chart.hour),
+        "elements_norm": score.elements_norm,
+        "status": score.status,
+        "top_deficiencies": score.top_deficiencies,
+        "top_excesses": score.top_excesses,
+        "ten_gods": {key: None if g is None else g.__dict__ for key, g in ten_gods(chart).items()},
+        "pillar_relations": [
+            {"first": r.first, "second": r.second, "relations": r.relations} for r in pillar_relations(chart)
+        ],
+    }
+
+
+class ChartSession:
+    """연결(사용자) 하나의 편집 세션. 스레드 안전하지 않습니다(연결당 한 번에 한 update)."""
+
+    def __init__(self, max_contexts: int = MAX_DAY_CONTEXTS) -> None:
+        self.max_contexts = max_contexts
+        self._contexts: "OrderedDict[Tuple[date, str], _DayContext]" = OrderedDict()
+        self._chart: Optional[Chart] = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._seq = 0
+
+    def _resolve(
+        self, birth_date: date, birth_time: Optional[str], timezone: str, historical_offset: bool
+    ) -> Tuple[date, Optional[str], str]:
+        timezone, _ = _normalize_timezone(timezone)
+        birth_date, birth_time, _ = apply_historical_offset(birth_date, birth_time, timezone, historical_offset)
+        return birth_date, birth_time, timezone
+
+    def _segment_key(self, context: _DayContext, birth_time: Optional[str]) -> Optional[int]:
+        """구간 인덱스. 시간 미상은 _UNKNOWN_TIME, 경계 시각과 정확히 같으면 None(캐시하지 않음)."""
+
+        hour, minute = _parse_birth_time(birth_time)
+        if hour is None:
+            return _UNKNOWN_TIME
+        d = context.birth_date
+        instant = _local_wall_to_kst(datetime(d.year, d.month, d.day, hour, minute), context.timezone)
+        index = bisect_right(context.boundaries, instant)
+        if index and context.boundaries[index - 1] == instant:
+            return None
+        return index
+
+    def is_warm(
+        self,
+        birth_date: date,
+        birth_time: Optional[str],
+        *,
+        timezone: str = "Asia/Seoul",
+        historical_offset: bool = False,
+    ) -> bool:
+        """절기 조회 없이(캐시된 문맥/구간만으로) update할 수 있는지."""
+
+        birth_date, birth_time, timezone = self._resolve(birth_date, birth_time, timezone, historical_offset)
+        context = self._contexts.get((birth_date, timezone))
+        if context is None:
+            return False
+        return self._segment_key(context, birth_time) in context.segments
+
+    def _context(self, birth_date: date, timezone: str) -> Tuple[_DayContext, bool]:
+        key = (birth_date, timezone)
+        context = self._contexts.get(key)
+        if context is not None:
+            self._contexts.move_to_end(key)
+            return context, True
+        context = _DayContext(birth_date=birth_date, timezone=timezone, boundaries=_day_boundaries(*key))
+        self._contexts[key] = context
+        while len(self._contexts) > self.max_contexts:
+            self._contexts.popitem(last=False)
+        return context, False
+
+    def _segment(self, context: _DayContext, birth_time: Optional[str]) -> Tuple[_Segment, bool]:
+        key = self._segment_key(context, birth_time)
+        segment = context.segments.get(key) if key is not None else None
+        if segment is not None:
+            CACHE_REQUESTS.inc(cache="chart_session", result="hit")
+            return segment, True
+        CACHE_REQUESTS.inc(cache="chart_session", result="miss")
+        year_date = _year_date_for_pillar(context.birth_date, birth_time, timezone=context.timezone)
+        year_index = _year_index(year_date)
+        # 시간 미상이면 정책 C 후보 중 대표값(경계 이후), calculate_chart와 같습니다.
+        month_candidates, _ = calculate_month_pillars_policy_c(
+            context.birth_date, birth_time, year_index % 10, timezone=context.timezone
+        )
+        segment = _Segment(
+            year_pillar=_stem_branch_from_index(year_index),
+            year_stem_index=year_index % 10,
+            month_pillar=month_candidates[-1],
+        )
+        if key is not None:
+            context.segments[key] = segment
+        return segment, False
+
+    def chart(
+        self,
+        birth_date: date,
+        birth_time: Optional[str],
+        *,
+        timezone: str = "Asia/Seoul",
+        historical_offset: bool = False,
+        longitude: Optional[float] = None,
+    ) -> Tuple[Chart, bool]:
+        """(원국, 연/월주를 캐시에서 가져왔는지). 인자는 `calculate_chart`와 같습니다(양력 날짜)."""
+
+        birth_date, birth_time, timezone = self._resolve(birth_date, birth_time, timezone, historical_offset)
+        context, context_hit = self._context(birth_date, timezone)
+        segment, segment_hit = self._segment(context, birth_time)
+
+        hour, minute = _parse_birth_time(birth_time)
+        day_date, day_hour, day_minute = _day_pillar_time(
+            birth_date, hour, minute, timezone=timezone, longitude=longitude
+        )
+        lookups = _ChartLookups(
+            birth_date=birth_date,
+            birth_time=birth_time,
+            timezone=timezone,
+            hour=hour,
+            minute=minute,
+            year_pillar=segment.year_pillar,
+            year_stem_index=segment.year_stem_index,
+            day_date=day_date,
+            day_hour=day_hour,
+            day_minute=day_minute,
+            month_pillars={DEFAULT_POLICY.month_boundary: segment.month_pillar},
+        )
+        return _chart_for_policy(lookups, DEFAULT_POLICY), context_hit and segment_hit
+
+    def update(
+        self,
+        birth_date: date,
+        birth_time: Optional[str],
+        *,
+        timezone: str = "Asia/Seoul",
+        historical_offset: bool = False,
+        longitude: Optional[float] = None,
+    ) -> SessionUpdate:
+        """입력을 반영하고 직전 상태와 달라진 필드만 돌려줍니다(첫 update는 전체)."""
+
+        started = time.perf_counter()
+        previous = self._state
+        with STAGE_SECONDS.time(stage="session_update"):
+            chart, reused = self.chart(
+                birth_date, birth_time, timezone=timezone, historical_offset=historical_offset, longitude=longitude
+            )
+            # 같은 시지 안에서 분만 바뀌면 원국이 그대로라 상태 계산을 건너뜁니다.
+            if previous is not None and chart == self._chart:
+                changes: Dict[str, Any] = {}
+            else:
+                state = chart_state(chart)
+                if previous is None:
+                    changes = state
+                else:
+                    changes = {key: value for key, value in state.items() if previous.get(key) != value}
+                self._chart, self._state = chart, state
+        self._seq += 1
+        return SessionUpdate(
+            seq=self._seq,
+            full=previous is None,
+            changes=changes,
+            reused_context=reused,
+            elapsed_us=round((time.perf_counter() - started) * 1e6, 1),
+        )
+
+    def reset(self) -> None:
+        """다음 update가 전체 상태를 보내게 합니다(문맥 캐시는 유지)."""
+
+        self._chart = None
+        self._state = None
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+"""출생지 벽시계(민간 표준시/서머타임) -> 실제 시각(UTC) 변환.
+
+- 한국의 역대 표준시/서머타임 이력을 전환 시각 배열로 미리 만들어 두고,
+  벽시계 시각은 이분 탐색(bisect / searchsorted)으로 오프셋을 찾습니다.
+- 엔진 내부 계산은 고정 KST(UTC+9)이므로, `to_fixed_kst`가 벽시계를
+  '같은 순간의 UTC+9 벽시계'로 바꿔 기존 계산 경로에 그대로 넘깁니다.
+  예) 1988-09-07 19:02(서머타임, UTC+10) -> 18:02(UTC+9)
+- 서머타임이 끝나 같은 벽시계가 두 번 나오는 구간은 앞쪽(서머타임),
+  시작되어 건너뛴 구간은 전환 이전 오프셋으로 해석합니다(zoneinfo fold=0과 동일).
+- 그 밖의 IANA 타임존은 zoneinfo에서 같은 형태의 전환 배열을 한 번 뽑아 캐시합니다
+  (`civil_time_table_for_zone`). 이후 조회 비용은 한국 표와 같습니다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_KST_OFFSET_SECONDS = 9 * 3600
+_KST = timezone(timedelta(hours=9))
+
+# zoneinfo 전환 배열을 뽑는 구간(절기 테이블 구간을 포함)
+_ZONE_SCAN_START = datetime(1899, 1, 1, tzinfo=timezone.utc)
+_ZONE_SCAN_END = datetime(2055, 1, 1, tzinfo=timezone.utc)
+
+
+def _utc(*args: int) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+_DST = 3600
+
+# (전환 시각 UTC, 새 UTC 오프셋(초), 서머타임 분량(초)). 출처: tz database Asia/Seoul.
+_KOREA_TRANSITIONS: Sequence[Tuple[float, int, int]] = (
+    (_utc(1908, 3, 31, 15, 32, 8), 8 * 3600 + 1800, 0),  # 동경 127.5° 표준시
+    (_utc(1911, 12, 31, 15, 30), 9 * 3600, 0),
+    (_utc(1948, 5, 31, 15, 0), 10 * 3600, _DST),
+    (_utc(1948, 9, 12, 14, 0), 9 * 3600, 0),
+    (_utc(1949, 4, 2, 15, 0), 10 * 3600, _DST),
+    (_utc(1949, 9, 10, 14, 0), 9 * 3600, 0),
+    (_utc(1950, 3, 31, 15, 0), 10 * 3600, _DST),
+    (_utc(1950, 9, 9, 14, 0), 9 * 3600, 0),
+    (_utc(1951, 5, 5, 15, 0), 10 * 3600, _DST),
+    (_utc(1951, 9, 8, 14, 0), 9 * 3600, 0),
+    (_utc(1954, 3, 20, 15, 0), 8 * 3600 + 1800, 0),
+    (_utc(1955, 5, 4, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1955, 9, 8, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1956, 5, 19, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1956, 9, 29, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1957, 5, 4, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1957, 9, 21, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1958, 5, 3, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1958, 9, 20, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1959, 5, 2, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1959, 9, 19, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1960, 4, 30, 15, 30), 9 * 3600 + 1800, _DST),
+    (_utc(1960, 9, 17, 14, 30), 8 * 3600 + 1800, 0),
+    (_utc(1961, 8, 9, 15, 30), 9 * 3600, 0),
+    (_utc(1987, 5, 9, 17, 0), 10 * 3600, _DST),
+    (_utc(1987, 10, 10, 17, 0), 9 * 3600, 0),
+    (_utc(1988, 5, 7, 17, 0), 10 * 3600, _DST),
+    (_utc(1988, 10, 8, 17, 0), 9 * 3600, 0),
+)
+_KOREA_LMT_SECONDS = 8 * 3600 + 27 * 60 + 52  # 1908-04-01 이전 서울 지방평균시
+
+
+@dataclass(frozen=True)
+class CivilTimeTable:
+    """한 지역의 UTC 오프셋 이력.
+
+    - wall_keys: 각 오프셋이 적용되기 시작하는 벽시계 시각(POSIX seconds로 표기, 오름차순)
+      fold=0 해석을 위해 전환 시각 + max(이전, 새 오프셋)으로 둡니다.
+    - offsets: wall_keys[i] 이후 적용되는 오프셋(초). offsets[0]은 첫 전환 이전 값.
+    - dst: offsets와 같은 길이의 서머타임 분량(초, 표준시면 0)
+    """
+
+    name: str
+    wall_keys: np.ndarray
+    offsets: np.ndarray
+    dst: np.ndarray
+
+    @classmethod
+    def from_transitions(
+        cls, name: str, initial_offset: int, transitions: Sequence[Tuple[float, int, int]], initial_dst: int = 0
+    ) -> "CivilTimeTable":
+        keys: List[float] = [-np.inf]
+        offsets: List[int] = [initial_offset]
+        dst: List[int] = [initial_dst]
+        for when_utc, offset, is_dst in transitions:
+            keys.append(when_utc + max(offsets[-1], offset))
+            offsets.append(offset)
+            dst.append(is_dst)
+        return cls(
+            name=name,
+            wall_keys=np.asarray(keys, dtype=np.float64),
+            offsets=np.asarray(offsets, dtype=np.int64),
+            dst=np.asarray(dst, dtype=np.int64),
+        )
+
+    @cached_property
+    def _wall_key_list(self) -> List[float]:
+        # 스칼라 조회는 파이썬 리스트 bisect가 numpy 호출보다 가볍습니다.
+        return self.wall_keys.tolist()
+
+    def offset_at_wall(self, wall: datetime) -> Tuple[int, bool]:
+        """naive 벽시계 -> (UTC 오프셋 초, 서머타임 여부)."""
+
+        offset, dst = self.offset_and_dst_at_wall(wall)
+        return offset, dst != 0
+
+    def offset_and_dst_at_wall(self, wall: datetime) -> Tuple[int, int]:
+        """naive 벽시계 -> (UTC 오프셋 초, 서머타임 분량 초)."""
+
+        i = bisect_right(self._wall_key_list, _naive_to_seconds(wall)) - 1
+        return int(self.offsets[i]), int(self.dst[i])
+
+    def wall_to_utc_seconds(self, wall_seconds: np.ndarray) -> np.ndarray:
+        """벽시계(POSIX seconds 표기) 배열 -> UTC POSIX seconds 배열."""
+
+        wall_seconds = np.asarray(wall_seconds)
+        i = np.searchsorted(self.wall_keys, wall_seconds, side="right") - 1
+        return wall_seconds - self.offsets[i]
+
+
+def _naive_to_seconds(wall: datetime) -> float:
+    return wall.replace(tzinfo=timezone.utc).timestamp()
+
+
+KOREA_CIVIL_TIME = CivilTimeTable.from_transitions("Asia/Seoul", _KOREA_LMT_SECONDS, _KOREA_TRANSITIONS)
+
+
+def _utc_offset_and_dst(zone, when_utc: float) -> Tuple[int, int]:
+    local = datetime.fromtimestamp(when_utc, tz=timezone.utc).astimezone(zone)
+    offset = local.utcoffset() or timedelta(0)
+    dst = local.dst() or timedelta(0)
+    return int(offset.total_seconds()), int(dst.total_seconds())
+
+
+def _compile_zone(name: str) -> CivilTimeTable:
+    from zoneinfo import ZoneInfo
+
+    zone = ZoneInfo(name)
+    start = _ZONE_SCAN_START.timestamp()
+    steps = int((_ZONE_SCAN_END.timestamp() - start) // 86400)
+
+    # 하루 간격으로 오프셋 변화를 찾고, 변화가 있는 하루 안에서 초 단위로 이분 탐색합니다.
+    initial = _utc_offset_and_dst(zone, start)
+    transitions: List[Tuple[float, int, int]] = []
+    prev = initial
+    for step in range(1, steps + 1):
+        t1 = start + step * 86400
+        current = _utc_offset_and_dst(zone, t1)
+        if current == prev:
+            continue
+        lo, hi = t1 - 86400, t1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if _utc_offset_and_dst(zone, mid) == prev:
+                lo = mid
+            else:
+                hi = mid
+        transitions.append((float(hi), current[0], current[1]))
+        prev = current
+    return CivilTimeTable.from_transitions(name, initial[0], transitions, initial_dst=initial[1])
+
+
+def is_known_zone(name: str) -> bool:
+    """IANA 타임존 이름을 로드할 수 있는지."""
+
+    try:
+        from zoneinfo import ZoneInfo
+
+        ZoneInfo(name)
+    except Exception:
+        return False
+    return True
+
+
+@lru_cache(maxsize=64)
+def civil_time_table_for_zone(name: str) -> CivilTimeTable:
+    """IANA 타임존 -> 전환 배열(프로세스 당 타임존별 1회 생성). 알 수 없는 이름은 ValueError."""
+
+    if name == KOREA_CIVIL_TIME.name:
+        return KOREA_CIVIL_TIME
+    if not is_known_zone(name):
+        raise ValueError(f"unknown timezone: {name}")
+    return _compile_zone(name)
+
+
+def local_wall_to_kst(wall: datetime, table: CivilTimeTable) -> datetime:
+    """naive 벽시계 -> 같은 순간의 KST aware datetime."""
+
+    offset, _ = table.offset_and_dst_at_wall(wall)
+    return (wall - timedelta(seconds=offset)).replace(tzinfo=timezone.utc).astimezone(_KST)
+
+
+def to_fixed_kst(
+    birth_date: date,
+    birth_time: Optional[str],
+    *,
+    table: CivilTimeTable = KOREA_CIVIL_TIME,
+) -> Tuple[date, Optional[str], Optional[str]]:
+    """출생지 벽시계 -> 같은 순간의 고정 KST(UTC+9) 날짜/시각.
+
+    반환: (날짜, "HH:MM", 보정 안내 문구 또는 None)
+    시간 미상이면 날짜를 그대로 두고 안내 문구 없이 반환합니다.
+    """
+
+    if not birth_time:
+        return birth_date, birth_time, None
+
+    hour, minute = [int(x) for x in birth_time.split(":")[:2]]
+    wall = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute)
+    offset, is_dst = table.offset_at_wall(wall)
+    if offset == _KST_OFFSET_SECONDS and table is KOREA_CIVIL_TIME:
+        return birth_date, birth_time, None
+
+    # 분 단위 입력이므로 초(LMT 8:27:52 등)는 버림 처리합니다.
+    fixed = wall + timedelta(seconds=_KST_OFFSET_SECONDS - offset)
+    fixed = fixed.replace(second=0)
+    label = "서머타임" if is_dst else "표준시"
+    sign = "+" if offset >= 0 else "-"
+    hh, rem = divmod(abs(offset), 3600)
+    note = (
+        f"출생 당시 {table.name} {label}(UTC{sign}{hh:02d}:{rem // 60:02d}) 기준 {wall:%Y-%m-%d %H:%M}을 "
+        f"KST {fixed:%Y-%m-%d %H:%M}로 보정해 계산했습니다"
+    )
+    return fixed.date(), f"{fixed:%H:%M}", note
+
+
+def wall_minutes_to_kst_minutes(wall_minutes: np.ndarray, *, table: CivilTimeTable = KOREA_CIVIL_TIME) -> np.ndarray:
+    """벽시계 '분' 배열 -> 같은 순간의 고정 KST 벽시계 '분' 배열(vectorized 모듈 표기와 동일)."""
+
+    wall_minutes = np.asarray(wall_minutes, dtype=np.int64)
+    utc_seconds = table.wall_to_utc_seconds(wall_minutes * 60)
+    return np.floor_divide(utc_seconds + _KST_OFFSET_SECONDS, 60).astype(np.int64)
+
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+"""압축 바이너리 응답(MessagePack)과 Accept 협상.
+
+모바일/배치 클라이언트가 `Accept: application/msgpack`을 보내면 JSON 대신 MessagePack으로 응답합니다.
+JSON과 필드 의미는 같지만 반복되는 이름/한자 문자열을 인덱스로 바꿉니다.
+
+- 기둥: 60갑자 인덱스(천간 = i % 10, 지지 = i % 12), 시주 미상은 -1
+- 오행 값: ELEMENTS 순서(wood, fire, earth, metal, water)의 고정 길이 실수 배열
+- 상태/십신/관계: STATUS_LEVELS, TEN_GOD_NAMES 인덱스와 relations 비트
+- 이름 표(천간/지지/오행/지장간/요약 문구 등)는 `tables()`(GET /api/compact/tables)로 한 번만 받습니다.
+
+msgpack은 requirements.txt에 포함됩니다. 패키지 없이 설치한 환경에서는 협상 결과가 항상 JSON입니다.
+형식이 바뀌면 COMPACT_VERSION을 올립니다(모든 본문의 "v").
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack 미설치 환경
+    msgpack = None
+
+import numpy as np
+
+from .daeun import DaeunResult
+from .daily_fortune import DailyInteractions
+from .population_stats import STATUS_LEVELS
+from .relations import RELATION_NAMES, TEN_GOD_NAMES, PillarRelation, TenGods
+from .saju import (
+    BRANCH_MAIN_ELEMENT,
+    BRANCHES,
+    ELEMENTS,
+    HIDDEN_STEMS,
+    ROUTINES_BY_ELEMENT,
+    STEM_ELEMENT,
+    STEMS,
+    AnalysisResult,
+    Chart,
+    OriginalResult,
+    Pillar,
+    summary_for_element,
+)
+from .vectorized import PILLAR_KEYS
+
+COMPACT_VERSION = 1
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# 응답 Content-Type은 MSGPACK_MEDIA_TYPE 하나지만, 요청에서는 널리 쓰이는 별칭도 받습니다.
+_MSGPACK_ALIASES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+_PILLAR_INDEX: Dict[tuple, int] = {(STEMS[i % 10], BRANCHES[i % 12]): i for i in range(60)}
+_ELEMENT_INDEX = {e: i for i, e in enumerate(ELEMENTS)}
+_STATUS_INDEX = {s: i for i, s in enumerate(STATUS_LEVELS)}
+_TEN_GOD_INDEX = {name: i for i, name in enumerate(TEN_GOD_NAMES)}
+_RELATION_BITS = {name: bit for bit, name in RELATION_NAMES.items()}
+_PILLAR_KEY_INDEX = {key: i for i, key in enumerate(PILLAR_KEYS)}
+# 일간 자리의 천간 십신
+_DAY_MASTER = -1
+
+
+def available() -> bool:
+    return msgpack is not None
+
+
+def _accept_entries(accept: str):
+    for part in accept.split(","):
+        media, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        yield media.strip().lower(), q
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Accept 헤더 -> 응답 미디어 타입(JSON_MEDIA_TYPE 또는 MSGPACK_MEDIA_TYPE).
+
+    msgpack을 명시했고(q > 0) 그 q가 application/json 이상일 때만 msgpack입니다.
+    와일드카드(*/*, application/*)나 헤더가 없으면 기본값 JSON. msgpack 미설치면 항상 JSON.
+    """
+
+    if not accept or msgpack is None:
+        return JSON_MEDIA_TYPE
+    q_msgpack = q_json = 0.0
+    for media, q in _accept_entries(accept):
+        if media in _MSGPACK_ALIASES:
+            q_msgpack = max(q_msgpack, q)
+        elif media == JSON_MEDIA_TYPE:
+            q_json = max(q_json, q)
+    return MSGPACK_MEDIA_TYPE if q_msgpack > 0 and q_msgpack >= q_json else JSON_MEDIA_TYPE
+
+
+def packb(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def unpackb(body: bytes) -> Any:
+    return msgpack.unpackb(body, raw=False)
+
+
+def pillar_index(pillar: Optional[Pillar]) -> int:
+    return -1 if pillar is None else _PILLAR_INDEX[(pillar.stem, pillar.branch)]
+
+
+def _chart(chart: Chart) -> List[int]:
+    return [pillar_index(chart.year), pillar_index(chart.month), pillar_index(chart.day), pillar_index(chart.hour)]
+
+
+def _element_array(values: Mapping[str, float]) -> List[float]:
+    return [values[e] for e in ELEMENTS]
+
+
+def _daeun(daeun: DaeunResult) -> Dict[str, Any]:
+    return {
+        "forward": daeun.forward,
+        "start_age": daeun.start_age,
+        "start_age_years": round(daeun.start_age_years, 4),
+        "term_name": daeun.term_name,
+        "term_kst": daeun.term_kst.isoformat(timespec="seconds"),
+        "ages": [p.age for p in daeun.pillars],
+        "start_dates": [p.start_date.isoformat() for p in daeun.pillars],
+        "pillars": [pillar_index(p.pillar) for p in daeun.pillars],
+    }
+
+
+def _ten_gods(gods: Mapping[str, Optional[TenGods]]) -> List[Optional[List[int]]]:
+    result: List[Optional[List[int]]] = []
+    for key in PILLAR_KEYS:
+        pair = gods.get(key)
+        if pair is None:
+            result.append(None)
+            continue
+        stem_god = _DAY_MASTER if pair.stem == "일간" else _TEN_GOD_INDEX[pair.stem]
+        result.append([stem_god, _TEN_GOD_INDEX[pair.branch]])
+    return result
+
+
+def _pillar_relations(relations: Sequence[PillarRelation]) -> List[List[int]]:
+    return [
+        [
+            _PILLAR_KEY_INDEX[r.first],
+            _PILLAR_KEY_INDEX[r.second],
+            sum(_RELATION_BITS[name] for name in r.relations),
+        ]
+        for r in relations
+    ]
+
+
+def encode_analysis(
+    analysis: AnalysisResult,
+    month_pillars: Sequence[Pillar],
+    month_uncertain: bool,
+    daeun: Optional[DaeunResult],
+    gods: Mapping[str, Optional[TenGods]],
+    relations: Sequence[PillarRelation],
+) -> bytes:
+    """엔진 결과 -> 분석 응답 MessagePack 바이트.
+
+    지장간(hidden_stems)은 tables의 지지별 표, 요약/루틴 문구는 top_deficiencies[0] 오행의 표 값입니다.
+    """
+
+    score = analysis.element_score
+    return packb(
+        {
+            "v": COMPACT_VERSION,
+            "chart": _chart(analysis.chart),
+            "month_pillars": [pillar_index(p) for p in month_pillars],
+            "month_uncertain": month_uncertain,
+            "elements_raw": _element_array(score.elements_raw),
+            "elements_norm": _element_array(score.elements_norm),
+            "status": [_STATUS_INDEX[score.status[e]] for e in ELEMENTS],
+            "top_deficiencies": [_ELEMENT_INDEX[e] for e in score.top_deficiencies],
+            "top_excesses": [_ELEMENT_INDEX[e] for e in score.top_excesses],
+            "accuracy_note": analysis.accuracy_note,
+            "daeun": None if daeun is None else _daeun(daeun),
+            "ten_gods": _ten_gods(gods),
+            "pillar_relations": _pillar_relations(relations),
+        }
+    )
+
+
+def encode_original(original: OriginalResult, month_pillars: Sequence[Pillar], month_uncertain: bool) -> bytes:
+    """원국 응답 MessagePack 바이트. 기둥 오행(stem_element/branch_element)은 tables로 찾습니다."""
+
+    return packb(
+        {
+            "v": COMPACT_VERSION,
+            "title": original.title,
+            "name": original.name,
+            "birth_date": original.birth_date,
+            "birth_time": original.birth_time,
+            "pillars": [pillar_index(original.pillars.get(key)) for key in PILLAR_KEYS],
+            "month_pillars": [pillar_index(p) for p in month_pillars],
+            "month_uncertain": month_uncertain,
+            "raw_text": original.raw_text,
+        }
+    )
+
+
+def encode_daily(days: Sequence[date], result: DailyInteractions) -> bytes:
+    """일진 피드/배치 -> 열 단위 MessagePack(행 i = days[i]). 실수는 JSON과 같이 소수 둘째 자리."""
+
+    return packb(
+        {
+            "v": COMPACT_VERSION,
+            "dates": [d.isoformat() for d in days],
+            "day_pillars": result.day_index.tolist(),
+            "ten_gods": result.ten_god.tolist(),
+            "relations": result.relations.tolist(),
+            "element_delta": np.round(result.element_delta, 2).tolist(),
+            "balance_delta": np.round(result.balance_delta, 2).tolist(),
+        }
+    )
+
+
+def encode_matches(indices: np.ndarray, scores: np.ndarray) -> bytes:
+    """궁합 상위 k -> 행(member)별 후보 인덱스/점수 배열. 후보 이름은 요청의 candidates로 찾습니다."""
+
+    return packb(
+        {
+            "v": COMPACT_VERSION,
+            "candidates": indices.tolist(),
+            "scores": np.round(scores.astype(np.float64), 2).tolist(),
+        }
+    )
+
+
+def tables() -> Dict[str, Any]:
+    """압축 응답의 인덱스를 이름/문구로 바꾸는 표(코드 상수라 버전이 같으면 변하지 않습니다)."""
+
+    return {
+        "v": COMPACT_VERSION,
+        "stems": STEMS,
+        "branches": BRANCHES,
+        "elements": ELEMENTS,
+        "stem_elements": [_ELEMENT_INDEX[STEM_ELEMENT[s]] for s in STEMS],
+        "branch_elements": [_ELEMENT_INDEX[BRANCH_MAIN_ELEMENT[b]] for b in BRANCHES],
+        "hidden_stems": [[[STEMS.index(stem), ratio] for stem, ratio in HIDDEN_STEMS[b]] for b in BRANCHES],
+        "status_levels": STATUS_LEVELS,
+        "ten_gods": TEN_GOD_NAMES,
+        "relations": {str(bit): name for bit, name in RELATION_NAMES.items()},
+        "pillar_keys": list(PILLAR_KEYS),
+        "summaries": [summary_for_element(e) for e in ELEMENTS],
+        "routines": [list(ROUTINES_BY_ELEMENT[e]) for e in ELEMENTS],
+    }
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+"""궁합(宮合) 점수: 다수 x 다수 매칭용 벡터화 엔진.
+
+입력은 사람별 4주 60갑자 인덱스 배열 (N, 4)(vectorized 모듈 표기, 시주 미상은 -1)입니다.
+원국 하나는 `relations.chart_indices`로 바꿉니다.
+- 오행 벡터: `calculate_elements`와 같은 가중치(천간/지지 본기/지장간)를 기둥 x 60갑자 표로
+  미리 만들어 두고 인덱싱으로 합산합니다.
+- 오행 보완: 한쪽의 부족분(균등 20% 미만)을 상대가 얼마나 채우는지. 부족분 x 상대 오행
+  내적이므로 행렬곱 두 번으로 계산합니다.
+- 지지 관계: 일지-일지, 연지-연지의 육합(+1)/충(-1)(relations 모듈의 지지 관계 비트).
+  관계 표의 행과 상대 one-hot의 내적입니다.
+- 점수(0~100) = ELEMENT_WEIGHT x 오행 보완 + BRANCH_WEIGHT x 지지 관계(0~1로 정규화)
+  두 항 모두 내적이라 특징 행렬을 이어 붙여 블록마다 행렬곱 한 번으로 계산합니다.
+
+N x M 전체 행렬은 메모리가 커지므로 `top_k_matches`는 행/열 블록 단위로 계산하고
+행마다 상위 k개만 유지합니다(블록 크기는 CHUNK_ELEMENTS로 제한). 첫 열 블록 이후에는
+행별 k번째 점수보다 큰 칸만 후보로 병합하므로 블록 전체를 정렬하지 않습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .saju import (
+    BRANCH_MAIN_ELEMENT,
+    BRANCH_WEIGHTS,
+    BRANCHES,
+    ELEMENTS,
+    HIDDEN_STEMS,
+    STEM_ELEMENT,
+    STEM_WEIGHTS,
+    STEMS,
+)
+from .relations import BRANCH_RELATION_BITS, CLASH, COMBINE
+from .vectorized import PILLAR_KEYS
+
+ELEMENT_WEIGHT = 60.0
+BRANCH_WEIGHT = 40.0
+# 블록 하나의 최대 원소 수(float32 기준 약 64MB)
+CHUNK_ELEMENTS = 1 << 24
+# 첫 열 블록으로 행별 k번째 점수를 잡은 뒤 나머지 블록은 그보다 큰 칸만 봅니다.
+_COLUMN_CHUNK = 4096
+_BALANCED_SHARE = 1.0 / len(ELEMENTS)
+
+# 일지-일지가 연지-연지보다 비중이 큽니다.
+_DAY_BRANCH_WEIGHT = 1.0
+_YEAR_BRANCH_WEIGHT = 0.5
+
+
+def _element_contributions() -> np.ndarray:
+    """(기둥 4, 60갑자, 오행 5) 기여도 표. calculate_elements의 가산 규칙과 같습니다."""
+
+    table = np.zeros((len(PILLAR_KEYS), 60, len(ELEMENTS)), dtype=np.float64)
+    for p, key in enumerate(PILLAR_KEYS):
+        for index in range(60):
+            stem, branch = STEMS[index % 10], BRANCHES[index % 12]
+            table[p, index, ELEMENTS.index(STEM_ELEMENT[stem])] += STEM_WEIGHTS[key]
+            table[p, index, ELEMENTS.index(BRANCH_MAIN_ELEMENT[branch])] += BRANCH_WEIGHTS[key]
+            for hidden, ratio in HIDDEN_STEMS[branch]:
+                table[p, index, ELEMENTS.index(STEM_ELEMENT[hidden])] += BRANCH_WEIGHTS[key] * 0.5 * ratio
+    return table
+
+
+def _branch_scores() -> np.ndarray:
+    # 육합 +1, 충 -1 (relations 모듈의 지지 관계 비트에서)
+    table = np.zeros((12, 12), dtype=np.float32)
+    table[(BRANCH_RELATION_BITS & COMBINE) != 0] = 1.0
+    table[(BRANCH_RELATION_BITS & CLASH) != 0] = -1.0
+    return table
+
+
+ELEMENT_CONTRIBUTIONS = _element_contributions()
+BRANCH_RELATIONS = _branch_scores()
+
+
+@dataclass
+class CompatibilityMatches:
+    scores: np.ndarray  # (N, k) float32, 행마다 내림차순
+    indices: np.ndarray  # (N, k) int64, 후보 배열의 행 번호
+
+
+def element_raw_scores(indices: np.ndarray) -> np.ndarray:
+    """(N, 4) 60갑자 인덱스 -> (N, 5) 오행 점수(calculate_elements의 elements_raw, ELEMENTS 순서)."""
+
+    indices = np.asarray(indices, dtype=np.int64)
+    if indices.ndim != 2 or indices.shape[1] != len(PILLAR_KEYS):
+        raise ValueError("indices must have shape (N, 4)")
+    if indices[:, :3].size and (indices[:, :3].min() < 0 or indices.max() >= 60):
+        raise ValueError("pillar indices must be within 0..59 (hour may be -1)")
+
+    known = indices >= 0
+    scores = np.zeros((indices.shape[0], len(ELEMENTS)), dtype=np.float64)
+    for p in range(len(PILLAR_KEYS)):
+        contribution = ELEMENT_CONTRIBUTIONS[p, np.where(known[:, p], indices[:, p], 0)]
+        scores += np.where(known[:, p, None], contribution, 0.0)
+    return scores
+
+
+def element_vectors(indices: np.ndarray) -> np.ndarray:
+    """(N, 4) 60갑자 인덱스 -> (N, 5) 오행 비율(합 1, ELEMENTS 순서)."""
+
+    scores = element_raw_scores(indices)
+    return scores / scores.sum(axis=1, keepdims=True)
+
+
+def _deficits(vectors: np.ndarray) -> np.ndarray:
+    return np.maximum(_BALANCED_SHARE - vectors, 0.0)
+
+
+def _features(indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """점수를 행렬곱 한 번(left @ right.T)으로 만들기 위한 (left, right) 특징 행렬.
+
+    left  = [부족분, 오행 비율, 일지 관계 행 x 가중치, 연지 관계 행 x 가중치]
+    right = [오행 비율, 부족분, 일지 one-hot, 연지 one-hot]
+    """
+
+    indices = np.asarray(indices)
+    vectors = element_vectors(indices)
+    deficits = _deficits(vectors)
+    day_branch = indices[:, 2].astype(np.int64) % 12
+    year_branch = indices[:, 0].astype(np.int64) % 12
+
+    # 부족분 x 상대 비율 내적은 최대 0.2 -> 양방향 합 최대 0.4
+    element_scale = ELEMENT_WEIGHT / (2 * _BALANCED_SHARE)
+    span = _DAY_BRANCH_WEIGHT + _YEAR_BRANCH_WEIGHT
+    branch_scale = BRANCH_WEIGHT / (2 * span)
+    left = np.hstack(
+        [
+            deficits * element_scale,
+            vectors * element_scale,
+            BRANCH_RELATIONS[day_branch] * (_DAY_BRANCH_WEIGHT * branch_scale),
+            BRANCH_RELATIONS[year_branch] * (_YEAR_BRANCH_WEIGHT * branch_scale),
+        ]
+    ).astype(np.float32)
+    eye = np.eye(12, dtype=np.float64)
+    right = np.hstack([vectors, deficits, eye[day_branch], eye[year_branch]]).astype(np.float32)
+    return left, right
+
+
+# 관계 합이 -span..span이므로 BRANCH_WEIGHT/2를 더해 0~BRANCH_WEIGHT로 옮깁니다.
+_SCORE_OFFSET = np.float32(BRANCH_WEIGHT / 2)
+
+
+def _block_scores(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    block = left @ right.T
+    block += _SCORE_OFFSET
+    return block
+
+
+def compatibility_scores(a_indices: np.ndarray, b_indices: np.ndarray) -> np.ndarray:
+    """(N, 4), (M, 4) 인덱스 -> (N, M) 궁합 점수(0~100, float32). 작은 집단용입니다."""
+
+    left, _ = _features(a_indices)
+    _, right = _features(b_indices)
+    return _block_scores(left, right)
+
+
+def _initial_top_k(block: np.ndarray, offset: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    part = np.argpartition(block, -k, axis=1)[:, -k:] if block.shape[1] > k else np.argsort(block, axis=1)
+    return np.take_along_axis(block, part, axis=1), part + offset
+
+
+def _merge_top_k(
+    best_scores: np.ndarray, best_indices: np.ndarray, block: np.ndarray, offset: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """현재 행별 상위 k와 새 블록을 합칩니다.
+
+    블록 전체를 정렬하지 않고 행별 k번째 점수보다 큰 칸만 골라(대부분 소수) 후보로 씁니다.
+    """
+
+    count, k = best_scores.shape
+    rows, cols = np.nonzero(block > best_scores.min(axis=1)[:, None])
+    if rows.size == 0:
+        return best_scores, best_indices
+
+    cand_rows = np.concatenate([np.repeat(np.arange(count), k), rows])
+    cand_scores = np.concatenate([best_scores.ravel(), block[rows, cols]])
+    cand_indices = np.concatenate([best_indices.ravel(), cols + offset])
+    order = np.lexsort((-cand_scores, cand_rows))
+    sorted_rows = cand_rows[order]
+    rank = np.arange(order.size) - np.searchsorted(sorted_rows, sorted_rows)
+    keep = order[rank < k]
+    return cand_scores[keep].reshape(count, k), cand_indices[keep].reshape(count, k)
+
+
+def top_k_matches(
+    a_indices: np.ndarray,
+    b_indices: np.ndarray,
+    k: int = 10,
+    *,
+    exclude_same_index: bool = False,
+    chunk_elements: Optional[int] = None,
+) -> CompatibilityMatches:
+    """행(a)마다 궁합 점수 상위 k명(b의 행 번호)을 블록 단위로 구합니다.
+
+    exclude_same_index=True면 같은 집단끼리 매칭할 때 자기 자신(i == j)을 뺍니다.
+    메모리는 블록 크기(chunk_elements, 기본 CHUNK_ELEMENTS)와 N x k에 비례합니다.
+    """
+
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    left, _ = _features(a_indices)
+    _, right = _features(b_indices)
+    n, m = left.shape[0], right.shape[0]
+    k = min(k, m - 1 if exclude_same_index else m)
+    if k < 1:
+        raise ValueError("not enough candidates")
+
+    chunk_elements = chunk_elements or CHUNK_ELEMENTS
+    col_chunk = max(k, min(m, _COLUMN_CHUNK, chunk_elements))
+    row_chunk = max(1, chunk_elements // col_chunk)
+
+    out_scores = np.empty((n, k), dtype=np.float32)
+    out_indices = np.empty((n, k), dtype=np.int64)
+    for r0 in range(0, n, row_chunk):
+        rows = slice(r0, min(n, r0 + row_chunk))
+        best_scores = best_indices = None
+        for c0 in range(0, m, col_chunk):
+            cols = slice(c0, min(m, c0 + col_chunk))
+            block = _block_scores(left[rows], right[cols])
+            if exclude_same_index:
+                r = np.arange(rows.start, rows.stop)
+                hit = (r >= cols.start) & (r < cols.stop)
+                block[np.nonzero(hit)[0], r[hit] - cols.start] = -np.inf
+            if best_scores is None:
+                best_scores, best_indices = _initial_top_k(block, c0, k)
+            else:
+                best_scores, best_indices = _merge_top_k(best_scores, best_indices, block, c0)
+
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        out_scores[rows] = np.take_along_axis(best_scores, order, axis=1)
+        out_indices[rows] = np.take_along_axis(best_indices, order, axis=1)
+    return CompatibilityMatches(scores=out_scores, indices=out_indices)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+"""대운(大運) 계산.
+
+- 방향: 연간 음양 x 성별. 양년생 남자/음년생 여자는 순행(다음 절까지),
+  음년생 남자/양년생 여자는 역행(직전 절까지)입니다.
+- 대운수: 출생 순간과 절(節, 월이 바뀌는 15°x홀수 경계) 사이 일수 / 3 (3일 = 1년).
+- 대운 간지: 월주에서 순행이면 다음 간지, 역행이면 이전 간지로 10개.
+- 절 시각은 사전 계산 절기 테이블에서 searchsorted로 찾습니다(O(log n)).
+  배치(`daeun_indices_many`)는 같은 조회를 배열 단위로 수행합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .saju import (
+    BRANCHES,
+    STEMS,
+    Pillar,
+    _local_wall_to_kst,
+    _normalize_timezone,
+    apply_historical_offset,
+    calculate_chart,
+    resolve_birth_date,
+)
+from .solar_term_table import SolarTermTable, solar_term_table_or_none
+from .solar_terms import KST, TERM_NAME_BY_LONGITUDE
+from .vectorized import SEXAGENARY_BY_STEM_BRANCH, chart_indices_at
+
+DAEUN_COUNT = 10
+DAYS_PER_DAEUN_YEAR = 3.0
+_SECONDS_PER_DAY = 86400.0
+_DAYS_PER_YEAR = 365.2422
+
+
+@dataclass
+class DaeunPillar:
+    age: int
+    start_date: date
+    pillar: Pillar
+
+
+@dataclass
+class DaeunResult:
+    forward: bool
+    start_age: int
+    start_age_years: float
+    term_name: str
+    term_kst: datetime
+    pillars: List[DaeunPillar]
+
+
+def _jeol_arrays(table: SolarTermTable) -> Tuple[np.ndarray, np.ndarray]:
+    # 절(월 경계): 15° 격자 중 30°로 나눈 나머지가 15°인 경계(입춘 315°, 경칩 345°, 청명 15°, ...)
+    mask = (table.longitude_deg % 30.0) == 15.0
+    return table.when_utc[mask], table.longitude_deg[mask]
+
+
+def _term_distances(
+    table: SolarTermTable, seconds_utc: np.ndarray, forward: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(출생 순간과 절 사이 일수, 절 인덱스) 배열. 순행은 다음 절, 역행은 직전 절(<=)."""
+
+    jeol_when, _ = _jeol_arrays(table)
+    nxt = np.searchsorted(jeol_when, seconds_utc, side="right")
+    index = np.where(forward, nxt, nxt - 1)
+    if index.size and (index.min() < 0 or index.max() >= jeol_when.shape[0]):
+        raise ValueError("birth instant is outside the solar term table range")
+    days = np.abs(jeol_when[index] - seconds_utc) / _SECONDS_PER_DAY
+    return days, index
+
+
+def _start_ages(days: np.ndarray) -> np.ndarray:
+    # 대운수는 1~10으로 표기합니다(경계 직전/직후 출생도 1).
+    return np.clip(np.rint(days / DAYS_PER_DAEUN_YEAR), 1, DAEUN_COUNT).astype(np.int64)
+
+
+def daeun_indices_many(
+    table: SolarTermTable, kst_minutes: np.ndarray, is_male: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """배치 대운 계산.
+
+    입력: KST 출생 시각(분, vectorized 모듈 표기) 배열, 남성 여부 배열
+    반환: (순행 여부 (N,), 대운수 실수 년 (N,), 대운 60갑자 인덱스 (N, 10))
+    """
+
+    kst_minutes = np.asarray(kst_minutes, dtype=np.int64)
+    charts = chart_indices_at(table, kst_minutes)
+    year_stem = charts[:, 0] % 10
+    forward = (year_stem % 2 == 0) == np.asarray(is_male, dtype=bool)
+
+    seconds = (kst_minutes - 9 * 60) * 60.0
+    days, _ = _term_distances(table, seconds, forward)
+
+    steps = np.arange(1, DAEUN_COUNT + 1, dtype=np.int64)
+    direction = np.where(forward, 1, -1)[:, None]
+    pillars = ((charts[:, 1].astype(np.int64)[:, None] + direction * steps[None, :]) % 60).astype(np.int16)
+    return forward, days / DAYS_PER_DAEUN_YEAR, pillars
+
+
+def calculate_daeun(
+    birth_date: date,
+    birth_time: Optional[str],
+    gender: str,
+    *,
+    calendar_type: str = "SOLAR",
+    is_leap_month: bool = False,
+    timezone: str = "Asia/Seoul",
+    historical_offset: bool = False,
+    table: Optional[SolarTermTable] = None,
+) -> DaeunResult:
+    """대운수와 10개 대운 간지를 계산합니다.
+
+    gender는 "M"/"F". 시간 미상이면 월주 대표값과 같게 그 날짜의 끝(23:59:59)을 출생 순간으로 봅니다.
+    절기 테이블을 쓸 수 없으면 RuntimeError, 테이블 범위 밖이면 ValueError.
+    """
+
+    if gender not in {"M", "F"}:
+        raise ValueError("gender must be M or F")
+    table = table or solar_term_table_or_none()
+    if table is None:
+        raise RuntimeError("solar term table is unavailable")
+
+    birth_date = resolve_birth_date(birth_date, calendar_type, is_leap_month)
+    timezone, _ = _normalize_timezone(timezone)
+    birth_date, birth_time, _ = apply_historical_offset(birth_date, birth_time, timezone, historical_offset)
+    chart = calculate_chart(birth_date, birth_time, timezone=timezone)
+
+    if birth_time:
+        hh, mm = [int(x) for x in birth_time.split(":")[:2]]
+        wall = datetime(birth_date.year, birth_date.month, birth_date.day, hh, mm)
+    else:
+        wall = datetime(birth_date.year, birth_date.month, birth_date.day, 23, 59, 59)
+    born = _local_wall_to_kst(wall, timezone)
+
+    forward = (STEMS.index(chart.year.stem) % 2 == 0) == (gender == "M")
+    days, index = _term_distances(table, np.array([born.timestamp()]), np.array([forward]))
+    jeol_when, jeol_lon = _jeol_arrays(table)
+    start_age_years = float(days[0] / DAYS_PER_DAEUN_YEAR)
+    start_age = int(_start_ages(days)[0])
+
+    month_index = int(SEXAGENARY_BY_STEM_BRANCH[STEMS.index(chart.month.stem), BRANCHES.index(chart.month.branch)])
+    step = 1 if forward else -1
+    pillars = []
+    for i in range(DAEUN_COUNT):
+        sexagenary = (month_index + step * (i + 1)) % 60
+        offset_years = start_age_years + 10 * i
+        pillars.append(
+            DaeunPillar(
+                age=start_age + 10 * i,
+                start_date=(born + timedelta(days=offset_years * _DAYS_PER_YEAR)).date(),
+                pillar=Pillar(stem=STEMS[sexagenary % 10], branch=BRANCHES[sexagenary % 12]),
+            )
+        )
+
+    term_deg = float(jeol_lon[int(index[0])])
+    return DaeunResult(
+        forward=forward,
+        start_age=start_age,
+        start_age_years=start_age_years,
+        term_name=TERM_NAME_BY_LONGITUDE.get(term_deg, f"TERM_{term_deg:.0f}"),
+        term_kst=datetime.fromtimestamp(float(jeol_when[int(index[0])]), tz=KST),
+        pillars=pillars,
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""일진(日辰) 피드: 날짜별 일주와 원국의 상호작용.
+
+- 일주는 날짜 산술(`day_indices_for_ordinals`)로 바로 구하므로 절기 테이블이 필요 없습니다.
+- 원국은 (4,) 60갑자 인덱스(`relations.chart_indices`), 오행은 `compatibility.element_raw_scores`를
+  그대로 쓰고, 일진 하나의 오행 기여는 기둥 가중치 1.0(연주와 같은 단위)으로 더합니다.
+- 한 사람 x N일(`daily_feed`)과 N명 x 하루(`daily_interactions` 배치) 모두 같은 배열 연산입니다.
+
+항목별 값
+- ten_god: 일진 천간이 일간에 대해 갖는 십신
+- relations: 일진과 원국 각 기둥의 관계 비트(relations 모듈, 연/월/일/시 순서)
+- element_delta: 일진을 더했을 때 오행 비율 변화(%p)
+- balance_delta: 균등 분포와의 거리(L1, %p)가 줄어든 양. 양수면 그날 오행이 고르게 보완됩니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+from .compatibility import ELEMENT_CONTRIBUTIONS, element_raw_scores
+from .relations import PILLAR_RELATION_BITS, TEN_GOD_BY_STEM, TEN_GOD_NAMES, relation_names
+from .saju import BRANCHES, ELEMENTS, STEMS, Pillar
+from .vectorized import PILLAR_KEYS, day_indices_for_ordinals
+
+MAX_FEED_DAYS = 366
+# 일진 기여도는 연주 가중치(천간 1.0, 지지 1.0)와 같은 단위입니다.
+_DAY_FORTUNE_CONTRIBUTIONS = ELEMENT_CONTRIBUTIONS[PILLAR_KEYS.index("year")]
+_BALANCED_SHARE = 1.0 / len(ELEMENTS)
+
+
+@dataclass
+class DailyInteractions:
+    day_index: np.ndarray  # (K,) 일진 60갑자 인덱스
+    ten_god: np.ndarray  # (K,) TEN_GOD_NAMES 인덱스
+    relations: np.ndarray  # (K, 4) 관계 비트, 시주 미상은 0
+    element_delta: np.ndarray  # (K, 5) %p
+    balance_delta: np.ndarray  # (K,) %p
+
+
+@dataclass
+class DailyFortune:
+    day: date
+    pillar: Pillar
+    ten_god: str
+    relations: Dict[str, List[str]]
+    element_delta: Dict[str, float]
+    balance_delta: float
+
+
+def daily_interactions(natal_indices: np.ndarray, day_indices: np.ndarray) -> DailyInteractions:
+    """(K, 4) 원국 인덱스와 (K,) 일진 인덱스(스칼라면 모두 같은 날) -> 항목별 배열."""
+
+    natal = np.asarray(natal_indices, dtype=np.int64)
+    days = np.broadcast_to(np.asarray(day_indices, dtype=np.int64), (natal.shape[0],))
+
+    raw = element_raw_scores(natal)
+    before = raw / raw.sum(axis=1, keepdims=True)
+    after_raw = raw + _DAY_FORTUNE_CONTRIBUTIONS[days]
+    after = after_raw / after_raw.sum(axis=1, keepdims=True)
+
+    known = natal >= 0
+    relations = PILLAR_RELATION_BITS[np.where(known, natal, 0), days[:, None]]
+    balance = np.abs(before - _BALANCED_SHARE).sum(axis=1) - np.abs(after - _BALANCED_SHARE).sum(axis=1)
+    return DailyInteractions(
+        day_index=days.astype(np.int16),
+        ten_god=TEN_GOD_BY_STEM[natal[:, 2] % 10, days % 10],
+        relations=np.where(known, relations, 0).astype(np.uint8),
+        element_delta=(after - before) * 100.0,
+        balance_delta=balance * 100.0,
+    )
+
+
+def _fortune(result: DailyInteractions, i: int, day: date) -> DailyFortune:
+    index = int(result.day_index[i])
+    return DailyFortune(
+        day=day,
+        pillar=Pillar(stem=STEMS[index % 10], branch=BRANCHES[index % 12]),
+        ten_god=TEN_GOD_NAMES[result.ten_god[i]],
+        relations={
+            key: relation_names(int(result.relations[i, p]))
+            for p, key in enumerate(PILLAR_KEYS)
+            if result.relations[i, p]
+        },
+        element_delta={e: round(float(v), 2) for e, v in zip(ELEMENTS, result.element_delta[i])},
+        balance_delta=round(float(result.balance_delta[i]), 2),
+    )
+
+
+def daily_feed_interactions(natal_indices: np.ndarray, start: date, days: int) -> DailyInteractions:
+    """한 사람((4,) 원국 인덱스)의 start부터 days일 항목별 배열(행 i = start + i일)."""
+
+    if not 1 <= days <= MAX_FEED_DAYS:
+        raise ValueError(f"days must be within 1..{MAX_FEED_DAYS}")
+    ordinals = np.arange(start.toordinal(), start.toordinal() + days)
+    natal = np.broadcast_to(np.asarray(natal_indices).reshape(1, len(PILLAR_KEYS)), (days, len(PILLAR_KEYS)))
+    return daily_interactions(natal, day_indices_for_ordinals(ordinals))
+
+
+def daily_feed(natal_indices: np.ndarray, start: date, days: int) -> List[DailyFortune]:
+    """한 사람((4,) 원국 인덱스)의 start부터 days일 일진 피드."""
+
+    result = daily_feed_interactions(natal_indices, start, days)
+    return [_fortune(result, i, start + timedelta(days=i)) for i in range(days)]
+
+
+def daily_interactions_for_date(natal_indices: np.ndarray, target: date) -> DailyInteractions:
+    """N명 x 하루(예: 내일 푸시 야간 배치). 일진은 모두 같으므로 인덱스 하나를 브로드캐스트합니다."""
+
+    day_index = day_indices_for_ordinals(np.array([target.toordinal()]))[0]
+    return daily_interactions(natal_indices, day_index)
+
+
+def daily_feed_for_users(natal_indices: np.ndarray, target: date) -> List[DailyFortune]:
+    """(N, 4) 원국 인덱스 -> 사람별 target 날짜 일진 항목."""
+
+    result = daily_interactions_for_date(natal_indices, target)
+    return [_fortune(result, i, target) for i in range(result.day_index.shape[0])]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+"""엔진 호출 실행기: CPU를 많이 쓰는 계산을 이벤트 루프 밖으로 보냅니다.
+
+- 엔드포인트는 `async def`라 동기 엔진 호출(analyze, build_original_result 등)을 그대로 부르면
+  그동안 같은 워커의 다른 요청(/health 포함)이 모두 멈춥니다.
+- `EngineExecutor.run`은 호출을 프로세스 풀(workers > 0) 또는 스레드(workers = 0)에서 실행합니다.
+  - `start()`는 천체력/절기 테이블/균시차 표를 미리 올려 둡니다(pre-warm). 프로세스 풀 워커도 시작할 때 같은 일을 합니다.
+  - 대기+실행 중인 호출 수가 max_pending을 넘으면 기다리지 않고 EngineOverloaded를 던집니다.
+- 설정은 환경 변수로 받습니다.
+  - SAJU_ENGINE_WORKERS: 프로세스 수(기본 0 = 풀 없이 스레드에서 실행)
+  - SAJU_ENGINE_MAX_PENDING: 동시에 받아 둘 최대 호출 수(기본 workers x 8, 최소 8)
+
+풀로 보내는 함수와 인자는 pickle 가능해야 합니다(모듈 최상위 함수, dataclass/pydantic 값).
+워커에서 쌓인 계측 값(metrics)은 결과와 함께 돌려받아 부모 프로세스의 `/metrics`에 합칩니다.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from . import metrics
+
+T = TypeVar("T")
+
+_PENDING_PER_WORKER = 8
+
+
+class EngineOverloaded(RuntimeError):
+    """대기열이 가득 차 호출을 받지 않았습니다."""
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    workers: int = 0
+    max_pending: int = _PENDING_PER_WORKER
+
+    @classmethod
+    def from_env(cls) -> "EngineConfig":
+        workers = max(0, int(os.environ.get("SAJU_ENGINE_WORKERS", "0")))
+        default_pending = max(_PENDING_PER_WORKER, workers * _PENDING_PER_WORKER)
+        max_pending = max(1, int(os.environ.get("SAJU_ENGINE_MAX_PENDING", str(default_pending))))
+        return cls(workers=workers, max_pending=max_pending)
+
+
+def warm_engine() -> None:
+    """천체력/절기 테이블/균시차 표를 미리 만듭니다. 실패해도(폴백 환경) 무시합니다."""
+
+    try:
+        from .solar_term_table import solar_term_table_or_none
+        from .solar_time import equation_of_time_table
+
+        solar_term_table_or_none()
+        equation_of_time_table()
+    except Exception:  # pragma: no cover - 엔진 폴백 경로에서 처리
+        pass
+
+
+def _init_worker() -> None:
+    # fork로 물려받은 부모의 계측 값은 버립니다(부모가 이미 갖고 있음).
+    metrics.drain()
+    warm_engine()
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _call_with_metrics(fn: Callable[..., T], *args: Any, **kwargs: Any):
+    """풀 워커에서 fn을 실행하고 (결과, 지난 호출 이후 쌓인 계측 값)을 돌려줍니다.
+
+    fn이 예외를 던지면 그동안의 값은 워커에 남아 다음 호출 결과와 함께 전달됩니다.
+    """
+
+    result = fn(*args, **kwargs)
+    return result, metrics.drain()
+
+
+class EngineExecutor:
+    def __init__(self, config: Optional[EngineConfig] = None) -> None:
+        self.config = config or EngineConfig()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def uses_processes(self) -> bool:
+        return self._pool is not None
+
+    def start(self) -> None:
+        """테이블을 pre-warm하고, 풀을 만들어 모든 워커가 pre-warm을 마칠 때까지 기다립니다.
+
+        workers = 0이면 이 프로세스의 pre-warm만 합니다(첫 요청이 테이블을 만드느라 느려지지 않도록).
+        """
+
+        if self._pool is not None:
+            return
+        # fork 환경에서는 부모가 먼저 테이블을 만들어 두면 워커가 그대로 물려받습니다.
+        warm_engine()
+        if self.config.workers <= 0:
+            return
+        self._pool = ProcessPoolExecutor(max_workers=self.config.workers, initializer=_init_worker)
+        for future in [self._pool.submit(_ready) for _ in range(self.config.workers)]:
+            future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn(*args, **kwargs)를 이벤트 루프 밖에서 실행해 결과를 돌려줍니다.
+
+        대기열이 가득 차면 EngineOverloaded. fn이 던진 예외는 그대로 전달합니다.
+        """
+
+        if self._pending >= self.config.max_pending:
+            raise EngineOverloaded(f"engine queue is full ({self.config.max_pending} pending)")
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            pool = self._pool
+            try:
+                if pool is None:
+                    return await loop.run_in_executor(None, partial(fn, *args, **kwargs))
+                result, snapshot = await loop.run_in_executor(pool, partial(_call_with_metrics, fn, *args, **kwargs))
+                metrics.merge(snapshot)
+                return result
+            except BrokenProcessPool as exc:
+                # 워커가 죽으면 풀을 새로 만들고 이번 호출은 실패로 돌려줍니다.
+                # 새 워커 pre-warm은 오래 걸리므로 이벤트 루프 밖(스레드)에서 기다립니다.
+                # 같은 풀에서 실패한 다른 호출이 이미 다시 만들었으면 건너뜁니다.
+                if self._pool is pool:
+                    self.shutdown(wait=False)
+                    await loop.run_in_executor(None, self.start)
+                raise RuntimeError("engine worker crashed") from exc
+        finally:
+            self._pending -= 1
+
+
+engine = EngineExecutor(EngineConfig.from_env())
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+"""세운(歲運)/월운(月運) 타임라인 생성기.
+
+- 세운은 입춘, 월운은 절(월이 바뀌는 15°x홀수 경계) 실제 시각에서 바뀝니다.
+  경계는 사전 계산 절기 테이블에서 인덱스로 순회하므로 100년(월운 1,200개)도
+  한 항목씩 만들어 내보내며 메모리는 일정합니다.
+- 각 항목에는 원국(`calculate_chart` 결과)과의 간단한 상호작용을 붙입니다.
+  - stem_relation: 운의 천간 오행이 일간 오행에 대해 갖는 관계
+  - clashes / combines: 운의 지지와 충(沖)/육합(六合)인 원국 기둥 키
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from .saju import (
+    BRANCHES,
+    STEM_ELEMENT,
+    STEMS,
+    Chart,
+    Pillar,
+    _month_branch_index_from_solar_term_month,
+    _month_index_from_jeolgi_longitude,
+    _month_stem_index,
+)
+from .relations import BRANCH_RELATION_BITS, CLASH, COMBINE
+from .solar_term_table import SolarTermTable, solar_term_table_or_none
+from .solar_terms import KST
+
+# 오행 상생 순서(목 -> 화 -> 토 -> 금 -> 수 -> 목)
+_ELEMENT_CYCLE = ["wood", "fire", "earth", "metal", "water"]
+
+
+@dataclass
+class FortuneEntry:
+    kind: str  # "year"(세운) 또는 "month"(월운)
+    start_kst: datetime
+    end_kst: datetime
+    pillar: Pillar
+    stem_relation: str
+    clashes: List[str] = field(default_factory=list)
+    combines: List[str] = field(default_factory=list)
+
+
+def element_relation(day_element: str, other_element: str) -> str:
+    """일간 오행 기준 상대 오행의 관계: same / generates / generated_by / controls / controlled_by."""
+
+    diff = (_ELEMENT_CYCLE.index(other_element) - _ELEMENT_CYCLE.index(day_element)) % 5
+    return ["same", "generates", "controls", "controlled_by", "generated_by"][diff]
+
+
+def _natal_branches(chart: Chart) -> List[tuple]:
+    pillars = [("year", chart.year), ("month", chart.month), ("day", chart.day)]
+    if chart.hour:
+        pillars.append(("hour", chart.hour))
+    return [(key, BRANCHES.index(p.branch)) for key, p in pillars]
+
+
+def _entry(kind: str, start: float, end: float, stem: int, branch: int, chart: Chart) -> FortuneEntry:
+    natal = _natal_branches(chart)
+    return FortuneEntry(
+        kind=kind,
+        start_kst=datetime.fromtimestamp(start, tz=KST),
+        end_kst=datetime.fromtimestamp(end, tz=KST),
+        pillar=Pillar(stem=STEMS[stem], branch=BRANCHES[branch]),
+        stem_relation=element_relation(STEM_ELEMENT[chart.day.stem], STEM_ELEMENT[STEMS[stem]]),
+        clashes=[key for key, b in natal if BRANCH_RELATION_BITS[b, branch] & CLASH],
+        combines=[key for key, b in natal if BRANCH_RELATION_BITS[b, branch] & COMBINE],
+    )
+
+
+def timeline_end_limit(table: SolarTermTable) -> datetime:
+    """타임라인을 만들 수 있는 마지막 시각(마지막 입춘; 이후 세운은 끝 경계가 테이블 밖)."""
+
+    _, ipchun_when = table.ipchun_arrays
+    return datetime.fromtimestamp(float(ipchun_when[-1]), tz=KST)
+
+
+def iter_fortune_timeline(
+    chart: Chart,
+    start: datetime,
+    end: datetime,
+    *,
+    include_months: bool = True,
+    table: Optional[SolarTermTable] = None,
+) -> Iterator[FortuneEntry]:
+    """[start, end) 구간에 걸치는 세운/월운을 시간순으로 생성합니다.
+
+    start 시점에 이미 진행 중인 세운/월운부터 시작하며, 세운 항목은 그 해 첫 월운 앞에 옵니다.
+    start/end는 aware datetime. 테이블 범위 밖이면 ValueError, 테이블을 쓸 수 없으면 RuntimeError.
+    """
+
+    table = table or solar_term_table_or_none()
+    if table is None:
+        raise RuntimeError("solar term table is unavailable")
+    if end <= start:
+        raise ValueError("end must be after start")
+
+    mask = (table.longitude_deg % 30.0) == 15.0
+    jeol_when = table.when_utc[mask]
+    jeol_lon = table.longitude_deg[mask]
+    ipchun_years, ipchun_when = table.ipchun_arrays
+
+    first = int(np.searchsorted(jeol_when, start.timestamp(), side="right")) - 1
+    last_needed = int(np.searchsorted(jeol_when, end.timestamp(), side="left"))
+    y = int(np.searchsorted(ipchun_when, start.timestamp(), side="right")) - 1
+    if first < 0 or y < 0 or last_needed >= jeol_when.shape[0] or y + 1 >= ipchun_when.shape[0]:
+        raise ValueError("timeline range is outside the solar term table")
+
+    def year_entry(k: int) -> FortuneEntry:
+        index = int((ipchun_years[k] - 1984) % 60)
+        return _entry("year", float(ipchun_when[k]), float(ipchun_when[k + 1]), index % 10, index % 12, chart)
+
+    yield year_entry(y)
+    year_stem = int((ipchun_years[y] - 1984) % 10)
+
+    for i in range(first, last_needed):
+        when = float(jeol_when[i])
+        if jeol_lon[i] == 315.0 and i != first:
+            y += 1
+            if y + 1 >= ipchun_when.shape[0]:
+                raise ValueError("timeline range is outside the solar term table")
+            yield year_entry(y)
+            year_stem = int((ipchun_years[y] - 1984) % 10)
+        if include_months:
+            month_index = _month_index_from_jeolgi_longitude(float(jeol_lon[i]))
+            yield _entry(
+                "month",
+                when,
+                float(jeol_when[i + 1]),
+                _month_stem_index(year_stem, month_index),
+                _month_branch_index_from_solar_term_month(month_index),
+                chart,
+            )
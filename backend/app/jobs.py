@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+"""대량 CSV 작업(업로드 -> 백그라운드 계산 -> 결과 파일 다운로드).
+
+- 업로드한 CSV(열 이름은 ChartInput과 같음, birth_date 필수)를 작업 디렉터리에 그대로 스트리밍 저장하고
+  작업 id를 돌려줍니다. 본문 전체를 메모리에 올리지 않습니다.
+- 작업은 백그라운드 워커(프로세스 풀, workers = 0이면 스레드)에서 `run_job`으로 실행됩니다.
+  - 입력을 chunk_rows 행씩 읽어 `batch_scoring.score_rows`로 계산하고 곧바로 결과 파일에 씁니다.
+    메모리는 청크 크기만큼만 씁니다.
+  - 청크마다 진행 상태(status.json)를 원자적으로(os.replace) 갱신하고 취소 요청(cancel 파일)을 확인합니다.
+- 결과: 입력 열 + RESULT_COLUMNS. CSV 또는 Parquet(pyarrow가 설치된 경우만, 선택 의존성).
+- 상태: queued -> running -> done | failed | cancelled
+- 설정(환경 변수)
+  - SAJU_JOB_DIR: 작업 디렉터리(기본 임시 디렉터리/saju-jobs)
+  - SAJU_JOB_WORKERS: 프로세스 수(기본 1, 0이면 스레드)
+  - SAJU_JOB_CHUNK_ROWS: 청크 행 수(기본 5000)
+  - SAJU_JOB_MAX_BYTES: 업로드 최대 크기(기본 256 MiB)
+  - SAJU_JOB_MAX_ACTIVE: 동시에 대기/실행 중인 작업 수(기본 4, 넘으면 JobsFull -> 503)
+"""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pyarrow = None
+
+from .batch_scoring import REQUIRED_COLUMNS, RESULT_COLUMNS, score_rows
+from .executor import warm_engine
+from .saju import ELEMENTS
+
+RESULT_FORMATS = ("csv", "parquet")
+TERMINAL_STATES = frozenset({"done", "failed", "cancelled"})
+
+_INPUT_NAME = "input.csv"
+_STATUS_NAME = "status.json"
+_CANCEL_NAME = "cancel"
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class JobsFull(RuntimeError):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"too many active jobs, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class InputTooLarge(ValueError):
+    """업로드가 max_bytes를 넘었습니다."""
+
+
+@dataclass(frozen=True)
+class JobConfig:
+    directory: str
+    workers: int = 1
+    chunk_rows: int = 5000
+    max_bytes: int = _DEFAULT_MAX_BYTES
+    max_active: int = 4
+
+    @classmethod
+    def from_env(cls) -> "JobConfig":
+        return cls(
+            directory=os.environ.get("SAJU_JOB_DIR") or os.path.join(tempfile.gettempdir(), "saju-jobs"),
+            workers=max(0, int(os.environ.get("SAJU_JOB_WORKERS", "1"))),
+            chunk_rows=max(1, int(os.environ.get("SAJU_JOB_CHUNK_ROWS", "5000"))),
+            max_bytes=max(1, int(os.environ.get("SAJU_JOB_MAX_BYTES", str(_DEFAULT_MAX_BYTES)))),
+            max_active=max(1, int(os.environ.get("SAJU_JOB_MAX_ACTIVE", "4"))),
+        )
+
+
+@dataclass
+class JobStatus:
+    id: str
+    state: str
+    format: str
+    rows: int = 0
+    error_rows: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+    created_at: float = 0.0
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def progress(self) -> float:
+        if self.state == "done":
+            return 1.0
+        return round(self.bytes_read / self.total_bytes, 4) if self.total_bytes else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "progress": self.progress}
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def result_name(fmt: str) -> str:
+    return f"result.{fmt}"
+
+
+def _write_status(directory: str, status: JobStatus) -> None:
+    path = os.path.join(directory, _STATUS_NAME)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(asdict(status), f)
+    os.replace(path + ".tmp", path)
+
+
+def read_status(directory: str) -> JobStatus:
+    with open(os.path.join(directory, _STATUS_NAME), encoding="utf-8") as f:
+        return JobStatus(**json.load(f))
+
+
+class _CsvSink:
+    def __init__(self, path: str, columns: List[str]) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetSink:
+    """청크마다 row group 하나를 씁니다. 입력 열/기둥/오행 이름은 문자열, 오행 값은 float64."""
+
+    def __init__(self, path: str, columns: List[str]) -> None:
+        fields = [(c, pyarrow.float64() if c in ELEMENTS else pyarrow.string()) for c in columns]
+        self._schema = pyarrow.schema(fields)
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        # 오류 행의 오행 값("")은 null
+        columns = {
+            name: [None if name in ELEMENTS and row.get(name) == "" else row.get(name) for row in rows]
+            for name in self._schema.names
+        }
+        self._writer.write_table(pyarrow.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _score_chunk(rows: List[Dict[str, Any]]) -> int:
+    """rows에 결과 열을 채우고 오류 행 수를 돌려줍니다."""
+
+    errors = 0
+    for row, result in zip(rows, score_rows(rows)):
+        row.update({column: result.get(column, "") for column in RESULT_COLUMNS})
+        errors += bool(result.get("error"))
+    return errors
+
+
+def run_job(directory: str, fmt: str, chunk_rows: int) -> JobStatus:
+    """작업 하나를 끝까지 실행합니다(워커 프로세스/스레드에서 호출, 모듈 최상위 함수라 pickle 가능)."""
+
+    status = read_status(directory)
+    if os.path.exists(os.path.join(directory, _CANCEL_NAME)):
+        status.state, status.finished_at = "cancelled", time.time()
+        _write_status(directory, status)
+        return status
+    status.state = "running"
+    _write_status(directory, status)
+    partial_path = os.path.join(directory, result_name(fmt) + ".part")
+    try:
+        with open(os.path.join(directory, _INPUT_NAME), "rb") as raw:
+            # raw.tell()은 버퍼 단위라 진행률은 근사값입니다.
+            reader = csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig", newline=""))
+            header = list(reader.fieldnames or [])
+            missing = [c for c in REQUIRED_COLUMNS if c not in header]
+            if missing:
+                raise ValueError(f"missing columns: {', '.join(missing)}")
+            columns = header + [c for c in RESULT_COLUMNS if c not in header]
+            sink = _ParquetSink(partial_path, columns) if fmt == "parquet" else _CsvSink(partial_path, columns)
+            try:
+                chunk: List[Dict[str, Any]] = []
+                for row in reader:
+                    chunk.append(row)
+                    if len(chunk) < chunk_rows:
+                        continue
+                    status.error_rows += _score_chunk(chunk)
+                    sink.write(chunk)
+                    status.rows += len(chunk)
+                    status.bytes_read = raw.tell()
+                    chunk = []
+                    if os.path.exists(os.path.join(directory, _CANCEL_NAME)):
+                        status.state = "cancelled"
+                        break
+                    _write_status(directory, status)
+                if chunk and status.state == "running":
+                    status.error_rows += _score_chunk(chunk)
+                    sink.write(chunk)
+                    status.rows += len(chunk)
+            finally:
+                sink.close()
+        if status.state == "running":
+            os.replace(partial_path, os.path.join(directory, result_name(fmt)))
+            status.state = "done"
+            status.bytes_read = status.total_bytes
+    except Exception as exc:
+        status.state = "failed"
+        status.error = f"{type(exc).__name__}: {exc}"
+    if status.state != "done" and os.path.exists(partial_path):
+        os.remove(partial_path)
+    status.finished_at = time.time()
+    _write_status(directory, status)
+    return status
+
+
+def _init_worker() -> None:
+    warm_engine()
+
+
+class JobManager:
+    """작업 디렉터리/워커 풀 관리. 이벤트 루프 스레드에서만 호출합니다."""
+
+    def __init__(self, config: JobConfig) -> None:
+        self.config = config
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._active: Set[str] = set()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def start(self) -> None:
+        os.makedirs(self.config.directory, exist_ok=True)
+        if self.config.workers > 0 and self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.config.workers, initializer=_init_worker)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @property
+    def active(self) -> int:
+        return len(self._active)
+
+    def _directory(self, job_id: str) -> str:
+        """작업 디렉터리. 형식이 틀리거나 없는 id는 KeyError."""
+
+        path = os.path.join(self.config.directory, job_id)
+        if not _JOB_ID.match(job_id) or not os.path.isdir(path):
+            raise KeyError(job_id)
+        return path
+
+    async def submit(self, chunks: AsyncIterator[bytes], fmt: str) -> JobStatus:
+        """업로드 본문을 저장하고 작업을 예약합니다.
+
+        형식을 지원하지 않으면 ValueError, 자리가 없으면 JobsFull, max_bytes를 넘으면 InputTooLarge.
+        """
+
+        if fmt not in RESULT_FORMATS or (fmt == "parquet" and not parquet_available()):
+            raise ValueError(f"unsupported result format: {fmt}")
+        if self.active >= self.config.max_active:
+            raise JobsFull(retry_after=5)
+        self.start()
+        job_id = uuid.uuid4().hex
+        directory = os.path.join(self.config.directory, job_id)
+        os.makedirs(directory)
+        self._active.add(job_id)
+        try:
+            total = 0
+            with open(os.path.join(directory, _INPUT_NAME), "wb") as f:
+                async for chunk in chunks:
+                    total += len(chunk)
+                    if total > self.config.max_bytes:
+                        raise InputTooLarge(f"upload exceeds {self.config.max_bytes} bytes")
+                    f.write(chunk)
+            status = JobStatus(id=job_id, state="queued", format=fmt, total_bytes=total, created_at=time.time())
+            _write_status(directory, status)
+        except BaseException:
+            self._active.discard(job_id)
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        task = asyncio.get_running_loop().create_task(self._run(job_id, directory, fmt))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return status
+
+    async def _run(self, job_id: str, directory: str, fmt: str) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._pool, partial(run_job, directory, fmt, self.config.chunk_rows))
+        except Exception as exc:  # 워커가 죽은 경우 등: run_job이 상태를 쓰지 못했습니다.
+            if os.path.isdir(directory):
+                status = read_status(directory)
+                if status.state not in TERMINAL_STATES:
+                    status.state, status.finished_at = "failed", time.time()
+                    status.error = f"{type(exc).__name__}: {exc}"
+                    _write_status(directory, status)
+        finally:
+            self._active.discard(job_id)
+
+    def status(self, job_id: str) -> JobStatus:
+        return read_status(self._directory(job_id))
+
+    def result_path(self, job_id: str) -> Optional[str]:
+        """완료된 작업의 결과 파일 경로(아직 끝나지 않았으면 None). 없는 id는 KeyError."""
+
+        directory = self._directory(job_id)
+        status = read_status(directory)
+        return os.path.join(directory, result_name(status.format)) if status.state == "done" else None
+
+    def cancel(self, job_id: str) -> None:
+        """실행 중이면 다음 청크 경계에서 멈추게 하고, 끝난 작업은 파일을 지웁니다."""
+
+        directory = self._directory(job_id)
+        if job_id in self._active:
+            open(os.path.join(directory, _CANCEL_NAME), "w").close()
+        else:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    async def events(self, job_id: str, interval: float = 0.5) -> AsyncIterator[JobStatus]:
+        """상태가 바뀔 때마다 JobStatus를 내보내고 끝난 상태(done/failed/cancelled)에서 멈춥니다."""
+
+        directory = self._directory(job_id)
+        last: Optional[JobStatus] = None
+        while True:
+            status = read_status(directory)
+            if status != last:
+                yield status
+                last = status
+            if status.state in TERMINAL_STATES:
+                return
+            await asyncio.sleep(interval)
+
+
+jobs = JobManager(JobConfig.from_env())
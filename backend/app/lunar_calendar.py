@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+"""음력(한국 태음태양력) <-> 양력 변환.
+
+- 데이터: `lunar_table_data.LUNAR_YEAR_INFO`(1900~2052 음력년, 연도당 정수 1개).
+  de421 기반 합삭/중기 계산으로 `scripts/build_lunar_table.py`가 오프라인 생성합니다.
+- 임포트 시점에 (연도 x 13칸) 월 시작일 ordinal 배열로 풀어 두므로,
+  변환은 배열 인덱싱 O(1)이고 배치 변환도 NumPy 벡터 연산으로 처리합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .lunar_table_data import LUNAR_TABLE_FIRST_YEAR, LUNAR_TABLE_LAST_YEAR, LUNAR_YEAR_INFO
+
+_MONTH_SLOTS = 13
+
+
+def _unpack() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    years = len(LUNAR_YEAR_INFO)
+    starts = np.full((years, _MONTH_SLOTS + 1), -1, dtype=np.int64)
+    leap = np.zeros(years, dtype=np.int64)
+    for row, info in enumerate(LUNAR_YEAR_INFO):
+        year = LUNAR_TABLE_FIRST_YEAR + row
+        leap[row] = (info >> 13) & 0xF
+        slots = 13 if leap[row] else 12
+        ordinal = date(year, 1, 1).toordinal() + (info >> 17)
+        for slot in range(slots):
+            starts[row, slot] = ordinal
+            ordinal += 30 if (info >> slot) & 1 else 29
+        starts[row, slots] = ordinal  # 다음 해 설날(월 길이 계산용)
+    return starts, leap, starts[:, 0].copy()
+
+
+# MONTH_START_ORDINALS[y, slot]: 음력 y년 slot번째 달(윤달 포함 달력 순서) 1일의 양력 ordinal
+MONTH_START_ORDINALS, LEAP_MONTH_BY_YEAR, NEW_YEAR_ORDINALS = _unpack()
+
+
+@dataclass(frozen=True)
+class LunarDate:
+    year: int
+    month: int
+    day: int
+    is_leap_month: bool = False
+
+
+def _year_end_ordinal(row: int) -> int:
+    return int(MONTH_START_ORDINALS[row, 13 if LEAP_MONTH_BY_YEAR[row] else 12])
+
+
+def _slot(row: int, month: int, is_leap_month: bool) -> int:
+    leap_month = int(LEAP_MONTH_BY_YEAR[row])
+    if is_leap_month and month != leap_month:
+        raise ValueError(f"lunar year {LUNAR_TABLE_FIRST_YEAR + row} has no leap month {month}")
+    if leap_month and (month > leap_month or is_leap_month):
+        return month
+    return month - 1
+
+
+def lunar_to_solar(year: int, month: int, day: int, is_leap_month: bool = False) -> date:
+    """음력 날짜 -> 양력 날짜. 범위 밖/존재하지 않는 날짜는 ValueError."""
+
+    if not LUNAR_TABLE_FIRST_YEAR <= year <= LUNAR_TABLE_LAST_YEAR:
+        raise ValueError(f"lunar year must be within {LUNAR_TABLE_FIRST_YEAR}..{LUNAR_TABLE_LAST_YEAR}")
+    if not 1 <= month <= 12:
+        raise ValueError("lunar month must be 1..12")
+
+    row = year - LUNAR_TABLE_FIRST_YEAR
+    slot = _slot(row, month, is_leap_month)
+    start = int(MONTH_START_ORDINALS[row, slot])
+    length = int(MONTH_START_ORDINALS[row, slot + 1]) - start
+    if not 1 <= day <= length:
+        raise ValueError(f"lunar {year}-{month:02d} has {length} days")
+    return date.fromordinal(start + day - 1)
+
+
+def solar_to_lunar(target: date) -> LunarDate:
+    """양력 날짜 -> 음력 날짜(표 범위 밖이면 ValueError)."""
+
+    ordinal = target.toordinal()
+    row = int(np.searchsorted(NEW_YEAR_ORDINALS, ordinal, side="right")) - 1
+    if row < 0 or ordinal >= _year_end_ordinal(len(LUNAR_YEAR_INFO) - 1):
+        raise ValueError("date is outside the lunar table range")
+
+    slots = 13 if LEAP_MONTH_BY_YEAR[row] else 12
+    slot = int(np.searchsorted(MONTH_START_ORDINALS[row, :slots], ordinal, side="right")) - 1
+    leap_month = int(LEAP_MONTH_BY_YEAR[row])
+    if leap_month and slot >= leap_month:
+        month, is_leap = slot, slot == leap_month
+    else:
+        month, is_leap = slot + 1, False
+    return LunarDate(
+        year=LUNAR_TABLE_FIRST_YEAR + row,
+        month=month,
+        day=ordinal - int(MONTH_START_ORDINALS[row, slot]) + 1,
+        is_leap_month=is_leap,
+    )
+
+
+def lunar_to_solar_many(
+    years: np.ndarray, months: np.ndarray, days: np.ndarray, is_leap_month: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """음력 (연, 월, 일, 윤달) 배열 -> 양력 ordinal 배열. 존재하지 않는 날짜는 -1."""
+
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    leap_flags = np.zeros(years.shape, dtype=bool) if is_leap_month is None else np.asarray(is_leap_month, dtype=bool)
+
+    rows = years - LUNAR_TABLE_FIRST_YEAR
+    valid = (rows >= 0) & (rows < len(LUNAR_YEAR_INFO)) & (months >= 1) & (months <= 12)
+    rows = np.where(valid, rows, 0)
+    leap_month = LEAP_MONTH_BY_YEAR[rows]
+
+    valid &= ~leap_flags | (months == leap_month)
+    slots = np.where((leap_month > 0) & ((months > leap_month) | leap_flags), months, months - 1)
+    slots = np.where(valid, slots, 0)
+
+    start = MONTH_START_ORDINALS[rows, slots]
+    length = MONTH_START_ORDINALS[rows, slots + 1] - start
+    valid &= (days >= 1) & (days <= length)
+    return np.where(valid, start + days - 1, -1)
@@ -0,0 +1,39 @@
+"""Korean lunisolar month table (generated by scripts/build_lunar_table.py; do not edit).
+
+Per lunar year from LUNAR_TABLE_FIRST_YEAR:
+- bits 17..: lunar new year (month 1, day 1) as days after January 1 of the same solar year
+- bits 13..16: leap month number (0 = none); the leap month follows its regular month
+- bits 0..12: month lengths in calendar order including the leap month (1 = 30 days, 0 = 29)
+"""
+
+LUNAR_TABLE_FIRST_YEAR = 1900
+LUNAR_TABLE_LAST_YEAR = 2052
+
+LUNAR_YEAR_INFO = (
+    0x3d16d2, 0x620752, 0x4c0ea5, 0x38b64a, 0x5c064b, 0x440a9b,
+    0x309556, 0x56056a, 0x400b59, 0x2a5752, 0x500752, 0x3adb25,
+    0x600b25, 0x480a4b, 0x32b29b, 0x580aad, 0x44056a, 0x2c4b69,
+    0x520ba9, 0x3efb52, 0x640d92, 0x4c0d25, 0x36ba4d, 0x5c0956,
+    0x4602b5, 0x2e95ad, 0x5606d4, 0x400da9, 0x2c5d92, 0x500e92,
+    0x3acd26, 0x5e0527, 0x480a57, 0x32b2b6, 0x580ada, 0x4406d4,
+    0x2e6ea9, 0x520749, 0x3cf693, 0x620a93, 0x4c052b, 0x34ca5b,
+    0x5a096d, 0x460b6a, 0x329b54, 0x560ba4, 0x400b49, 0x2a5a93,
+    0x500a95, 0x38f52b, 0x5e052d, 0x480aad, 0x34b56a, 0x580db2,
+    0x440da4, 0x2e7d49, 0x540d4a, 0x3d1a95, 0x620a96, 0x4c0556,
+    0x36cab5, 0x5a0ad5, 0x4606d2, 0x308ea5, 0x560ea5, 0x400e4a,
+    0x2a6c96, 0x4e0a9b, 0x3af556, 0x5e056a, 0x480b59, 0x34b752,
+    0x5a0752, 0x420725, 0x2c964b, 0x520a4b, 0x3d12ab, 0x6002ad,
+    0x4a056b, 0x36cb69, 0x5c0da9, 0x460d92, 0x309b25, 0x560d25,
+    0x415a4d, 0x640a56, 0x4e02b6, 0x38d5ad, 0x6006d4, 0x480da9,
+    0x34bd92, 0x5a0e92, 0x440d26, 0x2c6a56, 0x500a57, 0x3d12b6,
+    0x620b5a, 0x4c06d4, 0x36aec9, 0x5c0749, 0x460693, 0x2e9527,
+    0x54052b, 0x3e0a5b, 0x2a555a, 0x4e036a, 0x38fb55, 0x600ba4,
+    0x4a0b49, 0x32ba93, 0x580a95, 0x42052d, 0x2c6a5d, 0x500aad,
+    0x3d35aa, 0x6205d2, 0x4c0da5, 0x36bd4a, 0x5c0d4a, 0x460a95,
+    0x30952d, 0x540556, 0x3e0ab5, 0x2a55aa, 0x5006d2, 0x38cea5,
+    0x5e0ea5, 0x4a0e4a, 0x34ac96, 0x560c9b, 0x42055a, 0x2c6ad5,
+    0x520b69, 0x3d7752, 0x620752, 0x4c0b25, 0x36d64b, 0x5a0a4b,
+    0x4404ab, 0x2ea55b, 0x54056d, 0x3e0b69, 0x2a5b52, 0x500d92,
+    0x3afd25, 0x5e0d25, 0x480a4d, 0x32b4ad, 0x5802b6, 0x4005b5,
+    0x2c6da9, 0x520ea9, 0x3f1d92,
+)
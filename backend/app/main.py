@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+import asyncio
+import csv
+import io
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import date, datetime, timedelta
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 
 """FastAPI app.
 
@@ -16,15 +27,193 @@ environment-specific PYTHONPATH tweaks.
 """
 
 try:
-    from app.saju import analyze, build_original_result, calculate_month_pillars_policy_c, _year_index
-    from app.solar_terms import find_junggi_crossings_for_kst_date
-    from app.schemas import AnalysisResponse, Chart, ChartInput, OriginalInput, OriginalResponse, Pillar
+    from app.saju import (
+        CalendarDay,
+        analyze,
+        apply_historical_offset,
+        build_original_result,
+        calculate_chart,
+        calculate_month_pillars_policy_c,
+        evaluate_chart_policies,
+        iter_calendar_days,
+        resolve_birth_date,
+        _local_wall_to_kst,
+        _normalize_calendar_type,
+        _normalize_timezone,
+        _year_date_for_pillar,
+        _year_index,
+    )
+    from app.daeun import DaeunResult, calculate_daeun
+    from app.admission import AdmissionGate, AdmissionRejected, admission
+    from app.batching import BatchConfig, MicroBatcher
+    from app.chart_session import ChartSession
+    from app import compact
+    from app.compatibility import top_k_matches
+    from app.daily_fortune import (
+        daily_feed,
+        daily_feed_for_users,
+        daily_feed_interactions,
+        daily_interactions_for_date,
+    )
+    from app.executor import EngineOverloaded, engine
+    from app.fortune import FortuneEntry, iter_fortune_timeline, timeline_end_limit
+    from app.jobs import TERMINAL_STATES, InputTooLarge, JobsFull, jobs
+    from app import metrics
+    from app.population_stats import population_statistics, stats_config
+    from app.profiling import (
+        PROFILE_HEADER,
+        PROFILE_MEDIA_TYPE,
+        check_profile_token,
+        profile_requested,
+        profile_store,
+        profiled_call,
+        server_timing,
+        timing_requested,
+        traced_call,
+    )
+    from app.response_cache import (
+        API_VERSION,
+        CACHE_CONTROL,
+        canonical_query,
+        engine_version,
+        etag_for,
+        etag_matches,
+        response_cache,
+    )
+    from app.relations import chart_indices, pillar_relations, ten_gods
+    from app.solar_time import check_true_solar_date, resolve_longitude
+    from app.pillar_search import PillarPattern, search_pillar_pattern
+    from app.serialization import encode_analysis
+    from app.single_flight import chart_flights
+    from app.solar_term_table import solar_term_table_or_none
+    from app.solar_terms import KST, find_junggi_crossings_for_kst_date
+    from app.schemas import (
+        AnalysisResponse,
+        Chart,
+        ChartInput,
+        CompatibilityInput,
+        CompatibilityMatch,
+        CompatibilityResponse,
+        CompatibilityRow,
+        DailyBatchInput,
+        DailyFeedInput,
+        DailyFeedResponse,
+        DailyFortune,
+        ElementDistribution,
+        FortuneTimelineInput,
+        OriginalInput,
+        OriginalResponse,
+        Pillar,
+        PillarInterval,
+        PillarSearchInput,
+        PillarSearchResponse,
+        PolicyEvaluationInput,
+        PolicyEvaluationResponse,
+        PopulationStatsInput,
+        PopulationStatsResponse,
+    )
 except ModuleNotFoundError:  # pragma: no cover
-    from backend.app.saju import analyze, build_original_result, calculate_month_pillars_policy_c, _year_index
-    from backend.app.solar_terms import find_junggi_crossings_for_kst_date
-    from backend.app.schemas import AnalysisResponse, Chart, ChartInput, OriginalInput, OriginalResponse, Pillar
+    from backend.app.saju import (
+        CalendarDay,
+        analyze,
+        apply_historical_offset,
+        build_original_result,
+        calculate_chart,
+        calculate_month_pillars_policy_c,
+        evaluate_chart_policies,
+        iter_calendar_days,
+        resolve_birth_date,
+        _local_wall_to_kst,
+        _normalize_calendar_type,
+        _normalize_timezone,
+        _year_date_for_pillar,
+        _year_index,
+    )
+    from backend.app.daeun import DaeunResult, calculate_daeun
+    from backend.app.admission import AdmissionGate, AdmissionRejected, admission
+    from backend.app.batching import BatchConfig, MicroBatcher
+    from backend.app.chart_session import ChartSession
+    from backend.app import compact
+    from backend.app.compatibility import top_k_matches
+    from backend.app.daily_fortune import (
+        daily_feed,
+        daily_feed_for_users,
+        daily_feed_interactions,
+        daily_interactions_for_date,
+    )
+    from backend.app.executor import EngineOverloaded, engine
+    from backend.app.fortune import FortuneEntry, iter_fortune_timeline, timeline_end_limit
+    from backend.app.jobs import TERMINAL_STATES, InputTooLarge, JobsFull, jobs
+    from backend.app import metrics
+    from backend.app.population_stats import population_statistics, stats_config
+    from backend.app.profiling import (
+        PROFILE_HEADER,
+        PROFILE_MEDIA_TYPE,
+        check_profile_token,
+        profile_requested,
+        profile_store,
+        profiled_call,
+        server_timing,
+        timing_requested,
+        traced_call,
+    )
+    from backend.app.response_cache import (
+        API_VERSION,
+        CACHE_CONTROL,
+        canonical_query,
+        engine_version,
+        etag_for,
+        etag_matches,
+        response_cache,
+    )
+    from backend.app.relations import chart_indices, pillar_relations, ten_gods
+    from backend.app.solar_time import check_true_solar_date, resolve_longitude
+    from backend.app.pillar_search import PillarPattern, search_pillar_pattern
+    from backend.app.serialization import encode_analysis
+    from backend.app.single_flight import chart_flights
+    from backend.app.solar_term_table import solar_term_table_or_none
+    from backend.app.solar_terms import KST, find_junggi_crossings_for_kst_date
+    from backend.app.schemas import (
+        AnalysisResponse,
+        Chart,
+        ChartInput,
+        CompatibilityInput,
+        CompatibilityMatch,
+        CompatibilityResponse,
+        CompatibilityRow,
+        DailyBatchInput,
+        DailyFeedInput,
+        DailyFeedResponse,
+        DailyFortune,
+        ElementDistribution,
+        FortuneTimelineInput,
+        OriginalInput,
+        OriginalResponse,
+        Pillar,
+        PillarInterval,
+        PillarSearchInput,
+        PillarSearchResponse,
+        PolicyEvaluationInput,
+        PolicyEvaluationResponse,
+        PopulationStatsInput,
+        PopulationStatsResponse,
+    )
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # 테이블 pre-warm(SAJU_ENGINE_WORKERS > 0이면 풀 워커까지)을 마친 뒤 요청을 받습니다.
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, engine.start)
+    await loop.run_in_executor(None, engine_version)
+    try:
+        yield
+    finally:
+        engine.shutdown()
+        jobs.shutdown()
+
 
-app = FastAPI(title="Saju Energy API", version="0.1.0")
+app = FastAPI(title="Saju Energy API", version=API_VERSION, lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,89 +238,533 @@ async def health() -> dict:
         solar_terms_ready = False
         solar_terms_warning = f"solar_terms_unavailable: {type(exc).__name__}: {exc}"
 
-    payload = {"status": "ok", "solar_terms_ready": solar_terms_ready}
+    payload = {
+        "status": "ok",
+        "solar_terms_ready": solar_terms_ready,
+        "single_flight": chart_flights.stats(),
+        "batching": analysis_batcher.stats(),
+    }
     if solar_terms_warning:
         payload["warning"] = solar_terms_warning
     return payload
 
 
-@app.post("/api/analysis", response_model=AnalysisResponse)
-async def create_analysis(payload: ChartInput) -> AnalysisResponse:
-    if payload.gender not in {"M", "F"}:
-        raise HTTPException(status_code=400, detail="gender must be M or F")
+def _service_metrics():
+    """/metrics 수집기: 렌더링 시점의 실행기/캐시/배칭 상태."""
+
+    yield "saju_engine_pending", "gauge", "Engine calls queued or running.", [({}, engine.pending)]
+    yield "saju_response_cache_entries", "gauge", "Entries in the response cache.", [({}, len(response_cache))]
+    yield "saju_response_cache_bytes", "gauge", "Response cache body bytes.", [({}, response_cache.size_bytes)]
+    yield "saju_inflight_computations", "gauge", "Chart computations in flight.", [({}, chart_flights.inflight)]
+    batching = analysis_batcher.stats()
+    yield "saju_batches_total", "counter", "Micro-batches dispatched to the engine.", [({}, batching["batches"])]
+    yield "saju_batched_items_total", "counter", "Requests dispatched through micro-batches.", [({}, batching["items"])]
+
+
+metrics.register_collector(_service_metrics)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+def _negotiate(request: Request, response: Response) -> str:
+    """Accept 협상(기본 JSON). 본문 표현이 Accept에 따라 달라지므로 JSON 응답에도 Vary를 붙입니다."""
+
+    response.headers["Vary"] = "Accept"
+    return compact.negotiate(request.headers.get("accept"))
+
+
+def _msgpack_response(body: bytes) -> Response:
+    return Response(content=body, media_type=compact.MSGPACK_MEDIA_TYPE, headers={"Vary": "Accept"})
+
+
+@app.get("/api/compact/tables")
+async def compact_tables(request: Request, response: Response) -> dict:
+    """msgpack 응답의 인덱스(60갑자, 오행, 십신 등)를 이름/문구로 바꾸는 표."""
+
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if _negotiate(request, response) == compact.MSGPACK_MEDIA_TYPE:
+        return Response(
+            content=compact.packb(compact.tables()),
+            media_type=compact.MSGPACK_MEDIA_TYPE,
+            headers={"Vary": "Accept", "Cache-Control": CACHE_CONTROL},
+        )
+    return compact.tables()
+
+
+def _chart_payload(chart) -> Chart:
+    return Chart(
+        year_pillar=Pillar(stem=chart.year.stem, branch=chart.year.branch),
+        month_pillar=Pillar(stem=chart.month.stem, branch=chart.month.branch),
+        day_pillar=Pillar(stem=chart.day.stem, branch=chart.day.branch),
+        hour_pillar=Pillar(stem=chart.hour.stem, branch=chart.hour.branch) if chart.hour else None,
+    )
+
+
+def _birth_date_parts(payload: Union[ChartInput, OriginalInput]) -> Tuple[int, int, int]:
+    """birth_date 문자열 -> (년, 월, 일). 달력 종류(양력/음력)는 보지 않습니다."""
 
     try:
-        birth_date = datetime.strptime(payload.birth_date, "%Y-%m-%d").date()
+        year, month, day = (int(part) for part in payload.birth_date.split("-"))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail="birth_date must be YYYY-MM-DD") from exc
+    return year, month, day
+
+
+def _parse_birth_date(payload: Union[ChartInput, OriginalInput]) -> date:
+    """birth_date 문자열 -> 양력 날짜(`resolve_birth_date`).
+
+    음력 2월 30일처럼 양력 달력에 없는 날짜도 있으므로 date 파싱 전에 정수로 나눠 넘깁니다.
+    """
+
+    try:
+        return resolve_birth_date(_birth_date_parts(payload), payload.calendar_type, payload.is_leap_month)
+    except ValueError as exc:
+        if _normalize_calendar_type(payload.calendar_type) == "LUNAR":
+            raise HTTPException(status_code=400, detail=f"invalid lunar birth_date: {exc}") from exc
+        raise HTTPException(status_code=400, detail="birth_date must be YYYY-MM-DD") from exc
+
+
+def _check_birth_time(payload: Union[ChartInput, OriginalInput]) -> None:
+    """birth_time(HH:MM, 없으면 시간 미상) 형식 확인. 엔진까지 가서 500이 나지 않도록 400으로 막습니다."""
+
+    if not payload.birth_time:
+        return
+    try:
+        hour, minute = (int(part) for part in payload.birth_time.split(":"))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="birth_time must be HH:MM") from exc
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise HTTPException(status_code=400, detail="birth_time must be HH:MM")
+
+
+def _birth_longitude(payload: Union[ChartInput, OriginalInput], birth_date: date) -> Optional[float]:
+    """경도/도시 -> 경도. 진태양시 보정을 쓰면 birth_date(양력)가 균시차 표 범위 안인지도 확인합니다."""
+
+    try:
+        longitude = resolve_longitude(payload.longitude, payload.city)
+        if longitude is not None:
+            check_true_solar_date(birth_date)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return longitude
+
+
+def _natal_input(payload: ChartInput) -> tuple:
+    """입력을 검증(400)하고 원국 계산 인자 (양력 날짜, 시각, 타임존, 역사적 오프셋, 경도)를 만듭니다."""
+
+    if payload.gender not in {"M", "F"}:
+        raise HTTPException(status_code=400, detail="gender must be M or F")
+    birth_date = _parse_birth_date(payload)
+    _check_birth_time(payload)
+    timezone, _ = _normalize_timezone(payload.timezone)
+    longitude = _birth_longitude(payload, birth_date)
+    return birth_date, payload.birth_time, timezone, payload.use_historical_offset, longitude
+
+
+def _natal_from_input(natal_input: tuple):
+    birth_date, birth_time, timezone, historical_offset, longitude = natal_input
+    return calculate_chart(
+        birth_date, birth_time, timezone=timezone, historical_offset=historical_offset, longitude=longitude
+    )
+
+
+def _natal_chart(payload: ChartInput):
+    """입력 옵션(음력/타임존/역사적 오프셋/경도)을 모두 반영한 원국."""
+
+    return _natal_from_input(_natal_input(payload))
+
+
+def _natal_indices(natal_inputs: List[tuple]) -> np.ndarray:
+    """`_natal_input` 목록 -> (N, 4) 원국 인덱스. 여러 명분이라 엔진 실행기에서 부릅니다."""
+
+    return np.stack([chart_indices(_natal_from_input(natal_input)) for natal_input in natal_inputs])
+
+
+def _compatibility_top_k(members: List[tuple], candidates: List[tuple], top_k: int):
+    return top_k_matches(_natal_indices(members), _natal_indices(candidates), top_k)
+
+
+def _daily_batch(users: List[tuple], target: date, media: str):
+    natal = _natal_indices(users)
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        return daily_interactions_for_date(natal, target)
+    return daily_feed_for_users(natal, target)
+
 
+def _daily_feed(natal_input: tuple, start: date, days: int, media: str):
+    natal = chart_indices(_natal_from_input(natal_input))
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        return daily_feed_interactions(natal, start, days)
+    return daily_feed(natal, start, days)
+
+
+def _daeun_result(birth_date: date, payload: ChartInput) -> Optional[DaeunResult]:
+    try:
+        return calculate_daeun(
+            birth_date,
+            payload.birth_time,
+            payload.gender,
+            timezone=payload.timezone,
+            historical_offset=payload.use_historical_offset,
+        )
+    except (RuntimeError, ValueError):
+        # 절기 테이블을 쓸 수 없거나 범위 밖이면 대운 섹션만 생략합니다.
+        return None
+
+
+# 실행기 대기열이 가득 찼을 때(EngineOverloaded)의 Retry-After(초)
+ENGINE_RETRY_AFTER = "1"
+
+
+async def _run_engine(fn, *args, **kwargs):
+    """엔진 호출을 실행기로 보냅니다. 대기열이 가득 차면 503."""
+
+    try:
+        return await engine.run(fn, *args, **kwargs)
+    except EngineOverloaded as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": ENGINE_RETRY_AFTER}) from exc
+
+
+@asynccontextmanager
+async def _admitted(gate: AdmissionGate) -> AsyncIterator[None]:
+    """입장 제어 자리를 잡고 블록을 실행합니다. 거절되면 503 + Retry-After."""
+
+    try:
+        await gate.acquire()
+    except AdmissionRejected as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": str(exc.retry_after)}) from exc
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        gate.release(time.perf_counter() - start)
+
+
+def _admission(name: str):
+    """엔드포인트 의존성: 요청을 처리하는 동안 그룹(name)의 자리를 잡습니다."""
+
+    async def guard() -> AsyncIterator[None]:
+        async with _admitted(admission.gate(name)):
+            yield
+
+    return guard
+
+
+class _AdmittedStreamingResponse(StreamingResponse):
+    """입장 제어 자리를 본문 전송이 끝날 때(완료/연결 끊김/오류)까지 들고 있는 스트리밍 응답."""
+
+    def __init__(self, slot: AsyncExitStack, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._slot = slot
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._slot.aclose()
+
+
+@asynccontextmanager
+async def _streaming_admission(name: str) -> AsyncIterator[Callable[..., StreamingResponse]]:
+    """스트리밍 엔드포인트의 입장 제어.
+
+    yield 의존성(`_admission`)은 본문을 보내기 전에 끝나므로 스트리밍에는 쓰지 않습니다.
+    블록 안에서 respond(...)로 만든 응답이 본문을 다 보낼 때까지 자리를 유지하고,
+    응답 없이(예: 400) 블록을 나가면 바로 반납합니다. 거절은 응답 시작 전에 503입니다.
+    """
+
+    slot = AsyncExitStack()
+    await slot.enter_async_context(_admitted(admission.gate(name)))
+    responses: List[StreamingResponse] = []
+
+    def respond(content, **kwargs) -> StreamingResponse:
+        responses.append(_AdmittedStreamingResponse(slot, content, **kwargs))
+        return responses[-1]
+
+    try:
+        yield respond
+    finally:
+        if not responses:
+            await slot.aclose()
+
+
+def _analysis_response(
+    birth_date: date, longitude: Optional[float], payload: ChartInput, media: str = compact.JSON_MEDIA_TYPE
+) -> bytes:
+    # 음력 입력은 원래 날짜와 달력 종류를 넘겨 변환 안내(accuracy_note)가 붙게 합니다.
+    lunar = _normalize_calendar_type(payload.calendar_type) == "LUNAR"
     analysis = analyze(
-        birth_date=birth_date,
+        birth_date=_birth_date_parts(payload) if lunar else birth_date,
         birth_time=payload.birth_time,
-        calendar_type=payload.calendar_type,
+        calendar_type=payload.calendar_type if lunar else "SOLAR",
         is_leap_month=payload.is_leap_month,
         timezone=payload.timezone,
+        historical_offset=payload.use_historical_offset,
+        longitude=longitude,
     )
 
     # 월주 후보(정책 C): 시간 미상 + 절기 경계일이면 2개
-    year_index = _year_index(birth_date)
-    month_pillars, month_uncertain = calculate_month_pillars_policy_c(
-        birth_date,
-        payload.birth_time,
-        year_index % 10,
-        timezone=payload.timezone,
-    )
+    with metrics.STAGE_SECONDS.time(stage="month_candidates"):
+        policy_c_date, policy_c_time, _ = apply_historical_offset(
+            birth_date, payload.birth_time, payload.timezone, payload.use_historical_offset
+        )
+        year_index = _year_index(_year_date_for_pillar(policy_c_date, policy_c_time, timezone=payload.timezone))
+        month_pillars, month_uncertain = calculate_month_pillars_policy_c(
+            policy_c_date,
+            policy_c_time,
+            year_index % 10,
+            timezone=payload.timezone,
+        )
 
-    chart = Chart(
-        year_pillar=Pillar(stem=analysis.chart.year.stem, branch=analysis.chart.year.branch),
-        month_pillar=Pillar(stem=analysis.chart.month.stem, branch=analysis.chart.month.branch),
-        day_pillar=Pillar(stem=analysis.chart.day.stem, branch=analysis.chart.day.branch),
-        hour_pillar=(
-            Pillar(stem=analysis.chart.hour.stem, branch=analysis.chart.hour.branch)
-            if analysis.chart.hour
-            else None
-        ),
-    )
+    with metrics.STAGE_SECONDS.time(stage="daeun"):
+        daeun = _daeun_result(birth_date, payload)
+    gods = ten_gods(analysis.chart)
+    relations = pillar_relations(analysis.chart)
+    # 엔진 결과를 pydantic 모델로 다시 검증하지 않고 바로 JSON 바이트로 씁니다(본문은 모델 출력과 동일).
+    # Accept가 msgpack이면 압축 형식(compact 모듈)으로 씁니다.
+    with metrics.STAGE_SECONDS.time(stage="serialization"):
+        if media == compact.MSGPACK_MEDIA_TYPE:
+            return compact.encode_analysis(analysis, month_pillars, month_uncertain, daeun, gods, relations)
+        return encode_analysis(analysis, month_pillars, month_uncertain, daeun, gods, relations)
 
-    return AnalysisResponse(
-        chart=chart,
-        month_pillars=[Pillar(stem=p.stem, branch=p.branch) for p in month_pillars],
-        month_uncertain=month_uncertain,
-        hidden_stems=analysis.hidden_stems,
-        element_score=analysis.element_score.__dict__,
-        summary=analysis.summary,
-        routines=analysis.routines,
-        accuracy_note=analysis.accuracy_note,
+
+def _analysis_batch(items: List[Tuple[date, Optional[float], ChartInput, str]]) -> List[object]:
+    """마이크로 배치 하나(실행기 호출 한 번). 항목별 실패는 예외 객체로 돌려줍니다."""
+
+    results: List[object] = []
+    for birth_date, longitude, payload, media in items:
+        try:
+            results.append(_analysis_response(birth_date, longitude, payload, media))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+analysis_batcher = MicroBatcher(_analysis_batch, BatchConfig.from_env(), run=engine.run)
+
+
+async def _submit_batch(batcher: MicroBatcher, item):
+    try:
+        return await batcher.submit(item)
+    except EngineOverloaded as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": ENGINE_RETRY_AFTER}) from exc
+
+
+def _birth_query(
+    birth_date: str = Query(..., description="YYYY-MM-DD"),
+    gender: str = Query(..., description="M or F"),
+    birth_time: Optional[str] = Query(None, description="HH:MM"),
+    name: Optional[str] = Query(None),
+    calendar_type: str = Query("SOLAR"),
+    is_leap_month: bool = Query(False),
+    timezone: str = Query("Asia/Seoul"),
+    use_historical_offset: bool = Query(False),
+    longitude: Optional[float] = Query(None),
+    city: Optional[str] = Query(None),
+) -> dict:
+    """GET 차트 엔드포인트의 쿼리 파라미터(ChartInput/OriginalInput 필드와 동일)."""
+
+    return {
+        "birth_date": birth_date,
+        "gender": gender,
+        "birth_time": birth_time,
+        "name": name,
+        "calendar_type": calendar_type,
+        "is_leap_month": is_leap_month,
+        "timezone": timezone,
+        "use_historical_offset": use_historical_offset,
+        "longitude": longitude,
+        "city": city,
+    }
+
+
+def _render(result) -> bytes:
+    if isinstance(result, bytes):
+        return result
+    with metrics.STAGE_SECONDS.time(stage="serialization"):
+        return result.model_dump_json().encode("utf-8")
+
+
+async def _render_and_cache(etag: str, compute, gate: AdmissionGate) -> bytes:
+    # 입장 제어 자리는 실제로 계산하는 쪽(single-flight의 첫 요청)만 잡습니다.
+    async with _admitted(gate):
+        body = _render(await compute())
+    response_cache.put(etag, body)
+    return body
+
+
+async def _debug_response(
+    etag: str, headers: dict, fn, args: tuple, profile: bool, gate: AdmissionGate, media: str
+) -> Response:
+    """Server-Timing/프로파일 요청: 캐시를 거치지 않고 이 요청만 계산합니다(결과는 캐시에 저장)."""
+
+    async with _admitted(gate):
+        outcome = await _run_engine(profiled_call if profile else traced_call, fn, *args)
+    result, stages = outcome[0], outcome[1]
+    with metrics.traced() as render_stages:
+        body = _render(result)
+    stages.update(render_stages)
+    response_cache.put(etag, body)
+
+    headers = {**headers, "Cache-Control": "no-store", "Server-Timing": server_timing(stages)}
+    if profile:
+        headers["Link"] = f'</debug/profiles/{profile_store.put(outcome[2])}>; rel="profile"'
+    return Response(content=body, media_type=media, headers=headers)
+
+
+async def _cached_response(
+    request: Request, canonical: str, fn, args: tuple, *, gate: str, batcher: Optional[MicroBatcher] = None
+) -> Response:
+    """ETag/If-None-Match(304)와 프로세스 내 응답 캐시.
+
+    fn(*args, media)는 응답 모델(또는 본문 바이트)을 만드는 엔진 함수이고, media는 Accept 협상 결과
+    (JSON 또는 msgpack)입니다. batcher가 있으면 캐시 미스를 마이크로 배치로 보냅니다.
+    Server-Timing/프로파일 요청은 `_debug_response`.
+    입장 제어(gate 그룹)는 계산이 필요한 경우에만 적용하므로 304/캐시 적중은 항상 바로 응답합니다.
+    """
+
+    media = compact.negotiate(request.headers.get("accept"))
+    args = (*args, media)
+    etag = etag_for(request.url.path, canonical, "" if media == compact.JSON_MEDIA_TYPE else media)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        # 같은 결과를 가리키는 정규화된 GET 주소
+        "Content-Location": f"{request.url.path}?{canonical}",
+        "Vary": "Accept",
+    }
+    profile = profile_requested(request.headers, request.query_params)
+    if profile is False:
+        raise HTTPException(status_code=403, detail="invalid profile token")
+    if profile or timing_requested(request.headers, request.query_params):
+        return await _debug_response(etag, headers, fn, args, bool(profile), admission.gate(gate), media)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(etag)
+    if body is None:
+        compute = partial(_submit_batch, batcher, args) if batcher is not None else partial(_run_engine, fn, *args)
+        # 같은 입력의 동시 요청은 계산 하나를 함께 기다립니다(single-flight).
+        body = await chart_flights.do(etag, lambda: _render_and_cache(etag, compute, admission.gate(gate)))
+    return Response(content=body, media_type=media, headers=headers)
+
+
+async def _analysis(request: Request, payload: ChartInput) -> Response:
+    if payload.gender not in {"M", "F"}:
+        raise HTTPException(status_code=400, detail="gender must be M or F")
+
+    birth_date = _parse_birth_date(payload)
+    _check_birth_time(payload)
+    longitude = _birth_longitude(payload, birth_date)
+    # name은 분석 결과에 쓰이지 않으므로 캐시 키에서 뺍니다.
+    return await _cached_response(
+        request,
+        canonical_query(payload, exclude=("name",)),
+        _analysis_response,
+        (birth_date, longitude, payload),
+        gate="analysis",
+        batcher=analysis_batcher,
     )
 
 
-@app.post("/api/original", response_model=OriginalResponse)
-async def create_original(payload: OriginalInput) -> OriginalResponse:
+@app.post("/api/analysis", response_model=AnalysisResponse)
+async def create_analysis(request: Request, payload: ChartInput) -> Response:
+    return await _analysis(request, payload)
+
+
+@app.get("/api/analysis", response_model=AnalysisResponse)
+async def get_analysis(request: Request, query: dict = Depends(_birth_query)) -> Response:
+    return await _analysis(request, ChartInput(**query))
+
+
+@app.post(
+    "/api/analysis/policies", response_model=PolicyEvaluationResponse, dependencies=[Depends(_admission("policies"))]
+)
+async def create_policy_evaluation(payload: PolicyEvaluationInput) -> PolicyEvaluationResponse:
     if payload.gender not in {"M", "F"}:
         raise HTTPException(status_code=400, detail="gender must be M or F")
 
+    birth_date = _parse_birth_date(payload)
+    _check_birth_time(payload)
+
     try:
-        birth_date = datetime.strptime(payload.birth_date, "%Y-%m-%d").date()
+        comparison = await _run_engine(
+            evaluate_chart_policies,
+            birth_date,
+            payload.birth_time,
+            payload.policies,
+            timezone=payload.timezone,
+            historical_offset=payload.use_historical_offset,
+            longitude=_birth_longitude(payload, birth_date),
+        )
     except ValueError as exc:
-        raise HTTPException(status_code=400, detail="birth_date must be YYYY-MM-DD") from exc
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return PolicyEvaluationResponse(
+        charts={name: _chart_payload(chart) for name, chart in comparison.charts.items()},
+        divergent_pillars=comparison.divergent_pillars,
+    )
+
+
+@app.post("/api/search/pillars", response_model=PillarSearchResponse, dependencies=[Depends(_admission("search"))])
+async def search_pillars(payload: PillarSearchInput) -> PillarSearchResponse:
+    try:
+        start = datetime.strptime(payload.start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(payload.end_date, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="start_date/end_date must be YYYY-MM-DD") from exc
+
+    pattern = PillarPattern(year=payload.year, month=payload.month, day=payload.day, hour=payload.hour)
+    try:
+        intervals = search_pillar_pattern(pattern, start, end)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    return PillarSearchResponse(
+        intervals=[
+            PillarInterval(
+                start=i.start_kst.isoformat(timespec="minutes"),
+                end=i.end_kst.isoformat(timespec="minutes"),
+            )
+            for i in intervals[: payload.limit]
+        ],
+        count=len(intervals),
+        truncated=len(intervals) > payload.limit,
+    )
+
 
+def _original_response(
+    birth_date: date, longitude: Optional[float], payload: OriginalInput, media: str = compact.JSON_MEDIA_TYPE
+) -> Union[OriginalResponse, bytes]:
     original = build_original_result(
         birth_date=birth_date,
         birth_time=payload.birth_time,
         name=payload.name,
-        calendar_type=payload.calendar_type,
-        is_leap_month=payload.is_leap_month,
         timezone=payload.timezone,
+        historical_offset=payload.use_historical_offset,
+        longitude=longitude,
     )
 
-    year_index = _year_index(birth_date)
+    policy_c_date, policy_c_time, _ = apply_historical_offset(
+        birth_date, payload.birth_time, payload.timezone, payload.use_historical_offset
+    )
+    year_index = _year_index(_year_date_for_pillar(policy_c_date, policy_c_time, timezone=payload.timezone))
     month_pillars, month_uncertain = calculate_month_pillars_policy_c(
-        birth_date,
-        payload.birth_time,
+        policy_c_date,
+        policy_c_time,
         year_index % 10,
         timezone=payload.timezone,
     )
 
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        with metrics.STAGE_SECONDS.time(stage="serialization"):
+            return compact.encode_original(original, month_pillars, month_uncertain)
     return OriginalResponse(
         title=original.title,
         name=original.name,
@@ -145,3 +778,482 @@ async def create_original(payload: OriginalInput) -> OriginalResponse:
         },
         raw_text=original.raw_text,
     )
+
+
+async def _original(request: Request, payload: OriginalInput) -> Response:
+    if payload.gender not in {"M", "F"}:
+        raise HTTPException(status_code=400, detail="gender must be M or F")
+
+    birth_date = _parse_birth_date(payload)
+    _check_birth_time(payload)
+    longitude = _birth_longitude(payload, birth_date)
+    return await _cached_response(
+        request,
+        canonical_query(payload),
+        _original_response,
+        (birth_date, longitude, payload),
+        gate="original",
+    )
+
+
+@app.post("/api/original", response_model=OriginalResponse)
+async def create_original(request: Request, payload: OriginalInput) -> Response:
+    return await _original(request, payload)
+
+
+@app.get("/api/original", response_model=OriginalResponse)
+async def get_original(request: Request, query: dict = Depends(_birth_query)) -> Response:
+    return await _original(request, OriginalInput(**query))
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in exc.errors())
+
+
+async def _session_update(session: ChartSession, fields: dict, message) -> dict:
+    """세션 메시지 하나: fields(지금까지의 입력)에 message를 덮어써 원국을 갱신합니다."""
+
+    if not isinstance(message, dict):
+        raise ValueError("message must be a JSON object")
+    merged = {**fields, **message}
+    payload = ChartInput(**merged)
+    if payload.gender not in {"M", "F"}:
+        raise ValueError("gender must be M or F")
+    birth_date = _parse_birth_date(payload)
+    _check_birth_time(payload)
+    longitude = _birth_longitude(payload, birth_date)
+    options = {"timezone": payload.timezone, "historical_offset": payload.use_historical_offset}
+
+    update = partial(session.update, birth_date, payload.birth_time, longitude=longitude, **options)
+    if session.is_warm(birth_date, payload.birth_time, **options):
+        # 캐시된 날짜 문맥(연/월주)만 쓰는 갱신은 수십 µs라 이벤트 루프에서 바로 처리합니다.
+        result = update()
+    else:
+        result = await asyncio.get_running_loop().run_in_executor(None, update)
+    fields.clear()
+    fields.update(merged)
+    return {
+        "seq": result.seq,
+        "full": result.full,
+        "changes": result.changes,
+        "reused_context": result.reused_context,
+        "server_us": result.elapsed_us,
+    }
+
+
+@app.websocket("/ws/chart")
+async def chart_session_socket(websocket: WebSocket) -> None:
+    """입력 편집 세션. 메시지(JSON 객체)는 ChartInput 필드의 부분 갱신이고, 응답은 바뀐 필드만 담습니다.
+
+    잘못된 메시지는 {"error": ...}로 답하고 세션(직전 입력/상태)은 그대로 둡니다.
+    """
+
+    await websocket.accept()
+    session = ChartSession()
+    fields: dict = {}
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                reply = await _session_update(session, fields, json.loads(text))
+            except HTTPException as exc:
+                reply = {"error": exc.detail}
+            except ValidationError as exc:
+                reply = {"error": _validation_message(exc)}
+            except json.JSONDecodeError:
+                reply = {"error": "message must be JSON"}
+            except ValueError as exc:
+                reply = {"error": str(exc)}
+            await websocket.send_json(reply)
+    except WebSocketDisconnect:
+        return
+
+
+@app.get("/debug/profiles/{profile_id}")
+async def download_profile(request: Request, profile_id: str) -> Response:
+    """프로파일 결과(pstats 파일) 내려받기. 프로파일 요청과 같은 토큰이 필요합니다."""
+
+    supplied = request.headers.get(PROFILE_HEADER) or request.query_params.get("profile")
+    if not check_profile_token(supplied):
+        raise HTTPException(status_code=403, detail="invalid profile token")
+    artifact = profile_store.get(profile_id)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail="profile not found (expired or unknown id)")
+    return Response(
+        content=artifact,
+        media_type=PROFILE_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="saju-{profile_id}.prof"'},
+    )
+
+
+CALENDAR_CHUNK_ROWS = 512
+CALENDAR_CSV_COLUMNS = [
+    "date",
+    "day",
+    "year_start",
+    "year_end",
+    "month_start",
+    "month_end",
+    "boundary_name",
+    "boundary_kst",
+] + [f"hour_{branch}" for branch in "子丑寅卯辰巳午未申酉戌亥"]
+
+
+def _calendar_row(day: CalendarDay) -> dict:
+    return {
+        "date": day.date.isoformat(),
+        "day": day.day.stem + day.day.branch,
+        "year_start": day.year_start.stem + day.year_start.branch,
+        "year_end": day.year_end.stem + day.year_end.branch,
+        "month_start": day.month_start.stem + day.month_start.branch,
+        "month_end": day.month_end.stem + day.month_end.branch,
+        "boundary_name": day.boundary.name if day.boundary else None,
+        "boundary_kst": day.boundary.when_kst.isoformat(timespec="seconds") if day.boundary else None,
+        "hour_pillars": [p.stem + p.branch for p in day.hour_pillars],
+    }
+
+
+def _calendar_json_chunks(days: Iterator[CalendarDay]) -> Iterator[str]:
+    yield "["
+    buffer: List[str] = []
+    first = True
+    for day in days:
+        buffer.append(json.dumps(_calendar_row(day), ensure_ascii=False))
+        if len(buffer) >= CALENDAR_CHUNK_ROWS:
+            yield ("" if first else ",") + ",".join(buffer)
+            first = False
+            buffer = []
+    if buffer:
+        yield ("" if first else ",") + ",".join(buffer)
+    yield "]"
+
+
+def _calendar_csv_chunks(days: Iterator[CalendarDay]) -> Iterator[str]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(CALENDAR_CSV_COLUMNS)
+    rows = 0
+    for day in days:
+        row = _calendar_row(day)
+        writer.writerow([row[c] for c in CALENDAR_CSV_COLUMNS[:8]] + row["hour_pillars"])
+        rows += 1
+        if rows % CALENDAR_CHUNK_ROWS == 0:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+@app.get("/api/calendar")
+async def get_calendar(
+    from_: str = Query(..., alias="from", description="YYYY-MM-DD"),
+    to: str = Query(..., description="YYYY-MM-DD"),
+    format: str = Query("json", description="json or csv"),
+) -> StreamingResponse:
+    async with _streaming_admission("calendar") as respond:
+        return _calendar_response(respond, from_, to, format)
+
+
+def _calendar_response(
+    respond: Callable[..., StreamingResponse], from_: str, to: str, format: str
+) -> StreamingResponse:
+    try:
+        start = datetime.strptime(from_, "%Y-%m-%d").date()
+        end = datetime.strptime(to, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="from/to must be YYYY-MM-DD") from exc
+    if format not in {"json", "csv"}:
+        raise HTTPException(status_code=400, detail="format must be json or csv")
+
+    # 범위 검증/테이블 준비는 스트리밍 시작 전에 끝내 오류를 HTTP 상태로 돌려줍니다.
+    days = iter_calendar_days(start, end)
+    try:
+        first_day = next(days)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    def all_days() -> Iterator[CalendarDay]:
+        yield first_day
+        yield from days
+
+    if format == "csv":
+        return respond(_calendar_csv_chunks(all_days()), media_type="text/csv; charset=utf-8")
+    return respond(_calendar_json_chunks(all_days()), media_type="application/json")
+
+
+def _fortune_row(entry: FortuneEntry) -> dict:
+    return {
+        "kind": entry.kind,
+        "start": entry.start_kst.isoformat(timespec="seconds"),
+        "end": entry.end_kst.isoformat(timespec="seconds"),
+        "stem": entry.pillar.stem,
+        "branch": entry.pillar.branch,
+        "stem_relation": entry.stem_relation,
+        "clashes": entry.clashes,
+        "combines": entry.combines,
+    }
+
+
+def _ndjson_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    buffer: List[str] = []
+    for row in rows:
+        buffer.append(json.dumps(row, ensure_ascii=False) + "\n")
+        if len(buffer) >= CALENDAR_CHUNK_ROWS:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+@app.post("/api/fortune/timeline")
+async def fortune_timeline(payload: FortuneTimelineInput) -> StreamingResponse:
+    """세운/월운 타임라인을 NDJSON(한 줄에 한 항목)으로 스트리밍합니다.
+
+    테이블 범위를 넘는 구간은 마지막 입춘에서 잘리며, 실제 끝 시각은 X-Timeline-End 헤더로 알려줍니다.
+    """
+
+    async with _streaming_admission("fortune") as respond:
+        return await _fortune_timeline_response(respond, payload)
+
+
+def _timeline_head(natal_input: tuple, start: datetime, end: datetime, include_months: bool):
+    """원국과 타임라인 첫 항목(범위 오류는 여기서 ValueError). 엔진 실행기에서 부릅니다."""
+
+    chart = _natal_from_input(natal_input)
+    return chart, next(iter_fortune_timeline(chart, start, end, include_months=include_months))
+
+
+async def _fortune_timeline_response(
+    respond: Callable[..., StreamingResponse], payload: FortuneTimelineInput
+) -> StreamingResponse:
+    natal_input = _natal_input(payload)
+    table = solar_term_table_or_none()
+    if table is None:
+        raise HTTPException(status_code=503, detail="solar term table is unavailable")
+
+    timezone, _ = _normalize_timezone(payload.timezone)
+    birth_date, birth_time, _ = apply_historical_offset(
+        natal_input[0], payload.birth_time, timezone, payload.use_historical_offset
+    )
+    hh, mm = [int(x) for x in birth_time.split(":")[:2]] if birth_time else (0, 0)
+    start = _local_wall_to_kst(datetime(birth_date.year, birth_date.month, birth_date.day, hh, mm), timezone)
+    try:
+        end = min(start.replace(year=start.year + payload.years), timeline_end_limit(table))
+    except ValueError:  # 2월 29일 출생
+        end = min(start.replace(year=start.year + payload.years, day=28), timeline_end_limit(table))
+
+    # 원국과 첫 항목은 응답 전에 실행기에서 만들고(오류는 400), 나머지는 본문을 보내며 이어서 만듭니다.
+    try:
+        chart, first_entry = await _run_engine(_timeline_head, natal_input, start, end, payload.include_months)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def all_rows() -> Iterator[dict]:
+        yield _fortune_row(first_entry)
+        entries = iter_fortune_timeline(chart, start, end, include_months=payload.include_months, table=table)
+        for entry in islice(entries, 1, None):
+            yield _fortune_row(entry)
+
+    return respond(
+        _ndjson_chunks(all_rows()),
+        media_type="application/x-ndjson",
+        headers={"X-Timeline-End": end.isoformat(timespec="seconds")},
+    )
+
+
+@app.post(
+    "/api/compatibility/matches",
+    response_model=CompatibilityResponse,
+    dependencies=[Depends(_admission("compatibility"))],
+)
+async def compatibility_matches(
+    request: Request, response: Response, payload: CompatibilityInput
+) -> Union[CompatibilityResponse, Response]:
+    """members 각각에 대해 candidates 중 궁합 점수 상위 top_k를 돌려줍니다."""
+
+    media = _negotiate(request, response)
+    # 입력 검증은 여기서(400), 원국(최대 수천 건)과 top-k 계산은 엔진 실행기에서 합니다.
+    members = [_natal_input(p) for p in payload.members]
+    candidates = [_natal_input(p) for p in payload.candidates]
+    matches = await _run_engine(_compatibility_top_k, members, candidates, payload.top_k)
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        return _msgpack_response(compact.encode_matches(matches.indices, matches.scores))
+    return CompatibilityResponse(
+        rows=[
+            CompatibilityRow(
+                member=i,
+                matches=[
+                    CompatibilityMatch(candidate=int(j), name=payload.candidates[int(j)].name, score=round(float(v), 2))
+                    for v, j in zip(matches.scores[i], matches.indices[i])
+                ],
+            )
+            for i in range(len(payload.members))
+        ]
+    )
+
+
+def _feed_date(value: Optional[str], default_offset_days: int) -> date:
+    if value is None:
+        return datetime.now(KST).date() + timedelta(days=default_offset_days)
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="date must be YYYY-MM-DD") from exc
+
+
+def _daily_payload(entry) -> DailyFortune:
+    return DailyFortune(
+        date=entry.day.isoformat(),
+        stem=entry.pillar.stem,
+        branch=entry.pillar.branch,
+        ten_god=entry.ten_god,
+        relations=entry.relations,
+        element_delta=entry.element_delta,
+        balance_delta=entry.balance_delta,
+    )
+
+
+@app.post("/api/daily", response_model=DailyFeedResponse, dependencies=[Depends(_admission("daily"))])
+async def daily_fortune_feed(
+    request: Request, response: Response, payload: DailyFeedInput
+) -> Union[DailyFeedResponse, Response]:
+    """한 사람의 start_date부터 days일 일진 피드."""
+
+    media = _negotiate(request, response)
+    natal_input = _natal_input(payload)
+    start = _feed_date(payload.start_date, 0)
+    result = await _run_engine(_daily_feed, natal_input, start, payload.days, media)
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        days = [start + timedelta(days=i) for i in range(payload.days)]
+        return _msgpack_response(compact.encode_daily(days, result))
+    return DailyFeedResponse(days=[_daily_payload(e) for e in result])
+
+
+@app.post("/api/daily/batch", response_model=DailyFeedResponse, dependencies=[Depends(_admission("daily"))])
+async def daily_fortune_batch(
+    request: Request, response: Response, payload: DailyBatchInput
+) -> Union[DailyFeedResponse, Response]:
+    """여러 사람의 target_date(기본: 내일) 일진. 응답 순서는 users 순서와 같습니다."""
+
+    media = _negotiate(request, response)
+    users = [_natal_input(user) for user in payload.users]
+    target = _feed_date(payload.target_date, 1)
+    result = await _run_engine(_daily_batch, users, target, media)
+    if media == compact.MSGPACK_MEDIA_TYPE:
+        return _msgpack_response(compact.encode_daily([target] * len(payload.users), result))
+    return DailyFeedResponse(days=[_daily_payload(e) for e in result])
+
+
+@app.post(
+    "/api/stats/population", response_model=PopulationStatsResponse, dependencies=[Depends(_admission("stats"))]
+)
+async def population_stats(payload: PopulationStatsInput) -> PopulationStatsResponse:
+    """출생 구간 격자의 오행 비율 분포(상태 비율, 히스토그램, 분위수)."""
+
+    try:
+        start = datetime.strptime(payload.start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(payload.end_date, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="start_date/end_date must be YYYY-MM-DD") from exc
+
+    # 워커 수와 격자 한도는 서버 설정(SAJU_STATS_*)을 따릅니다.
+    try:
+        stats = await _run_engine(
+            population_statistics,
+            start,
+            end,
+            step_minutes=payload.step_minutes,
+            include_hour=payload.include_hour,
+            group_by=payload.group_by,
+            bin_width=payload.bin_width,
+            quantiles=payload.quantiles,
+            workers=stats_config.workers,
+            max_samples=stats_config.max_samples,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    return PopulationStatsResponse(
+        start_date=stats.start.isoformat(),
+        end_date=stats.end.isoformat(),
+        step_minutes=stats.step_minutes,
+        include_hour=stats.include_hour,
+        bin_edges=stats.bin_edges,
+        overall=ElementDistribution(**stats.overall.__dict__),
+        groups={key: ElementDistribution(**d.__dict__) for key, d in stats.groups.items()},
+    )
+
+
+JOB_MEDIA_TYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+def _job_status(job_id: str):
+    try:
+        return jobs.status(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(request: Request, format: str = Query("csv", description="csv or parquet")) -> dict:
+    """CSV(요청 본문 그대로, text/csv) 업로드 -> 작업 id. 계산은 백그라운드에서 청크 단위로 진행됩니다."""
+
+    try:
+        status = await jobs.submit(request.stream(), format)
+    except JobsFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": str(exc.retry_after)}) from exc
+    except InputTooLarge as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {
+        **status.to_dict(),
+        "status_url": f"/api/jobs/{status.id}",
+        "events_url": f"/api/jobs/{status.id}/events",
+        "result_url": f"/api/jobs/{status.id}/result",
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str) -> dict:
+    return _job_status(job_id).to_dict()
+
+
+async def _job_events(job_id: str) -> AsyncIterator[str]:
+    async for status in jobs.events(job_id):
+        event = status.state if status.state in TERMINAL_STATES else "progress"
+        yield f"event: {event}\ndata: {json.dumps(status.to_dict())}\n\n"
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(job_id: str) -> StreamingResponse:
+    """진행 상태 SSE(text/event-stream). 상태가 바뀔 때마다 progress, 마지막에 done/failed/cancelled."""
+
+    _job_status(job_id)
+    return StreamingResponse(
+        _job_events(job_id), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def job_result(job_id: str) -> FileResponse:
+    status = _job_status(job_id)
+    path = jobs.result_path(job_id)
+    if path is None:
+        raise HTTPException(status_code=409, detail=f"job is {status.state}")
+    return FileResponse(path, media_type=JOB_MEDIA_TYPES[status.format], filename=f"saju-{job_id}.{status.format}")
+
+
+@app.delete("/api/jobs/{job_id}", status_code=204)
+async def delete_job(job_id: str) -> Response:
+    """실행 중이면 취소(다음 청크 경계에서 멈춤), 끝난 작업은 파일을 지웁니다."""
+
+    try:
+        jobs.cancel(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+    return Response(status_code=204)
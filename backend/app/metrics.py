@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+"""프로세스 내 계측(Prometheus 텍스트 형식, `/metrics`).
+
+외부 의존성 없이 카운터와 히스토그램만 둡니다. 관측 한 번은 잠금 + 덧셈 몇 번이라
+운영에서 항상 켜 둘 수 있습니다.
+- STAGE_SECONDS{stage}: 차트 파이프라인 단계별 소요 시간
+  ephemeris_load, solar_term_table_load, crossing_scan, bisection, ipchun_probe, scoring, serialization
+- SKYFIELD_EVALUATIONS: Skyfield 태양 황경 평가 횟수
+- CACHE_REQUESTS{cache, result}: 캐시별 hit/miss(response, inflight, solar_term_table, shared_table, crossing_store 등)
+- FALLBACKS{reason}: 폴백 경로 진입 횟수
+- ADMISSION_WAIT{endpoint}, ADMISSION_REJECTED{endpoint, reason}: 입장 제어(admission 모듈)
+
+프로세스 풀 워커(SAJU_ENGINE_WORKERS > 0)에서 쌓인 값은 호출이 끝날 때 `drain()`으로 떼어
+결과와 함께 돌려보내고, 부모가 `merge()`로 합칩니다(executor 모듈).
+
+`traced()` 블록 안에서는 단계 시간을 요청별 dict에도 더합니다(Server-Timing용, profiling 모듈).
+블록 밖에서는 ContextVar 조회 한 번만 추가됩니다.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# (이름, 타입, 설명, [(라벨, 값)]) - 렌더링 시점에 값을 읽는 수집기용
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+_REGISTRY: Dict[str, "_Metric"] = {}
+_COLLECTORS: List[Callable[[], Iterable[Family]]] = []
+_TRACE: ContextVar[Optional[Dict[str, float]]] = ContextVar("saju_stage_trace", default=None)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        _REGISTRY[name] = self
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def drain(self) -> Dict[tuple, object]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def merge(self, values: Dict[tuple, float]) -> None:
+        with self._lock:
+            for key, amount in values.items():
+                self._values[key] = self._values.get(key, 0) + amount
+
+    def lines(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield _sample(self.name, self._labels(key), value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def time(self, **labels: str) -> "_Timer":
+        """`with histogram.time(stage=...):` 블록의 소요 시간(초)을 관측합니다."""
+
+        return _Timer(self, labels)
+
+    def count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def merge(self, values: Dict[tuple, list]) -> None:
+        with self._lock:
+            for key, (counts, total, count) in values.items():
+                entry = self._values.get(key)
+                if entry is None:
+                    entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                entry[0] = [a + b for a, b in zip(entry[0], counts)]
+                entry[1] += total
+                entry[2] += count
+
+    def lines(self) -> Iterator[str]:
+        for key, (counts, total, count) in sorted(self._values.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                yield _sample(f"{self.name}_bucket", {**labels, "le": _format(bound)}, cumulative)
+            yield _sample(f"{self.name}_sum", labels, total)
+            yield _sample(f"{self.name}_count", labels, count)
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]) -> None:
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.histogram.observe(elapsed, **self.labels)
+        trace = _TRACE.get()
+        if trace is not None:
+            key = ",".join(self.labels.values())
+            trace[key] = trace.get(key, 0.0) + elapsed
+
+
+STAGE_SECONDS = Histogram("saju_stage_seconds", "Time spent in each chart pipeline stage.", ("stage",))
+SKYFIELD_EVALUATIONS = Counter("saju_skyfield_evaluations_total", "Sun ecliptic longitude evaluations via Skyfield.")
+CACHE_REQUESTS = Counter("saju_cache_requests_total", "Cache lookups by cache and result.", ("cache", "result"))
+FALLBACKS = Counter("saju_fallback_total", "Fallback path activations by reason.", ("reason",))
+ADMISSION_WAIT = Histogram("saju_admission_wait_seconds", "Time spent waiting for an admission slot.", ("endpoint",))
+ADMISSION_REJECTED = Counter(
+    "saju_admission_rejected_total", "Requests shed by admission control.", ("endpoint", "reason")
+)
+
+
+class traced:
+    """`with traced() as stages:` 블록 안의 단계별 누적 시간(초)을 stages dict에 모읍니다."""
+
+    def __enter__(self) -> Dict[str, float]:
+        self.stages: Dict[str, float] = {}
+        self._token = _TRACE.set(self.stages)
+        return self.stages
+
+    def __exit__(self, *exc_info: object) -> None:
+        _TRACE.reset(self._token)
+
+
+def register_collector(collector: Callable[[], Iterable[Family]]) -> None:
+    """렌더링할 때마다 불러 값을 읽는 수집기(게이지 등)를 등록합니다."""
+
+    _COLLECTORS.append(collector)
+
+
+def drain() -> Dict[str, Dict[tuple, object]]:
+    """이 프로세스에 쌓인 값을 떼어 냅니다(비어 있는 지표는 뺌). 풀 워커 -> 부모 전달용."""
+
+    snapshot = {}
+    for name, metric in _REGISTRY.items():
+        values = metric.drain()
+        if values:
+            snapshot[name] = values
+    return snapshot
+
+
+def merge(snapshot: Dict[str, Dict[tuple, object]]) -> None:
+    for name, values in snapshot.items():
+        metric = _REGISTRY.get(name)
+        if metric is not None:
+            metric.merge(values)
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format(value)}"
+    body = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return f"{name}{{{body}}} {_format(value)}"
+
+
+def render() -> str:
+    lines: List[str] = []
+    for metric in _REGISTRY.values():
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        with metric._lock:
+            lines.extend(metric.lines())
+    for collector in _COLLECTORS:
+        for name, kind, help, samples in collector():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(_sample(name, labels, value) for labels, value in samples)
+    return "\n".join(lines) + "\n"
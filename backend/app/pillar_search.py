@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+"""4주 패턴 역검색: 어떤 출생 시각(KST, 분 단위)이 주어진 기둥 조합을 만드는지 찾습니다.
+
+- 패턴은 기둥별로 "甲子"(완전), "甲*"/"*子"(천간/지지만), "*" 또는 None(무관)을 받습니다.
+- 날짜별 일주 인덱스와 절기 테이블(연/월 경계)을 벡터로 미리 걸러 후보 날짜만 남긴 뒤,
+  후보 날짜의 시지 구간 + 절기 경계로 쪼갠 구간마다 4주를 평가해 일치 구간을 합칩니다.
+- 구간은 [start, end) 형태의 KST 벽시계 시각이며, 분 단위 출생 시각 기준입니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .saju import BRANCHES, STEMS
+from .solar_term_table import SolarTermTable, solar_term_table_or_none
+from .solar_terms import KST
+from .vectorized import (
+    HOUR_SLOT_STARTS,
+    PILLAR_KEYS,
+    chart_indices_at,
+    day_indices_for_ordinals,
+    ordinals_to_kst_minutes,
+    year_month_indices_at,
+)
+
+_WILDCARDS = {"*", "?", "_"}
+_MINUTES_PER_DAY = 1440
+_KST_EPOCH = datetime(1970, 1, 1, tzinfo=KST)
+
+
+@dataclass(frozen=True)
+class PillarPattern:
+    year: Optional[str] = None
+    month: Optional[str] = None
+    day: Optional[str] = None
+    hour: Optional[str] = None
+
+
+@dataclass
+class PillarInterval:
+    start_kst: datetime
+    end_kst: datetime
+
+
+def parse_pillar_pattern(text: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """기둥 패턴 문자열 -> (천간 인덱스, 지지 인덱스). 와일드카드는 None."""
+
+    if text is None:
+        return None, None
+    text = text.strip()
+    if text in {"", *_WILDCARDS}:
+        return None, None
+    if len(text) != 2:
+        raise ValueError(f"invalid pillar pattern: {text}")
+
+    stem_char, branch_char = text[0], text[1]
+    if stem_char not in _WILDCARDS and stem_char not in STEMS:
+        raise ValueError(f"invalid stem in pattern: {text}")
+    if branch_char not in _WILDCARDS and branch_char not in BRANCHES:
+        raise ValueError(f"invalid branch in pattern: {text}")
+
+    stem = None if stem_char in _WILDCARDS else STEMS.index(stem_char)
+    branch = None if branch_char in _WILDCARDS else BRANCHES.index(branch_char)
+    return stem, branch
+
+
+def _match(indices: np.ndarray, stem: Optional[int], branch: Optional[int]) -> np.ndarray:
+    mask = np.ones(indices.shape, dtype=bool)
+    if stem is not None:
+        mask &= (indices % 10) == stem
+    if branch is not None:
+        mask &= (indices % 12) == branch
+    return mask
+
+
+def search_pillar_pattern(
+    pattern: Union[PillarPattern, Dict[str, Optional[str]]],
+    start: date,
+    end: date,
+    *,
+    table: Optional[SolarTermTable] = None,
+) -> List[PillarInterval]:
+    """[start, end] KST 날짜 범위에서 패턴과 일치하는 출생 시각 구간들을 반환합니다.
+
+    범위가 절기 테이블 구간을 벗어나면 ValueError, 절기 엔진을 쓸 수 없으면 RuntimeError.
+    """
+
+    if isinstance(pattern, dict):
+        pattern = PillarPattern(**pattern)
+    parsed = {key: parse_pillar_pattern(getattr(pattern, key)) for key in PILLAR_KEYS}
+    constrained = {key: value for key, value in parsed.items() if value != (None, None)}
+
+    if end < start:
+        raise ValueError("end must not be before start")
+    table = table or solar_term_table_or_none()
+    if table is None:
+        raise RuntimeError("solar term table is unavailable")
+    first, last = table.date_range()
+    if start < first or end > last:
+        raise ValueError(f"search range must be within {first.isoformat()}..{last.isoformat()}")
+
+    # 1) 후보 날짜 거르기(날짜당 O(1) 벡터 연산)
+    ordinals = np.arange(start.toordinal(), end.toordinal() + 1, dtype=np.int64)
+    day_start = ordinals_to_kst_minutes(ordinals)
+    candidates = np.ones(ordinals.shape, dtype=bool)
+    if "day" in constrained:
+        # 23:00 이후는 다음날 일주이므로 당일/다음날 중 하나라도 맞으면 후보
+        candidates &= _match(day_indices_for_ordinals(ordinals), *constrained["day"]) | _match(
+            day_indices_for_ordinals(ordinals + 1), *constrained["day"]
+        )
+    if "year" in constrained or "month" in constrained:
+        # 연/월 경계는 하루에 최대 1번이므로 하루의 처음/끝만 보면 충분합니다.
+        year_a, month_a = year_month_indices_at(table, day_start)
+        year_b, month_b = year_month_indices_at(table, day_start + _MINUTES_PER_DAY - 1)
+        for key, a, b in (("year", year_a, year_b), ("month", month_a, month_b)):
+            if key in constrained:
+                candidates &= _match(a, *constrained[key]) | _match(b, *constrained[key])
+
+    candidate_starts = day_start[candidates]
+    if candidate_starts.size == 0:
+        return []
+
+    # 2) 후보 날짜를 시지 구간 + 절기 경계로 쪼갠 구간 시작점
+    slot_starts = (candidate_starts[:, None] + HOUR_SLOT_STARTS[None, :]).ravel()
+    # 경계 시각 이상인 첫 '분'부터 경계 이후(calculate_chart와 동일한 >= 비교)
+    boundary_minutes = np.ceil(table.when_utc / 60.0).astype(np.int64) + 9 * 60
+    boundary_days = np.floor_divide(boundary_minutes, _MINUTES_PER_DAY) * _MINUTES_PER_DAY
+    boundary_minutes = boundary_minutes[np.isin(boundary_days, candidate_starts)]
+    seg_start = np.unique(np.concatenate([slot_starts, boundary_minutes]))
+
+    day_end = (np.floor_divide(seg_start, _MINUTES_PER_DAY) + 1) * _MINUTES_PER_DAY
+    seg_end = np.minimum(np.append(seg_start[1:], day_end[-1]), day_end)
+
+    # 3) 구간별 4주 평가 후 일치 구간 병합
+    charts = chart_indices_at(table, seg_start)
+    matched = np.ones(seg_start.shape, dtype=bool)
+    for column, key in enumerate(PILLAR_KEYS):
+        if key in constrained:
+            matched &= _match(charts[:, column], *constrained[key])
+
+    starts = seg_start[matched]
+    ends = seg_end[matched]
+    if starts.size == 0:
+        return []
+    breaks = np.nonzero(starts[1:] != ends[:-1])[0] + 1
+    group_starts = starts[np.concatenate([[0], breaks])]
+    group_ends = ends[np.concatenate([breaks - 1, [ends.size - 1]])]
+
+    return [
+        PillarInterval(
+            start_kst=_KST_EPOCH + timedelta(minutes=int(s)),
+            end_kst=_KST_EPOCH + timedelta(minutes=int(e)),
+        )
+        for s, e in zip(group_starts, group_ends)
+    ]
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+"""출생 구간 집단 통계(오행 분포).
+
+출생 시각 격자(기본 1시간 간격, 또는 시간 미상으로 하루 1개)의 모든 원국을 벡터 엔진으로 계산해
+오행 비율 분포를 집계합니다. `analyze()`를 시각마다 부르는 대신
+- 4주 인덱스: `vectorized.chart_indices_at`(절기 테이블 이분 탐색)
+- 오행 비율: `compatibility.element_vectors`(기둥 x 60갑자 기여도 표)
+를 청크 단위(기본 100만 시각)로 돌리고, 청크 결과(상태별 개수, 0.1%p 히스토그램)를 합칩니다.
+청크는 서로 독립이라 workers > 1이면 프로세스 풀에서 나눠 계산합니다.
+
+상태(VERY_LOW..VERY_HIGH) 기준은 `calculate_elements`와 같습니다(소수 둘째 자리 반올림 후 비교).
+분위수는 0.1%p 히스토그램에서 구하므로 오차는 0.1%p 이하입니다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .compatibility import element_vectors
+from .saju import ELEMENTS
+from .solar_term_table import get_solar_term_table
+from .solar_terms import KST
+from .vectorized import chart_indices_at, ordinals_to_kst_minutes
+
+STATUS_LEVELS = ["VERY_LOW", "LOW", "NORMAL", "HIGH", "VERY_HIGH"]
+# calculate_elements의 상태 경계(%): < 8, < 14, < 24, < 32, 그 이상
+_STATUS_EDGES = np.array([8.0, 14.0, 24.0, 32.0])
+
+FINE_BIN_WIDTH = 0.1
+_FINE_BINS = int(round(100.0 / FINE_BIN_WIDTH))
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+DEFAULT_CHUNK_SAMPLES = 1_000_000
+MAX_SAMPLES = 200_000_000
+# HTTP 요청(`POST /api/stats/population`) 기본 한도: 1분 격자 약 9년, 1시간 격자 약 570년
+HTTP_MAX_SAMPLES = 5_000_000
+GROUP_BY_OPTIONS = ("year",)
+
+_MINUTES_PER_DAY = 1440
+
+
+@dataclass(frozen=True)
+class StatsConfig:
+    """HTTP 통계 요청 설정. 워커 수/격자 한도는 요청 본문이 아니라 서버가 정합니다(CLI는 인자로)."""
+
+    workers: int = 1
+    max_samples: int = HTTP_MAX_SAMPLES
+
+    @classmethod
+    def from_env(cls) -> "StatsConfig":
+        return cls(
+            workers=max(1, int(os.environ.get("SAJU_STATS_WORKERS", "1"))),
+            max_samples=max(1, int(os.environ.get("SAJU_STATS_MAX_SAMPLES", str(HTTP_MAX_SAMPLES)))),
+        )
+
+
+@dataclass
+class _Accumulator:
+    count: int = 0
+    status_counts: np.ndarray = field(default_factory=lambda: np.zeros((len(ELEMENTS), len(STATUS_LEVELS)), np.int64))
+    histogram: np.ndarray = field(default_factory=lambda: np.zeros((len(ELEMENTS), _FINE_BINS), np.int64))
+
+    def add(self, norm: np.ndarray) -> None:
+        """norm: (N, 5) 오행 비율(%)."""
+
+        rounded = np.round(norm, 2)
+        status = np.searchsorted(_STATUS_EDGES, rounded, side="right")
+        bins = np.clip((norm / FINE_BIN_WIDTH).astype(np.int64), 0, _FINE_BINS - 1)
+        for e in range(len(ELEMENTS)):
+            self.status_counts[e] += np.bincount(status[:, e], minlength=len(STATUS_LEVELS))
+            self.histogram[e] += np.bincount(bins[:, e], minlength=_FINE_BINS)
+        self.count += norm.shape[0]
+
+    def merge(self, other: "_Accumulator") -> None:
+        self.count += other.count
+        self.status_counts += other.status_counts
+        self.histogram += other.histogram
+
+
+@dataclass
+class ElementDistribution:
+    count: int
+    status_share: Dict[str, Dict[str, float]]
+    histogram: Dict[str, List[int]]
+    quantiles: Dict[str, Dict[str, float]]
+
+
+@dataclass
+class PopulationStatistics:
+    start: date
+    end: date
+    step_minutes: int
+    include_hour: bool
+    bin_edges: List[float]
+    overall: ElementDistribution
+    groups: Dict[str, ElementDistribution]
+
+
+def _sample_minutes(start: date, end: date, step_minutes: int, include_hour: bool) -> Tuple[int, int, int]:
+    """격자 (첫 분, 끝 분(미포함), 간격). 시간 미상은 하루 1개(그 날짜 00:00)."""
+
+    first = int(ordinals_to_kst_minutes(np.array([start.toordinal()]))[0])
+    stop = int(ordinals_to_kst_minutes(np.array([end.toordinal() + 1]))[0])
+    return first, stop, step_minutes if include_hour else _MINUTES_PER_DAY
+
+
+def _chunk_accumulators(
+    first: int, stop: int, step: int, include_hour: bool, group_by: Optional[str]
+) -> Dict[Optional[str], _Accumulator]:
+    minutes = np.arange(first, stop, step, dtype=np.int64)
+    table = get_solar_term_table()
+    if include_hour:
+        charts = chart_indices_at(table, minutes)
+    else:
+        # 시간 미상: 연/월주는 그 날짜 끝(calculate_chart와 같은 대표값), 일주는 그 날짜
+        charts = chart_indices_at(table, minutes + _MINUTES_PER_DAY - 1, day_minutes=minutes)
+        charts[:, 3] = -1
+    norm = element_vectors(charts) * 100.0
+
+    result: Dict[Optional[str], _Accumulator] = {}
+    if group_by is None:
+        result[None] = _Accumulator()
+        result[None].add(norm)
+        return result
+
+    # KST 벽시계 분은 1970-01-01 00:00(KST) 기준이므로 naive datetime64로 보면 양력 연도가 나옵니다.
+    year_of = minutes.astype("datetime64[m]").astype("datetime64[Y]").astype(np.int64) + 1970
+    for year in np.unique(year_of):
+        acc = _Accumulator()
+        acc.add(norm[year_of == year])
+        result[str(int(year))] = acc
+    return result
+
+
+def _chunks(first: int, stop: int, step: int, chunk_samples: int) -> Iterator[Tuple[int, int]]:
+    span = chunk_samples * step
+    for lo in range(first, stop, span):
+        yield lo, min(stop, lo + span)
+
+
+def _quantile_values(histogram: np.ndarray, quantiles: Sequence[float]) -> List[float]:
+    cumulative = np.cumsum(histogram)
+    total = cumulative[-1]
+    if total == 0:
+        return [float("nan")] * len(quantiles)
+    values = []
+    for q in quantiles:
+        target = q * total
+        i = int(np.searchsorted(cumulative, target, side="left"))
+        below = cumulative[i - 1] if i > 0 else 0
+        fraction = (target - below) / histogram[i] if histogram[i] else 0.0
+        values.append(round((i + fraction) * FINE_BIN_WIDTH, 2))
+    return values
+
+
+def _distribution(acc: _Accumulator, bin_factor: int, quantiles: Sequence[float]) -> ElementDistribution:
+    coarse = acc.histogram.reshape(len(ELEMENTS), -1, bin_factor).sum(axis=2)
+    total = max(acc.count, 1)
+    return ElementDistribution(
+        count=acc.count,
+        status_share={
+            e: {level: round(float(acc.status_counts[i, j]) / total, 6) for j, level in enumerate(STATUS_LEVELS)}
+            for i, e in enumerate(ELEMENTS)
+        },
+        histogram={e: [int(v) for v in coarse[i]] for i, e in enumerate(ELEMENTS)},
+        quantiles={
+            e: {f"{q:g}": v for q, v in zip(quantiles, _quantile_values(acc.histogram[i], quantiles))}
+            for i, e in enumerate(ELEMENTS)
+        },
+    )
+
+
+def population_statistics(
+    start: date,
+    end: date,
+    *,
+    step_minutes: int = 60,
+    include_hour: bool = True,
+    group_by: Optional[str] = None,
+    bin_width: float = 5.0,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    workers: int = 1,
+    chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+    max_samples: int = MAX_SAMPLES,
+) -> PopulationStatistics:
+    """[start, end](KST 날짜, 양 끝 포함) 출생 격자의 오행 비율 분포.
+
+    bin_width는 0.1의 배수이면서 100을 나누어떨어지게 해야 합니다(예: 1, 2, 2.5, 5, 10).
+    group_by="year"면 출생 양력 연도별 분포도 함께 돌려줍니다.
+    잘못된 인자/격자가 max_samples보다 크면 ValueError, 절기 테이블을 쓸 수 없으면 RuntimeError.
+    """
+
+    if end < start:
+        raise ValueError("end must not be before start")
+    if not 1 <= step_minutes <= _MINUTES_PER_DAY:
+        raise ValueError("step_minutes must be within 1..1440")
+    if group_by is not None and group_by not in GROUP_BY_OPTIONS:
+        raise ValueError(f"group_by must be one of {', '.join(GROUP_BY_OPTIONS)}")
+    bin_factor = int(round(bin_width / FINE_BIN_WIDTH))
+    if bin_factor < 1 or abs(bin_factor * FINE_BIN_WIDTH - bin_width) > 1e-9 or _FINE_BINS % bin_factor:
+        raise ValueError("bin_width must be a multiple of 0.1 that divides 100")
+    if any(not 0.0 <= q <= 1.0 for q in quantiles):
+        raise ValueError("quantiles must be within 0..1")
+
+    first, stop, step = _sample_minutes(start, end, step_minutes, include_hour)
+    if (stop - first) // step > max_samples:
+        raise ValueError(f"grid is too large (max {max_samples} samples)")
+    try:
+        table = get_solar_term_table()
+    except Exception as exc:
+        raise RuntimeError("solar term table is unavailable") from exc
+    range_start = datetime(start.year, start.month, start.day, tzinfo=KST)
+    if not table.covers(range_start, range_start + timedelta(days=(end - start).days + 1)):
+        raise ValueError("birth range is outside the solar term table")
+
+    overall = _Accumulator()
+    groups: Dict[str, _Accumulator] = {}
+    tasks = [(lo, hi, step, include_hour, group_by) for lo, hi in _chunks(first, stop, step, chunk_samples)]
+    workers = max(1, min(workers, os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        results = (_chunk_accumulators(*task) for task in tasks)
+        _merge_results(results, overall, groups)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _merge_results(pool.map(_chunk_accumulators, *zip(*tasks)), overall, groups)
+
+    return PopulationStatistics(
+        start=start,
+        end=end,
+        step_minutes=step,
+        include_hour=include_hour,
+        bin_edges=[round(i * bin_factor * FINE_BIN_WIDTH, 2) for i in range(_FINE_BINS // bin_factor + 1)],
+        overall=_distribution(overall, bin_factor, quantiles),
+        groups={key: _distribution(acc, bin_factor, quantiles) for key, acc in sorted(groups.items())},
+    )
+
+
+def _merge_results(
+    results: Iterator[Dict[Optional[str], _Accumulator]], overall: _Accumulator, groups: Dict[str, _Accumulator]
+) -> None:
+    for partial in results:
+        for key, acc in partial.items():
+            overall.merge(acc)
+            if key is not None:
+                groups.setdefault(key, _Accumulator()).merge(acc)
+
+
+stats_config = StatsConfig.from_env()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+"""요청 단위 디버깅: Server-Timing 헤더와 요청별 프로파일(cProfile).
+
+요청한 경우에만 동작합니다. 평소 경로에는 헤더 확인 외의 비용이 없습니다.
+- Server-Timing: `X-Saju-Timing: 1` 헤더 또는 `?timing=1`
+  엔진 호출을 `traced_call`로 감싸 단계별 시간(metrics.STAGE_SECONDS와 같은 단계)을 모아
+  `Server-Timing: chart;dur=0.412, scoring;dur=0.031, ..., engine;dur=0.9`(ms)로 돌려줍니다.
+- 프로파일: `X-Saju-Profile: <토큰>` 헤더 또는 `?profile=<토큰>`(SAJU_PROFILE_TOKEN이 설정된 경우만)
+  엔진 호출(analyze -> calculate_chart ...)을 cProfile로 감싸 실행하고, 결과(pstats 형식)를
+  `ProfileStore`에 넣은 뒤 `Link: </debug/profiles/<id>>; rel="profile"`로 알려 줍니다.
+  받은 파일은 `python -m pstats <file>`, snakeviz 등으로 엽니다.
+
+두 경로 모두 캐시/single-flight/배칭을 거치지 않고 그 요청만 따로 계산합니다(캐시에는 저장).
+감싸는 함수는 모듈 최상위에 있어 프로세스 풀 워커에서도 그대로 실행됩니다.
+"""
+
+import cProfile
+import hmac
+import marshal
+import os
+import pstats
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .metrics import traced
+
+TIMING_HEADER = "x-saju-timing"
+PROFILE_HEADER = "x-saju-profile"
+PROFILE_MEDIA_TYPE = "application/octet-stream"
+
+
+def traced_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Dict[str, float]]:
+    """fn(*args, **kwargs) -> (결과, 단계별 시간(초)). 전체 시간은 "engine" 키."""
+
+    start = time.perf_counter()
+    with traced() as stages:
+        result = fn(*args, **kwargs)
+    stages["engine"] = time.perf_counter() - start
+    return result, stages
+
+
+def profiled_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Dict[str, float], bytes]:
+    """traced_call + cProfile. 세 번째 값은 pstats 파일 바이트(`Stats.dump_stats`와 같은 형식)."""
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        result, stages = traced_call(fn, *args, **kwargs)
+    finally:
+        profile.disable()
+    return result, stages, marshal.dumps(pstats.Stats(profile).stats)
+
+
+def server_timing(stages: Dict[str, float]) -> str:
+    """단계별 시간(초) -> Server-Timing 헤더 값(ms, 소수 셋째 자리)."""
+
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in stages.items())
+
+
+def timing_requested(headers: Any, query: Any) -> bool:
+    return headers.get(TIMING_HEADER, "") in ("1", "true") or query.get("timing", "") in ("1", "true")
+
+
+def profile_token() -> Optional[str]:
+    return os.environ.get("SAJU_PROFILE_TOKEN") or None
+
+
+def profile_requested(headers: Any, query: Any) -> Optional[bool]:
+    """프로파일 요청이 없으면 None, 토큰이 맞으면 True, 틀리거나 기능이 꺼져 있으면 False."""
+
+    supplied = headers.get(PROFILE_HEADER) or query.get("profile")
+    if not supplied:
+        return None
+    return check_profile_token(supplied)
+
+
+def check_profile_token(supplied: Optional[str]) -> bool:
+    expected = profile_token()
+    return bool(expected and supplied) and hmac.compare_digest(supplied.encode(), expected.encode())
+
+
+class ProfileStore:
+    """최근 프로파일 결과(id -> pstats 바이트)를 최대 max_entries개 보관합니다."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, artifact: bytes) -> str:
+        profile_id = secrets.token_hex(8)
+        with self._lock:
+            self._entries[profile_id] = artifact
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[bytes]:
+        with self._lock:
+            return self._entries.get(profile_id)
+
+
+profile_store = ProfileStore()
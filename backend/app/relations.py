@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+"""십신(十神)과 합충형파해(合沖刑破害) 관계 조회표.
+
+모든 관계를 모듈 로드 시 작은 배열로 한 번 만들어 두고, 원국 하나는 배열 조회 십여 번으로 끝냅니다.
+- TEN_GOD_BY_STEM (10, 10): [일간, 상대 천간] -> 십신 인덱스(TEN_GOD_NAMES)
+- BRANCH_RELATION_BITS (12, 12): 지지 쌍 -> 관계 비트(합/충/형/파/해)
+- PILLAR_RELATION_BITS (60, 60): 60갑자 쌍 -> 지지 비트 | 천간합/천간충 비트
+
+배치(`ten_gods_many`, `pillar_relations_many`)는 vectorized 모듈의 (N, 4) 60갑자 인덱스를 받고,
+궁합(compatibility)과 세운/월운(fortune)도 같은 표를 씁니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .saju import BRANCHES, ELEMENTS, HIDDEN_STEMS, STEM_ELEMENT, STEMS, Chart
+from .vectorized import PILLAR_KEYS, SEXAGENARY_BY_STEM_BRANCH
+
+# 일간 기준 오행 관계(같음/내가 생/내가 극/나를 극/나를 생) x 음양(같음/다름)
+TEN_GOD_NAMES = ["비견", "겁재", "식신", "상관", "편재", "정재", "편관", "정관", "편인", "정인"]
+
+COMBINE = 1 << 0  # 육합
+CLASH = 1 << 1  # 충
+PUNISH = 1 << 2  # 형
+BREAK = 1 << 3  # 파
+HARM = 1 << 4  # 해
+STEM_COMBINE = 1 << 5  # 천간합(甲己, 乙庚, 丙辛, 丁壬, 戊癸)
+STEM_CLASH = 1 << 6  # 천간충(甲庚, 乙辛, 丙壬, 丁癸)
+
+RELATION_NAMES = {
+    COMBINE: "combine",
+    CLASH: "clash",
+    PUNISH: "punish",
+    BREAK: "break",
+    HARM: "harm",
+    STEM_COMBINE: "stem_combine",
+    STEM_CLASH: "stem_clash",
+}
+
+# 원국 안에서 비교하는 기둥 쌍(PILLAR_KEYS 인덱스)
+PILLAR_PAIRS = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+
+# 형: 寅巳申(무은지형), 丑戌未(지세지형), 子卯(무례지형), 辰午酉亥(자형)
+_PUNISH_PAIRS = [
+    ("寅", "巳"),
+    ("巳", "申"),
+    ("申", "寅"),
+    ("丑", "戌"),
+    ("戌", "未"),
+    ("未", "丑"),
+    ("子", "卯"),
+    ("辰", "辰"),
+    ("午", "午"),
+    ("酉", "酉"),
+    ("亥", "亥"),
+]
+_BREAK_PAIRS = [("子", "酉"), ("卯", "午"), ("辰", "丑"), ("未", "戌"), ("寅", "亥"), ("巳", "申")]
+_HARM_PAIRS = [("子", "未"), ("丑", "午"), ("寅", "巳"), ("卯", "辰"), ("申", "亥"), ("酉", "戌")]
+
+
+def _ten_god_table() -> np.ndarray:
+    table = np.zeros((10, 10), dtype=np.int8)
+    for day in range(10):
+        day_element = ELEMENTS.index(STEM_ELEMENT[STEMS[day]])
+        for other in range(10):
+            diff = (ELEMENTS.index(STEM_ELEMENT[STEMS[other]]) - day_element) % 5
+            # ELEMENTS 순서(목화토금수)가 상생 순서이므로 diff가 곧 관계입니다.
+            table[day, other] = diff * 2 + (0 if day % 2 == other % 2 else 1)
+    return table
+
+
+def _branch_relation_table() -> np.ndarray:
+    table = np.zeros((12, 12), dtype=np.uint8)
+    for a in range(12):
+        for b in range(12):
+            if (a + b) % 12 == 1:
+                table[a, b] |= COMBINE
+            if (a - b) % 12 == 6:
+                table[a, b] |= CLASH
+    for pairs, bit in ((_PUNISH_PAIRS, PUNISH), (_BREAK_PAIRS, BREAK), (_HARM_PAIRS, HARM)):
+        for x, y in pairs:
+            a, b = BRANCHES.index(x), BRANCHES.index(y)
+            table[a, b] |= bit
+            table[b, a] |= bit
+    return table
+
+
+def _stem_relation_table() -> np.ndarray:
+    table = np.zeros((10, 10), dtype=np.uint8)
+    for a in range(10):
+        for b in range(10):
+            if (a - b) % 10 == 5:
+                table[a, b] |= STEM_COMBINE
+            # 충은 7번째 천간끼리(甲庚, 乙辛, 丙壬, 丁癸). 戊己(토)는 충이 없습니다.
+            if abs(a - b) == 6:
+                table[a, b] |= STEM_CLASH
+    return table
+
+
+TEN_GOD_BY_STEM = _ten_god_table()
+BRANCH_RELATION_BITS = _branch_relation_table()
+STEM_RELATION_BITS = _stem_relation_table()
+# 지지의 본기(지장간 첫 번째) 천간 인덱스
+BRANCH_MAIN_STEM = np.array([STEMS.index(HIDDEN_STEMS[b][0][0]) for b in BRANCHES], dtype=np.int8)
+
+_SEXAGENARY = np.arange(60)
+PILLAR_RELATION_BITS = (
+    STEM_RELATION_BITS[(_SEXAGENARY % 10)[:, None], (_SEXAGENARY % 10)[None, :]]
+    | BRANCH_RELATION_BITS[(_SEXAGENARY % 12)[:, None], (_SEXAGENARY % 12)[None, :]]
+)
+
+
+@dataclass
+class TenGods:
+    stem: str
+    branch: str
+
+
+@dataclass
+class PillarRelation:
+    first: str
+    second: str
+    relations: List[str]
+
+
+def relation_names(bits: int) -> List[str]:
+    return [name for bit, name in RELATION_NAMES.items() if bits & bit]
+
+
+def chart_indices(chart: Chart) -> np.ndarray:
+    """Chart -> (4,) 60갑자 인덱스(시주 미상은 -1)."""
+
+    pillars = [chart.year, chart.month, chart.day, chart.hour]
+    return np.array(
+        [
+            -1 if p is None else int(SEXAGENARY_BY_STEM_BRANCH[STEMS.index(p.stem), BRANCHES.index(p.branch)])
+            for p in pillars
+        ],
+        dtype=np.int16,
+    )
+
+
+def _chart_index_list(chart: Chart) -> List[Optional[int]]:
+    return [None if index < 0 else int(index) for index in chart_indices(chart)]
+
+
+def ten_gods(chart: Chart) -> Dict[str, Optional[TenGods]]:
+    """기둥별 (천간 십신, 지지 본기 십신). 일간 자리는 "일간", 시주 미상은 None."""
+
+    indices = _chart_index_list(chart)
+    day_stem = indices[2] % 10
+    result: Dict[str, Optional[TenGods]] = {}
+    for key, index in zip(PILLAR_KEYS, indices):
+        if index is None:
+            result[key] = None
+            continue
+        stem_god = "일간" if key == "day" else TEN_GOD_NAMES[TEN_GOD_BY_STEM[day_stem, index % 10]]
+        branch_god = TEN_GOD_NAMES[TEN_GOD_BY_STEM[day_stem, BRANCH_MAIN_STEM[index % 12]]]
+        result[key] = TenGods(stem=stem_god, branch=branch_god)
+    return result
+
+
+def pillar_relations(chart: Chart) -> List[PillarRelation]:
+    """원국 기둥 쌍 사이의 천간합/충, 지지 합충형파해(관계가 있는 쌍만)."""
+
+    indices = _chart_index_list(chart)
+    result = []
+    for a, b in PILLAR_PAIRS:
+        if indices[a] is None or indices[b] is None:
+            continue
+        names = relation_names(int(PILLAR_RELATION_BITS[indices[a], indices[b]]))
+        if names:
+            result.append(PillarRelation(first=PILLAR_KEYS[a], second=PILLAR_KEYS[b], relations=names))
+    return result
+
+
+def ten_gods_many(indices: np.ndarray) -> np.ndarray:
+    """(N, 4) 60갑자 인덱스 -> (N, 4, 2) 십신 인덱스([..., 0] 천간, [..., 1] 지지 본기).
+
+    시주 미상(-1)은 -1. 일간 자리는 일간 자신과의 관계(비견, 0)입니다.
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    known = indices >= 0
+    safe = np.where(known, indices, 0)
+    day_stem = (safe[:, 2] % 10)[:, None]
+    stem_gods = TEN_GOD_BY_STEM[day_stem, safe % 10]
+    branch_gods = TEN_GOD_BY_STEM[day_stem, BRANCH_MAIN_STEM[safe % 12]]
+    result = np.stack([stem_gods, branch_gods], axis=2)
+    result[~known] = -1
+    return result
+
+
+def pillar_relations_many(indices: np.ndarray) -> np.ndarray:
+    """(N, 4) 60갑자 인덱스 -> (N, 6) 관계 비트(PILLAR_PAIRS 순서). 시주 미상 쌍은 0."""
+
+    indices = np.asarray(indices, dtype=np.int64)
+    known = indices >= 0
+    safe = np.where(known, indices, 0)
+    first = np.array([a for a, _ in PILLAR_PAIRS])
+    second = np.array([b for _, b in PILLAR_PAIRS])
+    bits = PILLAR_RELATION_BITS[safe[:, first], safe[:, second]]
+    return np.where(known[:, first] & known[:, second], bits, 0).astype(np.uint8)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+"""차트 응답 캐시: 정규화된 입력 + 엔진 버전 -> ETag -> 응답 본문.
+
+- 차트 결과는 입력과 엔진(코드 버전 + 절기 테이블) 버전만의 결정적 함수입니다.
+- `canonical_query`는 입력 모델을 기본값을 뺀 키 정렬 쿼리 문자열로 만듭니다.
+  같은 입력이면 GET/POST, 필드 순서와 상관없이 같은 문자열(= 같은 ETag)이 됩니다.
+- `ResponseCache`는 ETag -> JSON 본문 바이트의 LRU이며, 항목 수와 총 바이트 수 두 한도로 축출합니다.
+  - SAJU_RESPONSE_CACHE_ENTRIES(기본 4096), SAJU_RESPONSE_CACHE_BYTES(기본 64MB). 0이면 캐시 끔
+- 본문 표현(JSON/msgpack)이 다르면 ETag도 다릅니다(`etag_for`의 variant).
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, Optional
+from urllib.parse import urlencode
+
+from pydantic import BaseModel
+
+from .metrics import CACHE_REQUESTS
+
+API_VERSION = "0.1.0"
+CACHE_CONTROL = "public, max-age=86400"
+
+
+@lru_cache(maxsize=1)
+def engine_version() -> str:
+    """코드 버전 + 절기 테이블 지문. 테이블을 쓸 수 없으면(폴백 엔진) 'fallback'."""
+
+    from .solar_term_table import solar_term_table_or_none
+
+    table = solar_term_table_or_none()
+    if table is None:
+        return f"{API_VERSION}+fallback"
+    digest = hashlib.sha256(table.when_utc.tobytes() + table.longitude_deg.tobytes()).hexdigest()[:12]
+    return f"{API_VERSION}+{digest}"
+
+
+def _query_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(_query_value(v) for v in value)
+    return str(value)
+
+
+def canonical_query(payload: BaseModel, exclude: Iterable[str] = ()) -> str:
+    """기본값이 아닌 필드만 키 순서로 정렬한 쿼리 문자열. exclude는 응답에 영향이 없는 필드."""
+
+    values = payload.model_dump(exclude_defaults=True, exclude=set(exclude))
+    return urlencode(sorted((key, _query_value(value)) for key, value in values.items() if value is not None))
+
+
+def etag_for(path: str, canonical: str, variant: str = "") -> str:
+    """variant는 같은 결과의 다른 표현(예: msgpack). 표현마다 ETag와 캐시 항목이 따로입니다."""
+
+    key = f"{path}?{canonical}|{engine_version()}"
+    if variant:
+        key += f"|{variant}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        return cls(
+            max_entries=max(0, int(os.environ.get("SAJU_RESPONSE_CACHE_ENTRIES", "4096"))),
+            max_bytes=max(0, int(os.environ.get("SAJU_RESPONSE_CACHE_BYTES", str(64 * 1024 * 1024)))),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc(cache="response", result="miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        CACHE_REQUESTS.inc(cache="response", result="hit")
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+response_cache = ResponseCache.from_env()
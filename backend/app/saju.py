@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from .civil_time import civil_time_table_for_zone, is_known_zone, local_wall_to_kst, to_fixed_kst
+from .lunar_calendar import lunar_to_solar
+from .metrics import FALLBACKS, STAGE_SECONDS
+from .solar_time import to_true_solar_time, true_solar_correction_minutes
 from .solar_terms import (
+    SolarTermCrossing,
     find_junggi_crossings_for_kst_date,
     find_last_junggi_before_kst,
     find_last_crossing_before_kst,
@@ -74,19 +79,46 @@ ELEMENTS = ["wood", "fire", "earth", "metal", "water"]
 
 
 def _normalize_timezone(timezone: Optional[str]) -> Tuple[str, Optional[str]]:
-    """현재 구현은 KST(Asia/Seoul) 기준으로만 정확도를 보장합니다.
+    """입력 timezone을 IANA 이름으로 정규화합니다.
 
     반환:
-    - tz: 사용할 timezone 문자열(항상 Asia/Seoul)
-    - warning: 지원하지 않는 tz가 들어온 경우 경고 메시지
+    - tz: 사용할 timezone 문자열(비어 있거나 알 수 없으면 Asia/Seoul)
+    - warning: 알 수 없는 tz가 들어온 경우 경고 메시지
     """
 
     if not timezone:
         return "Asia/Seoul", None
     tz = timezone.strip()
-    if tz == "Asia/Seoul":
+    if tz == "Asia/Seoul" or is_known_zone(tz):
         return tz, None
-    return "Asia/Seoul", f"timezone={tz}은(는) 현재 미지원이라 KST(Asia/Seoul)로 계산했습니다"
+    return "Asia/Seoul", f"timezone={tz}은(는) 알 수 없는 타임존이라 KST(Asia/Seoul)로 계산했습니다"
+
+
+def _local_wall_to_kst(wall: datetime, timezone: str) -> datetime:
+    """출생지 벽시계(naive) -> 같은 순간의 KST aware datetime.
+
+    Asia/Seoul은 기존과 같이 고정 KST로 봅니다(역사적 오프셋은 historical_offset에서 처리).
+    """
+
+    from .solar_terms import KST
+
+    if timezone == "Asia/Seoul":
+        return wall.replace(tzinfo=KST)
+    return local_wall_to_kst(wall, civil_time_table_for_zone(timezone))
+
+
+def apply_historical_offset(
+    birth_date: date, birth_time: Optional[str], timezone: str, historical_offset: bool
+) -> Tuple[date, Optional[str], Optional[str]]:
+    """historical_offset=True이고 Asia/Seoul이면 출생 당시 한국 민간 시각을 고정 KST로 보정합니다.
+
+    다른 타임존은 전환 배열에 이미 역사적 오프셋이 들어 있으므로 그대로 둡니다.
+    반환: (날짜, 시각, 보정 안내 문구 또는 None)
+    """
+
+    if historical_offset and timezone == "Asia/Seoul":
+        return to_fixed_kst(birth_date, birth_time)
+    return birth_date, birth_time, None
 
 
 def _normalize_calendar_type(value: Optional[str]) -> str:
@@ -96,6 +128,24 @@ def _normalize_calendar_type(value: Optional[str]) -> str:
     return value if value in {"SOLAR", "LUNAR"} else "SOLAR"
 
 
+def resolve_birth_date(
+    birth_date: Union[date, Tuple[int, int, int]], calendar_type: Optional[str], is_leap_month: bool = False
+) -> date:
+    """입력 생년월일을 양력 날짜로 정규화합니다.
+
+    - SOLAR: 그대로 반환((연, 월, 일) 튜플이면 date로 만들고, 없는 날짜는 ValueError)
+    - LUNAR: birth_date의 (연, 월, 일)을 음력으로 보고 양력으로 변환(표 조회, O(1))
+      존재하지 않는 음력 날짜(30일이 없는 달, 윤달이 없는 해 등)는 ValueError
+      음력 2월 30일처럼 양력 달력에 없는 날짜는 튜플로 넘깁니다.
+    """
+
+    if _normalize_calendar_type(calendar_type) == "SOLAR":
+        return birth_date if isinstance(birth_date, date) else date(*birth_date)
+    if isinstance(birth_date, date):
+        return lunar_to_solar(birth_date.year, birth_date.month, birth_date.day, is_leap_month)
+    return lunar_to_solar(*birth_date, is_leap_month)
+
+
 @dataclass
 class Pillar:
     stem: str
@@ -210,7 +260,13 @@ def _solar_term_month_index_for_kst_datetime(dt_kst: datetime) -> int:
         # 최후의 폴백(의존성 누락 등)
         return ((dt_kst.month - 1) % 12) + 1
 
-    k15 = int(round((last15.target_longitude_deg % 360.0) / 15.0))
+    return _month_index_from_jeolgi_longitude(last15.target_longitude_deg)
+
+
+def _month_index_from_jeolgi_longitude(longitude_deg: float) -> int:
+    """가장 최근 15° 절기 경계의 황경으로 절기월 인덱스(寅월=1)를 구합니다."""
+
+    k15 = int(round((longitude_deg % 360.0) / 15.0))
     # 입춘(315°=21*15)을 寅월 시작으로 두고, 15° 경계 2개를 한 달로 묶는다.
     month_index = (((k15 - 21) % 24) // 2) + 1
     return int(month_index)
@@ -240,7 +296,13 @@ def _junggi_month_index_for_kst_datetime(dt_kst: datetime) -> int:
     if not last30:
         return ((dt_kst.month - 1) % 12) + 1
 
-    k30 = int(round((last30.target_longitude_deg % 360.0) / 30.0))
+    return _month_index_from_junggi_longitude(last30.target_longitude_deg)
+
+
+def _month_index_from_junggi_longitude(longitude_deg: float) -> int:
+    """가장 최근 30° 중기 경계의 황경으로 중기 기반 월 인덱스(寅월=1)를 구합니다."""
+
+    k30 = int(round((longitude_deg % 360.0) / 30.0))
     # 입춘(315°)은 중기 격자에 없으므로, 중기 기반에서는 대한(300°) 이후 ~ 우수(330°)를
     # 寅월로 보도록 300°를 寅월 시작점으로 둔다.
     # 300°=10*30
@@ -264,35 +326,34 @@ def calculate_month_pillars_policy_c(
     정책 C:
     - 출생시간 미상(birth_time=None) AND 해당 KST 날짜에 절기 경계가 존재하면
       경계 이전/이후 두 월주 후보를 반환합니다.
-    """
 
-    if timezone != "Asia/Seoul":
-        # 현재는 KST 고정 구현(요구사항의 중심).
-        # 타임존 확장은 후속으로 진행.
-        pass
+    year_stem_index는 출생 시각(시간 미상이면 그 날짜 23:59:59) 기준 연간입니다.
+    입춘 당일의 경계 이전 후보는 전년 연간으로 월간을 정합니다(만세력 달력의 00:00 월주와 같음).
+    """
 
+    # 날짜 창/출생 시각은 timezone의 현지 벽시계로 보고, 경계 비교는 실제 순간(KST 표기)으로 합니다.
+    timezone, _ = _normalize_timezone(timezone)
     # 절기 엔진이 사용 불가한 환경(의존성 누락, ephemeris 로드 실패 등)에서도
     # 서버가 죽지 않도록 정책 C 로직 역시 안전하게 폴백합니다.
     # 정책 C의 경계는 월주 기준과 동일하게 '15° 절기 경계'를 사용합니다.
     try:
-        from .solar_terms import find_crossings_for_kst_date
+        from .solar_terms import find_crossings_for_local_date
 
-        crossings = find_crossings_for_kst_date(birth_date)
+        crossings = find_crossings_for_local_date(birth_date, timezone)
     except Exception:
         crossings = []
     has_boundary = len(crossings) > 0
 
     # birth_time이 있으면 단일 시각으로 절기월 판정
-    def pillar_for_month_index(month_index_1_to_12: int) -> Pillar:
+    def pillar_for_month_index(month_index_1_to_12: int, stem_index: int = year_stem_index) -> Pillar:
         branch = BRANCHES[_month_branch_index_from_solar_term_month(month_index_1_to_12)]
-        stem = STEMS[_month_stem_index(year_stem_index, month_index_1_to_12)]
+        stem = STEMS[_month_stem_index(stem_index, month_index_1_to_12)]
         return Pillar(stem=stem, branch=branch)
 
-
     if birth_time:
         hour, minute = [int(x) for x in birth_time.split(":")[:2]]
-        dt_kst = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute, 0)
-        month_index = _solar_term_month_index_for_kst_datetime(dt_kst)
+        wall = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute, 0)
+        month_index = _solar_term_month_index_for_kst_datetime(_local_wall_to_kst(wall, timezone))
         return [pillar_for_month_index(month_index)], False
 
     if not has_boundary:
@@ -300,17 +361,21 @@ def calculate_month_pillars_policy_c(
         # 시간 미상이라도 '그 날짜 안'에서 절기월이 바뀌지 않는다는 뜻이므로,
         # 양력 월 기반이 아니라 '가장 최근 중기'를 추적해 절기월을 확정합니다.
         # (의존성 누락 등으로 중기 추적이 불가능하면 내부 함수에서 폴백 처리)
-        dt_kst = datetime(birth_date.year, birth_date.month, birth_date.day, 23, 59, 59)
-        month_index = _solar_term_month_index_for_kst_datetime(dt_kst)
+        wall = datetime(birth_date.year, birth_date.month, birth_date.day, 23, 59, 59)
+        month_index = _solar_term_month_index_for_kst_datetime(_local_wall_to_kst(wall, timezone))
         return [pillar_for_month_index(month_index)], False
 
     # 경계가 있는 날 + 시간 미상: 후보 2개(경계 전/후)
-    boundary = sorted(crossings, key=lambda c: c.when_kst)[0].when_kst
+    first = sorted(crossings, key=lambda c: c.when_kst)[0]
+    boundary = first.when_kst
     before_dt = boundary - timedelta(seconds=1)
     after_dt = boundary + timedelta(seconds=1)
     before_month = _solar_term_month_index_for_kst_datetime(before_dt)
     after_month = _solar_term_month_index_for_kst_datetime(after_dt)
-    return [pillar_for_month_index(before_month), pillar_for_month_index(after_month)], True
+    # 입춘(315°) 경계면 연주도 함께 바뀌므로 경계 이전 후보는 전년 연간을 씁니다.
+    is_ipchun = abs(float(first.target_longitude_deg % 360.0) - 315.0) < 1e-6
+    before_stem_index = (year_stem_index - 1) % 10 if is_ipchun else year_stem_index
+    return [pillar_for_month_index(before_month, before_stem_index), pillar_for_month_index(after_month)], True
 
 
 def _stem_branch_from_index(index: int) -> Pillar:
@@ -319,18 +384,20 @@ def _stem_branch_from_index(index: int) -> Pillar:
     return Pillar(stem=stem, branch=branch)
 
 
-def _hour_branch_index(hour: int, minute: int = 0) -> int:
+def _hour_branch_index(hour: int, minute: int = 0, *, odd_hour_inclusive: bool = True) -> int:
     """시주 지지 인덱스(0=子..11=亥).
 
     기준 앱 정합을 위해 '정각 경계 포함'을 다음처럼 처리합니다.
     - 23:00은 子시로 둔다(일주 경계와 일치)
     - 그 외 홀수시 정각(예: 15:00)은 다음 시각으로 넘기지 않고 직전 2시간 구간에 포함
       (예: 15:00 -> 未시)
+
+    odd_hour_inclusive=False면 홀수시 정각을 다음 시지의 시작으로 봅니다(15:00 -> 申시).
     """
 
     if hour == 23:
         return 0
-    if minute == 0 and (hour % 2 == 1):
+    if odd_hour_inclusive and minute == 0 and (hour % 2 == 1):
         hour -= 1
     return ((hour + 1) // 2) % 12
 
@@ -371,6 +438,39 @@ def _hour_stem_index(day_stem_index: int, hour_index: int) -> int:
     return (day_stem_index * 2 + hour_index) % 10
 
 
+def _year_date_for_pillar(birth_date: date, birth_time: Optional[str], *, timezone: str = "Asia/Seoul") -> date:
+    """연주 산정에 사용할 기준 날짜(입춘 이전 출생이면 전년)를 반환합니다."""
+
+    # 연주(年柱) 산정: '입춘(立春)'을 새해 경계로 보는 만세력 구현이 일반적이며,
+    # 기준 앱 역시 1993-02-04 입춘 절입 전(04:36)에 壬申年으로 표기합니다.
+    # 따라서 해당 시각 이전의 가장 최근 입춘이 전년도 입춘이면(1월~입춘 전)
+    # 연도를 1년 당겨 연주를 계산합니다.
+    # 시간 미상이면 월주 대표값(경계 이후)과 같게 그 날짜의 끝(23:59:59)을 기준으로 봅니다.
+    # timezone이 KST가 아니면 현지 벽시계를 같은 순간의 KST로 바꿔 판정합니다.
+    year_date = birth_date
+    try:
+        if birth_time:
+            hh, mm = [int(x) for x in birth_time.split(":")[:2]]
+            wall = datetime(birth_date.year, birth_date.month, birth_date.day, hh, mm)
+        else:
+            wall = datetime(birth_date.year, birth_date.month, birth_date.day, 23, 59, 59)
+        from .solar_terms import find_last_ipchun_before_kst
+
+        dt_kst = _local_wall_to_kst(wall, timezone)
+        year_date = dt_kst.date()
+        ipchun = find_last_ipchun_before_kst(dt_kst)
+    except Exception:
+        # 절기 엔진 불능/파싱 실패 시에는 기존(그레고리력) 연도 기준으로 폴백
+        ipchun = None
+
+    if ipchun is None:
+        # 입춘을 못 찾으면 안전하게 그레고리력 연도를 사용
+        return year_date
+    if ipchun.when_kst.year < year_date.year:
+        return year_date.replace(year=year_date.year - 1)
+    return year_date
+
+
 def calculate_chart(
     birth_date: date,
     birth_time: Optional[str],
@@ -378,108 +478,332 @@ def calculate_chart(
     calendar_type: str = "SOLAR",
     is_leap_month: bool = False,
     timezone: str = "Asia/Seoul",
+    historical_offset: bool = False,
+    longitude: Optional[float] = None,
 ) -> Chart:
-    # NOTE: 현재 구현은 프로토타입 수준으로, calendar_type/is_leap_month/timezone을
-    # 실제 변환(음력/절기) 계산에 반영하지 않습니다.
-    # 다음 단계에서 절기월/음력월 모드를 이 파라미터로 구현합니다.
-    _, _ = _normalize_calendar_type(calendar_type), is_leap_month
+    # calendar_type=LUNAR면 birth_date를 음력으로 보고 양력으로 변환한 뒤 계산합니다.
+    # historical_offset=True면 출생 당시 표준시/서머타임 벽시계로 보고 고정 KST로 보정합니다.
+    # longitude가 있으면 일주/시주만 진태양시(경도 + 균시차)로 판정합니다.
+    # timezone이 KST가 아니면 현지 벽시계로 보고, 절기 경계는 실제 순간으로 비교합니다.
+    birth_date = resolve_birth_date(birth_date, calendar_type, is_leap_month)
     timezone, _tz_warn = _normalize_timezone(timezone)
+    birth_date, birth_time, _ = apply_historical_offset(birth_date, birth_time, timezone, historical_offset)
 
-    # 전통 만세력 규칙: 하루 시작을 자시(23:00)로 보기도 함.
-    # 23:00~23:59 출생은 일주(일간/일지) 계산에서 다음날로 보정.
-    day_date_for_pillar = birth_date
-    if birth_time:
-        try:
-            birth_hour = int(birth_time.split(":")[0])
-        except ValueError:
-            birth_hour = -1
-        if birth_hour == 23:
-            day_date_for_pillar = birth_date + timedelta(days=1)
+    lookups = _chart_lookups(birth_date, birth_time, timezone=timezone, longitude=longitude)
+    return _chart_for_policy(lookups, DEFAULT_POLICY)
 
-    # 연주(年柱) 산정: '입춘(立春)'을 새해 경계로 보는 만세력 구현이 일반적이며,
-    # 기준 앱 역시 1993-02-04 입춘 절입 전(04:36)에 壬申年으로 표기합니다.
-    # 따라서 birth_time이 주어진 경우, 해당 시각이 '그 해 입춘 시각' 이전이면
-    # 연도를 1년 당겨 연주를 계산합니다.
-    year_date_for_pillar = birth_date
-    if birth_time:
-        try:
-            hh, mm = [int(x) for x in birth_time.split(":")[:2]]
-            dt_kst = datetime(birth_date.year, birth_date.month, birth_date.day, hh, mm)
-            from .solar_terms import KST, find_crossings_for_kst_date, find_last_crossing_before_kst
-
-            dt_kst = dt_kst.replace(tzinfo=KST)
-
-            # 1) 가능한 경우: '그 날짜'에 입춘(315°) crossing이 있으면 그 시각과 비교
-            ipchun_dt = None
-            for c in find_crossings_for_kst_date(birth_date):
-                if abs(float(c.target_longitude_deg % 360.0) - 315.0) < 1e-6:
-                    ipchun_dt = c.when_kst
-                    break
-
-            if ipchun_dt is not None:
-                if dt_kst < ipchun_dt:
-                    year_date_for_pillar = birth_date.replace(year=birth_date.year - 1)
-            else:
-                # 2) 일반적인 날(입춘 crossing이 '오늘'에 없음):
-                #    dt_kst 이전의 가장 최근 입춘(315°) crossing 시각을 찾아,
-                #    그 시각 이전이면 전년, 이후면 당해로 둡니다.
-                probe_dt = dt_kst
-                ipchun_before = None
-                for _ in range(80):
-                    last15 = find_last_crossing_before_kst(probe_dt)
-                    if not last15:
-                        break
-                    last_deg = float(last15.target_longitude_deg % 360.0)
-                    if abs(last_deg - 315.0) < 1e-6:
-                        ipchun_before = last15.when_kst
-                        break
-                    probe_dt = last15.when_kst - timedelta(seconds=1)
-
-                if ipchun_before is None:
-                    # 입춘을 못 찾으면 안전하게 그레고리력 연도를 사용
-                    year_date_for_pillar = birth_date
-                else:
-                    if dt_kst < ipchun_before:
-                        year_date_for_pillar = birth_date.replace(year=birth_date.year - 1)
-        except Exception:
-            # 절기 엔진 불능/파싱 실패 시에는 기존(그레고리력) 연도 기준으로 폴백
-            year_date_for_pillar = birth_date
-
-    year_index = _year_index(year_date_for_pillar)
-    year_pillar = _stem_branch_from_index(year_index)
-
-    # 절기월 기반 월지(지지)를 계산
-    # - birth_time이 있으면 해당 시각으로 절기월을 확정
-    # - birth_time이 없으면 정책 C가 필요하지만, Chart는 단일 월주만 담을 수 있어
-    #   여기서는 "대표값"으로 경계 이후(month_index after)를 사용합니다.
-    year_stem_index = year_index % 10
-
-    month_pillar_candidates, month_uncertain = calculate_month_pillars_policy_c(
-        birth_date,
-        birth_time,
-        year_stem_index,
+
+@dataclass(frozen=True)
+class ChartPolicy:
+    """만세력 구현마다 해석이 갈리는 산출 규칙 묶음(정책 세트).
+
+    - month_boundary: "jeolgi"(15° 절기 경계 2개 묶음, 기본) 또는 "junggi"(30° 중기 경계)
+    - zi_day_rollover: 23:00~23:59 출생을 다음날 일주로 볼지(기본 True)
+      False면 일주는 당일로 두고, 시간(時干)만 다음날 일간 기준 子시로 둡니다(야자시).
+    - odd_hour_inclusive: 홀수시 정각(예: 15:00)을 직전 시지에 포함할지(기본 True)
+    """
+
+    name: str
+    month_boundary: str = "jeolgi"
+    zi_day_rollover: bool = True
+    odd_hour_inclusive: bool = True
+
+
+DEFAULT_POLICY = ChartPolicy(name="default")
+
+POLICY_PRESETS: Dict[str, ChartPolicy] = {
+    policy.name: policy
+    for policy in (
+        DEFAULT_POLICY,
+        ChartPolicy(name="junggi_month", month_boundary="junggi"),
+        ChartPolicy(name="midnight_day", zi_day_rollover=False),
+        ChartPolicy(name="strict_hour", odd_hour_inclusive=False),
+    )
+}
+
+MONTH_BOUNDARIES = ("jeolgi", "junggi")
+
+
+@dataclass
+class PolicyComparison:
+    charts: Dict[str, Chart]
+    divergent_pillars: List[str]
+
+
+@dataclass
+class _ChartLookups:
+    """정책과 무관한 조회 결과(입춘 판정, 절기 경계 조회)를 한 입력에 대해 공유합니다."""
+
+    birth_date: date
+    birth_time: Optional[str]
+    timezone: str
+    hour: Optional[int]
+    minute: int
+    year_pillar: Pillar
+    year_stem_index: int
+    # 일주/시주용 시각(진태양시 보정 시 보정된 값, 아니면 birth_date/hour/minute와 같음)
+    day_date: date
+    day_hour: Optional[int]
+    day_minute: int
+    month_pillars: Dict[str, Pillar] = field(default_factory=dict)
+
+    def month_pillar(self, month_boundary: str) -> Pillar:
+        if month_boundary not in self.month_pillars:
+            self.month_pillars[month_boundary] = self._compute_month_pillar(month_boundary)
+        return self.month_pillars[month_boundary]
+
+    def _compute_month_pillar(self, month_boundary: str) -> Pillar:
+        if month_boundary == "jeolgi":
+            # 시간 미상이면 정책 C 후보 중 "대표값"(경계 이후)을 사용합니다.
+            candidates, _ = calculate_month_pillars_policy_c(
+                self.birth_date,
+                self.birth_time,
+                self.year_stem_index,
+                timezone=self.timezone,
+            )
+            return candidates[-1]
+
+        d = self.birth_date
+        if self.hour is None:
+            wall = datetime(d.year, d.month, d.day, 23, 59, 59)
+        else:
+            wall = datetime(d.year, d.month, d.day, self.hour, self.minute, 0)
+        month_index = _junggi_month_index_for_kst_datetime(_local_wall_to_kst(wall, self.timezone))
+        return Pillar(
+            stem=STEMS[_month_stem_index(self.year_stem_index, month_index)],
+            branch=BRANCHES[_month_branch_index_from_solar_term_month(month_index)],
+        )
+
+
+def _parse_birth_time(birth_time: Optional[str]) -> Tuple[Optional[int], int]:
+    """"HH:MM" -> (시, 분). 시간 미상이면 (None, 0)."""
+
+    if not birth_time:
+        return None, 0
+    parts = birth_time.split(":")
+    return int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
+
+
+def _day_pillar_time(
+    birth_date: date, hour: Optional[int], minute: int, *, timezone: str, longitude: Optional[float] = None
+) -> Tuple[date, Optional[int], int]:
+    """일주/시주용 (날짜, 시, 분).
+
+    기본은 출생지 벽시계. KST 외 타임존은 서머타임을 뺀 현지 표준시,
+    경도가 있으면 실제 순간 기준 진태양시를 씁니다.
+    """
+
+    if hour is None or (longitude is None and timezone == "Asia/Seoul"):
+        return birth_date, hour, minute
+    wall = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute)
+    if longitude is not None:
+        dt_kst = _local_wall_to_kst(wall, timezone)
+        day_date, solar_time = to_true_solar_time(dt_kst.date(), f"{dt_kst:%H:%M}", longitude)
+        day_hour, day_minute = [int(x) for x in solar_time.split(":")]
+        return day_date, day_hour, day_minute
+    _, dst = civil_time_table_for_zone(timezone).offset_and_dst_at_wall(wall)
+    standard = wall - timedelta(seconds=dst)
+    return standard.date(), standard.hour, standard.minute
+
+
+def _chart_lookups(
+    birth_date: date,
+    birth_time: Optional[str],
+    *,
+    timezone: str,
+    longitude: Optional[float] = None,
+) -> _ChartLookups:
+    hour, minute = _parse_birth_time(birth_time)
+    day_date, day_hour, day_minute = _day_pillar_time(
+        birth_date, hour, minute, timezone=timezone, longitude=longitude
+    )
+
+    year_index = _year_index(_year_date_for_pillar(birth_date, birth_time, timezone=timezone))
+    return _ChartLookups(
+        birth_date=birth_date,
+        birth_time=birth_time,
         timezone=timezone,
+        hour=hour,
+        minute=minute,
+        year_pillar=_stem_branch_from_index(year_index),
+        year_stem_index=year_index % 10,
+        day_date=day_date,
+        day_hour=day_hour,
+        day_minute=day_minute,
     )
-    _ = month_uncertain
-    representative_month = month_pillar_candidates[-1]
-    month_branch = representative_month.branch
-    month_pillar = Pillar(stem=representative_month.stem, branch=month_branch)
+
+
+def _chart_for_policy(lookups: _ChartLookups, policy: ChartPolicy) -> Chart:
+    # 전통 만세력 규칙: 하루 시작을 자시(23:00)로 보기도 함.
+    # 23:00~23:59 출생은 일주(일간/일지) 계산에서 다음날로 보정.
+    is_zi_night = lookups.day_hour == 23
+    day_date_for_pillar = lookups.day_date
+    if is_zi_night and policy.zi_day_rollover:
+        day_date_for_pillar = lookups.day_date + timedelta(days=1)
 
     day_index = _sexagenary_index_for_day(day_date_for_pillar)
     day_pillar = _stem_branch_from_index(day_index)
 
     hour_pillar: Optional[Pillar] = None
-    if birth_time:
-        parts = birth_time.split(":")
-        hour = int(parts[0])
-        minute = int(parts[1]) if len(parts) > 1 else 0
-        hour_index = _hour_branch_index(hour, minute)
-        hour_branch = BRANCHES[hour_index]
-        day_stem_index = day_index % 10
-        hour_stem = STEMS[_hour_stem_index(day_stem_index, hour_index)]
-        hour_pillar = Pillar(stem=hour_stem, branch=hour_branch)
+    if lookups.day_hour is not None:
+        hour_index = _hour_branch_index(
+            lookups.day_hour, lookups.day_minute, odd_hour_inclusive=policy.odd_hour_inclusive
+        )
+        # 야자시(일주 당일 유지)여도 23시 子시의 시간은 다음날 일간 기준으로 둡니다.
+        stem_day_index = day_index
+        if is_zi_night and not policy.zi_day_rollover:
+            stem_day_index = _sexagenary_index_for_day(lookups.day_date + timedelta(days=1))
+        hour_stem = STEMS[_hour_stem_index(stem_day_index % 10, hour_index)]
+        hour_pillar = Pillar(stem=hour_stem, branch=BRANCHES[hour_index])
+
+    month_pillar = lookups.month_pillar(policy.month_boundary)
+    return Chart(
+        year=lookups.year_pillar,
+        month=Pillar(stem=month_pillar.stem, branch=month_pillar.branch),
+        day=day_pillar,
+        hour=hour_pillar,
+    )
+
+
+def _resolve_policies(policies: Optional[Sequence[Union[str, ChartPolicy]]]) -> List[ChartPolicy]:
+    if not policies:
+        return list(POLICY_PRESETS.values())
+
+    resolved: List[ChartPolicy] = []
+    for policy in policies:
+        if isinstance(policy, str):
+            if policy not in POLICY_PRESETS:
+                raise ValueError(f"unknown policy: {policy}")
+            policy = POLICY_PRESETS[policy]
+        if policy.month_boundary not in MONTH_BOUNDARIES:
+            raise ValueError(f"unknown month_boundary: {policy.month_boundary}")
+        resolved.append(policy)
+    return resolved
+
+
+def evaluate_chart_policies(
+    birth_date: date,
+    birth_time: Optional[str],
+    policies: Optional[Sequence[Union[str, ChartPolicy]]] = None,
+    *,
+    calendar_type: str = "SOLAR",
+    is_leap_month: bool = False,
+    timezone: str = "Asia/Seoul",
+    historical_offset: bool = False,
+    longitude: Optional[float] = None,
+) -> PolicyComparison:
+    """같은 입력을 여러 정책 세트로 한 번에 계산하고, 정책 간 갈리는 기둥을 표시합니다.
+
+    절기 엔진 조회(입춘 판정, 15°/30° 최근 경계, 정책 C 경계)는 정책 수와 무관하게
+    입력당 한 번씩만 수행되고, 정책별로는 규칙 적용만 달라집니다.
+    policies를 생략하면 POLICY_PRESETS 전체를 평가합니다.
+    """
+
+    resolved = _resolve_policies(policies)
+    birth_date = resolve_birth_date(birth_date, calendar_type, is_leap_month)
+    timezone, _tz_warn = _normalize_timezone(timezone)
+    birth_date, birth_time, _ = apply_historical_offset(birth_date, birth_time, timezone, historical_offset)
+
+    lookups = _chart_lookups(birth_date, birth_time, timezone=timezone, longitude=longitude)
+    charts = {policy.name: _chart_for_policy(lookups, policy) for policy in resolved}
+
+    divergent: List[str] = []
+    for key in ("year", "month", "day", "hour"):
+        values = {
+            (p.stem + p.branch) if p else None for p in (getattr(ch, key) for ch in charts.values())
+        }
+        if len(values) > 1:
+            divergent.append(key)
+
+    return PolicyComparison(charts=charts, divergent_pillars=divergent)
+
+
+@dataclass
+class CalendarDay:
+    """만세력 달력 한 줄(KST 날짜 하루).
+
+    - month_start/month_end, year_start/year_end: 00:00, 23:59 시점의 월주/연주
+    - boundary: 그날 안의 15° 절기 경계(없으면 None)
+    - hour_pillars: 子..亥 12개 시주(그날 일간 기준, 23시 子시는 다음날 일주를 따름)
+    """
 
-    return Chart(year=year_pillar, month=month_pillar, day=day_pillar, hour=hour_pillar)
+    date: date
+    day: Pillar
+    year_start: Pillar
+    year_end: Pillar
+    month_start: Pillar
+    month_end: Pillar
+    boundary: Optional[SolarTermCrossing]
+    hour_pillars: List[Pillar]
+
+
+def iter_calendar_days(start: date, end: date) -> Iterator[CalendarDay]:
+    """[start, end] 범위의 만세력을 하루씩 생성합니다(메모리 사용량 일정).
+
+    calculate_chart를 날마다 호출하지 않고, 사전 계산 절기 테이블을 커서로 훑으며
+    일주/시주는 날짜 산술로, 월주/연주는 테이블 경계로 산출합니다.
+    범위가 테이블 구간을 벗어나면 ValueError, 절기 엔진을 쓸 수 없으면 RuntimeError.
+    """
+
+    from .solar_terms import KST
+    from .solar_term_table import solar_term_table_or_none
+
+    if end < start:
+        raise ValueError("end must not be before start")
+
+    table = solar_term_table_or_none()
+    if table is None:
+        raise RuntimeError("solar term table is unavailable")
+    first, last = table.date_range()
+    if start < first or end > last:
+        raise ValueError(f"calendar range must be within {first.isoformat()}..{last.isoformat()}")
+
+    when_utc = table.when_utc
+    longitudes = table.longitude_deg
+    cursor = table.last_index_at_or_before(datetime(start.year, start.month, start.day, tzinfo=KST))
+
+    def month_and_year(ts: float, year: int) -> Tuple[Pillar, Pillar]:
+        nonlocal cursor
+        while cursor + 1 < len(when_utc) and when_utc[cursor + 1] <= ts:
+            cursor += 1
+        ipchun = table.ipchun_utc_by_year.get(year)
+        if ipchun is not None and ts < ipchun:
+            year -= 1
+        year_index = _year_index(date(year, 1, 1))
+        month_index = _month_index_from_jeolgi_longitude(float(longitudes[cursor]))
+        month = Pillar(
+            stem=STEMS[_month_stem_index(year_index % 10, month_index)],
+            branch=BRANCHES[_month_branch_index_from_solar_term_month(month_index)],
+        )
+        return month, _stem_branch_from_index(year_index)
+
+    d = start
+    while d <= end:
+        day_start = datetime(d.year, d.month, d.day, tzinfo=KST).timestamp()
+        month_start, year_start = month_and_year(day_start, d.year)
+        boundary_index = cursor if when_utc[cursor] >= day_start else cursor + 1
+        month_end, year_end = month_and_year(day_start + 86340.0, d.year)  # 23:59
+
+        boundary = None
+        if boundary_index < len(when_utc) and when_utc[boundary_index] < day_start + 86400.0:
+            boundary = table.crossing(boundary_index)
+
+        day_index = _sexagenary_index_for_day(d)
+        day_stem_index = day_index % 10
+        yield CalendarDay(
+            date=d,
+            day=_stem_branch_from_index(day_index),
+            year_start=year_start,
+            year_end=year_end,
+            month_start=month_start,
+            month_end=month_end,
+            boundary=boundary,
+            hour_pillars=[
+                Pillar(stem=STEMS[_hour_stem_index(day_stem_index, h)], branch=BRANCHES[h])
+                for h in range(12)
+            ],
+        )
+        d += timedelta(days=1)
 
 
 def _add_score(scores: Dict[str, float], element: str, value: float) -> None:
@@ -541,26 +865,59 @@ def calculate_elements(chart: Chart) -> ElementScore:
     )
 
 
+# 오행별 고정 문구. 응답 직렬화(serialization 모듈)가 요소별로 미리 인코딩해 둡니다.
+ROUTINES_BY_ELEMENT: Dict[str, List[str]] = {
+    "wood": ["아침 산책", "스트레칭", "녹색 채소 섭취", "성장 목표 설정"],
+    "fire": ["아침 햇빛 노출", "심박수 운동", "따뜻한 식사", "오전 집중 작업"],
+    "earth": ["정리정돈 10분", "규칙적인 식사", "토성색 의상", "마음 안정 호흡"],
+    "metal": ["집중 작업 25분", "호흡 정리", "하얀색 포인트", "필요 없는 것 버리기"],
+    "water": ["수분 섭취", "저녁 산책", "일기 작성", "차분한 음악"],
+}
+
+
 def _routine_for_element(element: str) -> List[str]:
-    routines = {
-        "wood": ["아침 산책", "스트레칭", "녹색 채소 섭취", "성장 목표 설정"],
-        "fire": ["아침 햇빛 노출", "심박수 운동", "따뜻한 식사", "오전 집중 작업"],
-        "earth": ["정리정돈 10분", "규칙적인 식사", "토성색 의상", "마음 안정 호흡"],
-        "metal": ["집중 작업 25분", "호흡 정리", "하얀색 포인트", "필요 없는 것 버리기"],
-        "water": ["수분 섭취", "저녁 산책", "일기 작성", "차분한 음악"],
+    return list(ROUTINES_BY_ELEMENT[element])
+
+
+def summary_for_element(element: str) -> Dict[str, str]:
+    """가장 부족한 오행 -> 요약 문구."""
+
+    return {
+        "personality": f"{element} 기운을 보강하면 균형감이 높아집니다.",
+        "money_work": "집중 루틴을 통해 성과를 높이는 흐름이 필요합니다.",
+        "relationships": "호흡을 가다듬고 여유 있는 소통이 도움이 됩니다.",
+        "health": "수면과 식사 리듬을 일정하게 유지하세요.",
     }
-    return routines[element]
 
 
 def analyze(
-    birth_date: date,
+    birth_date: Union[date, Tuple[int, int, int]],
     birth_time: Optional[str],
     *,
     calendar_type: str = "SOLAR",
     is_leap_month: bool = False,
     timezone: str = "Asia/Seoul",
+    historical_offset: bool = False,
+    longitude: Optional[float] = None,
 ) -> AnalysisResult:
     timezone, tz_warn = _normalize_timezone(timezone)
+    lunar_note: Optional[str] = None
+    if _normalize_calendar_type(calendar_type) == "LUNAR":
+        # 음력 입력은 (년, 월, 일)로도 받습니다(음력 2월 30일처럼 양력 달력에 없는 날짜).
+        lunar_year, lunar_month, lunar_day = (
+            (birth_date.year, birth_date.month, birth_date.day) if isinstance(birth_date, date) else birth_date
+        )
+        birth_date = resolve_birth_date(birth_date, calendar_type, is_leap_month)
+        leap_text = "윤" if is_leap_month else ""
+        lunar_note = (
+            f"음력 {lunar_year}-{leap_text}{lunar_month:02d}-{lunar_day:02d}을 "
+            f"양력 {birth_date.isoformat()}로 변환해 계산했습니다"
+        )
+    elif not isinstance(birth_date, date):
+        birth_date = date(*birth_date)
+    birth_date, birth_time, offset_note = apply_historical_offset(
+        birth_date, birth_time, timezone, historical_offset
+    )
 
     solar_warn: Optional[str] = None
     try:
@@ -568,30 +925,29 @@ def analyze(
         # (skyfield/de421 누락 시 예외가 나며, 서비스는 폴백으로 계속 동작)
         _ = find_junggi_crossings_for_kst_date(birth_date)
     except Exception:
+        FALLBACKS.inc(reason="solar_terms_unavailable")
         solar_warn = "절기(중기) 계산 엔진 사용 불가로 간이 규칙(양력 월 기반)으로 폴백했습니다"
 
-    chart = calculate_chart(
-        birth_date,
-        birth_time,
-        calendar_type=calendar_type,
-        is_leap_month=is_leap_month,
-        timezone=timezone,
-    )
-    element_score = calculate_elements(chart)
+    with STAGE_SECONDS.time(stage="chart"):
+        chart = calculate_chart(birth_date, birth_time, timezone=timezone, longitude=longitude)
+    with STAGE_SECONDS.time(stage="scoring"):
+        element_score = calculate_elements(chart)
 
     main_deficiency = element_score.top_deficiencies[0]
     routines = {
         "primary": _routine_for_element(main_deficiency),
     }
 
-    summary = {
-        "personality": f"{main_deficiency} 기운을 보강하면 균형감이 높아집니다.",
-        "money_work": "집중 루틴을 통해 성과를 높이는 흐름이 필요합니다.",
-        "relationships": "호흡을 가다듬고 여유 있는 소통이 도움이 됩니다.",
-        "health": "수면과 식사 리듬을 일정하게 유지하세요.",
-    }
+    summary = summary_for_element(main_deficiency)
 
     notes: List[str] = []
+    if lunar_note:
+        notes.append(lunar_note)
+    if offset_note:
+        notes.append(offset_note)
+    if longitude is not None and birth_time:
+        correction = true_solar_correction_minutes(birth_date, longitude)
+        notes.append(f"일주/시주는 진태양시(경도 {longitude:.2f}°, 보정 {correction:+.0f}분) 기준입니다")
     if tz_warn:
         notes.append(tz_warn)
     if solar_warn:
@@ -630,22 +986,22 @@ def build_original_result(
     calendar_type: str = "SOLAR",
     is_leap_month: bool = False,
     timezone: str = "Asia/Seoul",
+    historical_offset: bool = False,
+    longitude: Optional[float] = None,
 ) -> OriginalResult:
-    chart = calculate_chart(
-        birth_date,
-        birth_time,
-        calendar_type=calendar_type,
-        is_leap_month=is_leap_month,
-        timezone=timezone,
-    )
+    # 원국 표기는 변환된 양력 생년월일(역사적 오프셋 보정 시 보정된 KST) 기준입니다.
+    birth_date = resolve_birth_date(birth_date, calendar_type, is_leap_month)
+    timezone, _tz_warn = _normalize_timezone(timezone)
+    birth_date, birth_time, _ = apply_historical_offset(birth_date, birth_time, timezone, historical_offset)
+    with STAGE_SECONDS.time(stage="chart"):
+        chart = calculate_chart(birth_date, birth_time, timezone=timezone, longitude=longitude)
     title = "四柱八字"
     display_name = name or "未詳"
     birth_date_text = _birth_date_text(birth_date)
 
-    if birth_time:
-        hour = int(birth_time.split(":")[0])
-        hour_branch = BRANCHES[_hour_branch_index(hour)]
-        birth_time_text = f"{hour_branch}時"
+    if chart.hour:
+        # 시주와 같은 규칙(분 단위, 진태양시 보정 포함)으로 표기합니다.
+        birth_time_text = f"{chart.hour.branch}時"
     else:
         birth_time_text = "時柱未詳"
 
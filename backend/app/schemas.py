@@ -13,6 +13,11 @@ class ChartInput(BaseModel):
     calendar_type: str = Field("SOLAR", description="SOLAR or LUNAR")
     is_leap_month: bool = False
     timezone: str = "Asia/Seoul"
+    use_historical_offset: bool = Field(
+        False, description="treat birth_time as the civil time in force then (UTC+8:30 eras, DST)"
+    )
+    longitude: Optional[float] = Field(None, description="birthplace longitude (deg E) for true solar time")
+    city: Optional[str] = Field(None, description="birthplace city name, used when longitude is omitted")
 
 
 class Pillar(BaseModel):
@@ -35,6 +40,33 @@ class ElementScore(BaseModel):
     top_excesses: List[str]
 
 
+class DaeunPillar(BaseModel):
+    age: int
+    start_date: str
+    stem: str
+    branch: str
+
+
+class DaeunSection(BaseModel):
+    direction: str = Field(..., description="forward or backward")
+    start_age: int
+    start_age_years: float
+    term_name: str
+    term_kst: str
+    pillars: List[DaeunPillar]
+
+
+class TenGods(BaseModel):
+    stem: str = Field(..., description="ten god of the stem (일간 for the day stem)")
+    branch: str = Field(..., description="ten god of the branch main hidden stem")
+
+
+class PillarRelation(BaseModel):
+    first: str
+    second: str
+    relations: List[str] = Field(..., description="combine/clash/punish/break/harm/stem_combine/stem_clash")
+
+
 class AnalysisResponse(BaseModel):
     chart: Chart
     month_pillars: Optional[List[Pillar]] = None
@@ -44,6 +76,116 @@ class AnalysisResponse(BaseModel):
     summary: Dict[str, str]
     routines: Dict[str, List[str]]
     accuracy_note: Optional[str]
+    daeun: Optional[DaeunSection] = None
+    ten_gods: Optional[Dict[str, Optional[TenGods]]] = None
+    pillar_relations: List[PillarRelation] = Field(default_factory=list)
+
+
+class PolicyEvaluationInput(ChartInput):
+    policies: Optional[List[str]] = Field(None, description="policy preset names (default: all presets)")
+
+
+class PolicyEvaluationResponse(BaseModel):
+    charts: Dict[str, Chart]
+    divergent_pillars: List[str]
+
+
+class FortuneTimelineInput(ChartInput):
+    years: int = Field(100, ge=1, le=120, description="timeline span from birth in years")
+    include_months: bool = Field(True, description="include monthly (월운) entries")
+
+
+class CompatibilityInput(BaseModel):
+    members: List[ChartInput] = Field(..., min_length=1, max_length=1000)
+    candidates: List[ChartInput] = Field(..., min_length=1, max_length=10000)
+    top_k: int = Field(10, ge=1, le=100)
+
+
+class CompatibilityMatch(BaseModel):
+    candidate: int = Field(..., description="index into candidates")
+    name: Optional[str] = None
+    score: float = Field(..., description="0..100")
+
+
+class CompatibilityRow(BaseModel):
+    member: int = Field(..., description="index into members")
+    matches: List[CompatibilityMatch]
+
+
+class CompatibilityResponse(BaseModel):
+    rows: List[CompatibilityRow]
+
+
+class DailyFeedInput(ChartInput):
+    start_date: Optional[str] = Field(None, description="YYYY-MM-DD (default: today in KST)")
+    days: int = Field(7, ge=1, le=366)
+
+
+class DailyBatchInput(BaseModel):
+    users: List[ChartInput] = Field(..., min_length=1, max_length=1000)
+    target_date: Optional[str] = Field(None, description="YYYY-MM-DD (default: tomorrow in KST)")
+
+
+class DailyFortune(BaseModel):
+    date: str
+    stem: str
+    branch: str
+    ten_god: str
+    relations: Dict[str, List[str]] = Field(..., description="natal pillar key -> relations with the day pillar")
+    element_delta: Dict[str, float] = Field(..., description="element share change in percentage points")
+    balance_delta: float
+
+
+class DailyFeedResponse(BaseModel):
+    days: List[DailyFortune]
+
+
+class PopulationStatsInput(BaseModel):
+    start_date: str = Field(..., description="YYYY-MM-DD (KST, inclusive)")
+    end_date: str = Field(..., description="YYYY-MM-DD (KST, inclusive)")
+    step_minutes: int = Field(60, ge=1, le=1440, description="birth time grid step")
+    include_hour: bool = Field(True, description="false: one unknown-time chart per day")
+    group_by: Optional[str] = Field(None, description="year")
+    bin_width: float = Field(5.0, description="histogram bin width in percentage points")
+    quantiles: List[float] = Field(default_factory=lambda: [0.05, 0.25, 0.5, 0.75, 0.95])
+
+
+class ElementDistribution(BaseModel):
+    count: int
+    status_share: Dict[str, Dict[str, float]]
+    histogram: Dict[str, List[int]]
+    quantiles: Dict[str, Dict[str, float]]
+
+
+class PopulationStatsResponse(BaseModel):
+    start_date: str
+    end_date: str
+    step_minutes: int
+    include_hour: bool
+    bin_edges: List[float]
+    overall: ElementDistribution
+    groups: Dict[str, ElementDistribution]
+
+
+class PillarSearchInput(BaseModel):
+    year: Optional[str] = Field(None, description="e.g. 甲子, 甲*, *子 (omit for any)")
+    month: Optional[str] = None
+    day: Optional[str] = None
+    hour: Optional[str] = None
+    start_date: str = Field(..., description="YYYY-MM-DD (KST)")
+    end_date: str = Field(..., description="YYYY-MM-DD (KST)")
+    limit: int = Field(1000, ge=1, le=100000)
+
+
+class PillarInterval(BaseModel):
+    start: str
+    end: str
+
+
+class PillarSearchResponse(BaseModel):
+    intervals: List[PillarInterval]
+    count: int
+    truncated: bool
 
 
 class OriginalInput(BaseModel):
@@ -54,6 +196,11 @@ class OriginalInput(BaseModel):
     calendar_type: str = Field("SOLAR", description="SOLAR or LUNAR")
     is_leap_month: bool = False
     timezone: str = "Asia/Seoul"
+    use_historical_offset: bool = Field(
+        False, description="treat birth_time as the civil time in force then (UTC+8:30 eras, DST)"
+    )
+    longitude: Optional[float] = Field(None, description="birthplace longitude (deg E) for true solar time")
+    city: Optional[str] = Field(None, description="birthplace city name, used when longitude is omitted")
 
 
 class OriginalPillar(BaseModel):
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+"""분석 응답 JSON 직렬화(빠른 경로).
+
+엔진이 만든 값(dataclass)은 이미 형식이 맞으므로 pydantic 모델을 다시 만들고 검증하지 않고
+바로 JSON 바이트로 씁니다. 결과 바이트는 `AnalysisResponse(...).model_dump_json()`과 같습니다
+(필드 순서, 공백 없는 구분자, 실수 표기 모두 동일 -> ETag/캐시 본문도 그대로).
+
+- orjson(requirements.txt에 포함)으로 인코딩하고, 패키지가 없는 환경에서는 표준 json으로 대신합니다(출력 동일).
+- 값이 몇 가지뿐인 부분은 모듈 로드 시 한 번 인코딩해 두고 바이트 조각을 이어 붙입니다.
+  - 기둥(60갑자), 지장간(12지지), 요약/루틴 문구(5오행), 십신 쌍
+"""
+
+import json
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+from .daeun import DaeunResult
+from .relations import TEN_GOD_NAMES, PillarRelation, TenGods
+from .saju import (
+    BRANCHES,
+    ELEMENTS,
+    HIDDEN_STEMS,
+    ROUTINES_BY_ELEMENT,
+    STEMS,
+    AnalysisResult,
+    Chart,
+    Pillar,
+    summary_for_element,
+)
+
+
+def dumps(value: Any) -> bytes:
+    """pydantic JSON 출력과 같은 형식(compact, UTF-8)으로 인코딩합니다."""
+
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_NULL = b"null"
+
+_PILLAR_FRAGMENTS: Dict[tuple, bytes] = {
+    (STEMS[i % 10], BRANCHES[i % 12]): dumps({"stem": STEMS[i % 10], "branch": BRANCHES[i % 12]}) for i in range(60)
+}
+_HIDDEN_FRAGMENTS: Dict[tuple, bytes] = {tuple(stems): dumps(stems) for stems in HIDDEN_STEMS.values()}
+_SUMMARY_FRAGMENTS: Dict[tuple, bytes] = {
+    tuple(summary.items()): dumps(summary) for summary in (summary_for_element(e) for e in ELEMENTS)
+}
+_ROUTINE_FRAGMENTS: Dict[tuple, bytes] = {
+    tuple(routines): dumps({"primary": routines}) for routines in ROUTINES_BY_ELEMENT.values()
+}
+_TEN_GOD_FRAGMENTS: Dict[tuple, bytes] = {
+    (stem, branch): dumps({"stem": stem, "branch": branch})
+    for stem in TEN_GOD_NAMES + ["일간"]
+    for branch in TEN_GOD_NAMES
+}
+
+
+# 맵 키("year_branch", "hour" 등)는 엔진이 쓰는 고정 집합이라 '"key":' 조각을 재사용합니다.
+_KEY_FRAGMENTS: Dict[str, bytes] = {}
+
+
+def _key(key: str) -> bytes:
+    fragment = _KEY_FRAGMENTS.get(key)
+    if fragment is None:
+        fragment = _KEY_FRAGMENTS[key] = dumps(key) + b":"
+    return fragment
+
+
+def _pillar(pillar: Optional[Pillar]) -> bytes:
+    if pillar is None:
+        return _NULL
+    key = (pillar.stem, pillar.branch)
+    return _PILLAR_FRAGMENTS.get(key) or dumps({"stem": pillar.stem, "branch": pillar.branch})
+
+
+def _chart(chart: Chart) -> bytes:
+    return b"".join(
+        [
+            b'{"year_pillar":',
+            _pillar(chart.year),
+            b',"month_pillar":',
+            _pillar(chart.month),
+            b',"day_pillar":',
+            _pillar(chart.day),
+            b',"hour_pillar":',
+            _pillar(chart.hour),
+            b"}",
+        ]
+    )
+
+
+def _hidden_stems(hidden: Mapping[str, Sequence]) -> bytes:
+    items = []
+    for key, stems in hidden.items():
+        fragment = _HIDDEN_FRAGMENTS.get(tuple(stems)) or dumps(stems)
+        items.append(_key(key) + fragment)
+    return b"{" + b",".join(items) + b"}"
+
+
+def _summary(summary: Mapping[str, str]) -> bytes:
+    return _SUMMARY_FRAGMENTS.get(tuple(summary.items())) or dumps(summary)
+
+
+def _routines(routines: Mapping[str, List[str]]) -> bytes:
+    if len(routines) == 1 and "primary" in routines:
+        fragment = _ROUTINE_FRAGMENTS.get(tuple(routines["primary"]))
+        if fragment is not None:
+            return fragment
+    return dumps(routines)
+
+
+def _ten_gods(gods: Mapping[str, Optional[TenGods]]) -> bytes:
+    items = []
+    for key, pair in gods.items():
+        if pair is None:
+            fragment = _NULL
+        else:
+            fragment = _TEN_GOD_FRAGMENTS.get((pair.stem, pair.branch)) or dumps(
+                {"stem": pair.stem, "branch": pair.branch}
+            )
+        items.append(_key(key) + fragment)
+    return b"{" + b",".join(items) + b"}"
+
+
+def daeun_payload(daeun: DaeunResult) -> Dict[str, Any]:
+    """DaeunResult -> DaeunSection 스키마와 같은 dict."""
+
+    return {
+        "direction": "forward" if daeun.forward else "backward",
+        "start_age": daeun.start_age,
+        "start_age_years": round(daeun.start_age_years, 4),
+        "term_name": daeun.term_name,
+        "term_kst": daeun.term_kst.isoformat(timespec="seconds"),
+        "pillars": [
+            {
+                "age": p.age,
+                "start_date": p.start_date.isoformat(),
+                "stem": p.pillar.stem,
+                "branch": p.pillar.branch,
+            }
+            for p in daeun.pillars
+        ],
+    }
+
+
+def encode_analysis(
+    analysis: AnalysisResult,
+    month_pillars: Sequence[Pillar],
+    month_uncertain: bool,
+    daeun: Optional[DaeunResult],
+    gods: Mapping[str, Optional[TenGods]],
+    relations: Sequence[PillarRelation],
+) -> bytes:
+    """엔진 결과 -> `AnalysisResponse` JSON 바이트(필드 순서는 스키마와 같음)."""
+
+    return b"".join(
+        [
+            b'{"chart":',
+            _chart(analysis.chart),
+            b',"month_pillars":[',
+            b",".join(_pillar(p) for p in month_pillars),
+            b'],"month_uncertain":',
+            b"true" if month_uncertain else b"false",
+            b',"hidden_stems":',
+            _hidden_stems(analysis.hidden_stems),
+            b',"element_score":',
+            dumps(analysis.element_score.__dict__),
+            b',"summary":',
+            _summary(analysis.summary),
+            b',"routines":',
+            _routines(analysis.routines),
+            b',"accuracy_note":',
+            dumps(analysis.accuracy_note),
+            b',"daeun":',
+            _NULL if daeun is None else dumps(daeun_payload(daeun)),
+            b',"ten_gods":',
+            _ten_gods(gods),
+            b',"pillar_relations":',
+            dumps([{"first": r.first, "second": r.second, "relations": r.relations} for r in relations]),
+            b"}",
+        ]
+    )
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+"""여러 워커 프로세스가 함께 쓰는 사전 계산 테이블/절기 경계 저장소.
+
+uvicorn 워커(--workers N)나 엔진 프로세스 풀 워커는 각자 절기 테이블/균시차 표를 만들고 들고 있습니다.
+같은 머신의 프로세스끼리는 디렉터리(SAJU_SHARED_DIR) 하나를 통해 다음을 나눠 씁니다.
+
+- 배열 테이블(`shared_arrays`): 처음 만든 프로세스가 .npy 파일로 저장하고, 나머지는 `np.load(mmap_mode="r")`로
+  엽니다. 파일 페이지는 OS 페이지 캐시 하나를 공유하므로 워커 수가 늘어도 메모리는 한 벌이고,
+  돌려주는 배열은 복사 없는 읽기 전용 뷰입니다.
+  - 키(지문)는 형식 버전 + 테이블을 결정하는 입력(범위, override 표 등)이라 입력이 바뀌면 새 파일을 씁니다.
+  - 만드는 동안은 파일 잠금(fcntl)으로 다른 프로세스가 같은 테이블을 중복 계산하지 않고 기다립니다.
+  - 임시 디렉터리에 쓴 뒤 rename으로 한 번에 공개하므로 반쯤 쓴 파일을 읽지 않습니다.
+- 절기 경계 저장소(`crossing_store`): `find_crossings_in_utc_window`의 결과(사전 계산 테이블 밖 조회)를
+  sqlite(WAL)에 (구간, 샘플 간격) 키로 저장합니다. 한 워커가 계산한 경계를 다른 워커가 그대로 씁니다.
+- 디렉터리는 0o700으로 만들고, 현재 사용자 소유가 아니거나 그룹/다른 사용자가 쓸 수 있으면 쓰지 않습니다
+  (다른 로컬 사용자가 미리 만든 테이블/저장소로 절기 값을 바꿔치기하지 못하게).
+- 설정(환경 변수)
+  - SAJU_SHARED_DIR: 공유 디렉터리(기본 임시 디렉터리/saju-shared-<uid>)
+  - SAJU_SHARED_TABLES: 0이면 공유하지 않고 프로세스마다 계산합니다(기본 1)
+- 디렉터리를 쓸 수 없거나 안전하지 않거나 sqlite 오류가 나면 공유 없이 계산합니다(FALLBACKS{reason="shared_*"}).
+- 계측: saju_cache_requests_total{cache="shared_table"|"crossing_store"}
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - POSIX가 아닌 환경: 잠금 없이 각자 만들고 rename 경합만 처리
+    fcntl = None
+
+from .metrics import CACHE_REQUESTS, FALLBACKS
+
+SHARED_FORMAT_VERSION = 1
+# 절기 경계 저장소 파일(지문: 경계 탐색 방식/천체력이 바뀌면 새 파일)
+_CROSSING_DB = "crossings"
+_CROSSING_SOURCE = ("find_crossings_in_utc_window", "de421")
+_SQLITE_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class SharedConfig:
+    directory: str
+    enabled: bool = True
+
+    @classmethod
+    def from_env(cls) -> "SharedConfig":
+        return cls(
+            directory=os.environ.get("SAJU_SHARED_DIR") or _default_directory(),
+            enabled=os.environ.get("SAJU_SHARED_TABLES", "1") != "0",
+        )
+
+
+def _default_directory() -> str:
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(), f"saju-shared{suffix}")
+
+
+def _trusted_directory(path: str) -> bool:
+    """공유 디렉터리를 만들고(0o700) 현재 사용자만 쓸 수 있는 실제 디렉터리인지 확인합니다."""
+
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        return False
+    return True
+
+
+def fingerprint(*parts: object) -> str:
+    """테이블을 결정하는 입력 -> 파일 이름용 짧은 지문(형식 버전 포함)."""
+
+    text = repr((SHARED_FORMAT_VERSION,) + parts)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _load(directory: str, names: Sequence[str]) -> Dict[str, np.ndarray]:
+    # np.memmap 대신 ndarray 뷰로 돌려줍니다(연산 결과가 memmap 하위 클래스로 새지 않게).
+    return {name: np.asarray(np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")) for name in names}
+
+
+def shared_arrays(
+    name: str,
+    key: str,
+    build: Callable[[], Dict[str, np.ndarray]],
+    *,
+    config: Optional[SharedConfig] = None,
+) -> Dict[str, np.ndarray]:
+    """공유 디렉터리의 배열 묶음(name, key)을 읽기 전용 mmap 뷰로 엽니다. 없으면 build()로 만들어 저장합니다.
+
+    공유를 끄거나 디렉터리를 쓸 수 없으면 build() 결과를 그대로 돌려줍니다.
+    """
+
+    config = config or shared_config
+    if not config.enabled:
+        return build()
+    target = os.path.join(config.directory, f"{name}-{key}")
+    try:
+        if not _trusted_directory(config.directory):
+            FALLBACKS.inc(reason="shared_dir_untrusted")
+            return build()
+        if os.path.isdir(target):
+            CACHE_REQUESTS.inc(cache="shared_table", result="hit")
+            return _load(target, _array_names(target))
+        with _file_lock(target + ".lock"):
+            # 잠금을 기다리는 동안 다른 프로세스가 만들었을 수 있습니다.
+            if os.path.isdir(target):
+                CACHE_REQUESTS.inc(cache="shared_table", result="hit")
+                return _load(target, _array_names(target))
+            CACHE_REQUESTS.inc(cache="shared_table", result="miss")
+            arrays = build()
+            staging = tempfile.mkdtemp(prefix=f".{name}-", dir=config.directory)
+            try:
+                for array_name, array in arrays.items():
+                    np.save(os.path.join(staging, f"{array_name}.npy"), np.ascontiguousarray(array))
+                os.rename(staging, target)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+                if not os.path.isdir(target):
+                    raise
+        return _load(target, list(arrays))
+    except OSError:
+        FALLBACKS.inc(reason="shared_table_unavailable")
+        return build()
+
+
+def _array_names(directory: str) -> List[str]:
+    return sorted(entry[:-4] for entry in os.listdir(directory) if entry.endswith(".npy"))
+
+
+class CrossingStore:
+    """(시작, 끝, 샘플 간격) -> 절기 경계 [(황경, KST ISO 시각)]. 프로세스/스레드마다 연결을 따로 엽니다."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # fork로 물려받은 연결은 쓰지 않습니다(sqlite 연결은 프로세스 사이에 공유할 수 없음).
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=_SQLITE_TIMEOUT_SECONDS, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS crossings ("
+                "start_utc REAL, end_utc REAL, step_minutes INTEGER, body TEXT, "
+                "PRIMARY KEY (start_utc, end_utc, step_minutes))"
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    def get(self, start_utc: datetime, end_utc: datetime, step_minutes: int) -> Optional[List[Tuple[float, str]]]:
+        """저장된 경계 목록. 없거나 sqlite 오류면 None(호출자가 계산)."""
+
+        try:
+            row = self._connection().execute(
+                "SELECT body FROM crossings WHERE start_utc = ? AND end_utc = ? AND step_minutes = ?",
+                (_seconds(start_utc), _seconds(end_utc), step_minutes),
+            ).fetchone()
+        except sqlite3.Error:
+            FALLBACKS.inc(reason="shared_store_unavailable")
+            return None
+        return None if row is None else [(float(deg), when) for deg, when in json.loads(row[0])]
+
+    def put(
+        self, start_utc: datetime, end_utc: datetime, step_minutes: int, crossings: Sequence[Tuple[float, str]]
+    ) -> None:
+        try:
+            self._connection().execute(
+                "INSERT OR IGNORE INTO crossings VALUES (?, ?, ?, ?)",
+                (_seconds(start_utc), _seconds(end_utc), step_minutes, json.dumps(list(crossings))),
+            )
+        except sqlite3.Error:
+            FALLBACKS.inc(reason="shared_store_unavailable")
+
+
+def _seconds(when: datetime) -> float:
+    # find_crossings_in_utc_window와 같이 tz 없는 시각은 UTC로 봅니다.
+    return (when if when.tzinfo is not None else when.replace(tzinfo=timezone.utc)).timestamp()
+
+
+_store_lock = threading.Lock()
+_stores: Dict[str, CrossingStore] = {}
+
+
+def crossing_store(config: Optional[SharedConfig] = None) -> Optional[CrossingStore]:
+    """공유 절기 경계 저장소. 공유를 끄거나 디렉터리를 만들 수 없거나 안전하지 않으면 None."""
+
+    config = config or shared_config
+    if not config.enabled:
+        return None
+    path = os.path.join(config.directory, f"{_CROSSING_DB}-{fingerprint(*_CROSSING_SOURCE)}.sqlite")
+    with _store_lock:
+        store = _stores.get(path)
+        if store is None:
+            try:
+                trusted = _trusted_directory(config.directory)
+            except OSError:
+                FALLBACKS.inc(reason="shared_store_unavailable")
+                return None
+            if not trusted:
+                FALLBACKS.inc(reason="shared_dir_untrusted")
+                return None
+            store = _stores[path] = CrossingStore(path)
+        return store
+
+
+shared_config = SharedConfig.from_env()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+"""Single-flight: 같은 키의 동시 계산을 하나로 합칩니다.
+
+- 같은 입력(정규화 키)의 요청이 겹치면 첫 요청만 계산을 시작하고, 나머지는 그 결과를 함께 기다립니다.
+- 계산은 별도 태스크로 돌리므로 먼저 온 요청이 끊겨도(취소) 기다리는 다른 요청은 결과를 받습니다.
+- 예외도 기다리던 모든 요청에 그대로 전달되며, 끝난 키는 바로 지워 다음 요청은 새로 계산합니다.
+- 통계: calls(전체 호출), executions(실제 계산), coalesced(합쳐진 호출 = calls - executions)
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+from .metrics import CACHE_REQUESTS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """key로 진행 중인 계산이 있으면 그 결과를, 없으면 factory()를 실행해 결과를 돌려줍니다."""
+
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+            CACHE_REQUESTS.inc(cache="inflight", result="miss")
+        else:
+            self.coalesced += 1
+            CACHE_REQUESTS.inc(cache="inflight", result="hit")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: "asyncio.Future") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 모든 대기자가 취소돼 아무도 결과를 읽지 않아도 "never retrieved" 경고가 나지 않게 합니다.
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "inflight": self.inflight,
+        }
+
+
+chart_flights = SingleFlight()
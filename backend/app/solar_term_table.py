@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+"""절기 경계(15° 격자) 사전 계산 테이블.
+
+- de421 유효 구간(1899-08 ~ 2053-10) 전체의 24절기 통과 시각을 한 번에 계산해
+  정렬된 배열로 보관합니다. 이후 조회는 이분 탐색(O(log n))입니다.
+- 계산 방식: 하루 간격으로 태양 황경을 벡터 평가 → 15° 격자 통과 구간 검출 →
+  선형 보간 초기값에서 뉴턴 반복 3회(오차 1µs 이하).
+- 앱 절입시각 표(override)는 테이블 생성 시점에 반영합니다(override > Skyfield).
+
+만세력 달력(calendar)처럼 날짜 범위를 훑는 기능과, 절기 경계 조회 함수
+(`find_crossings_for_kst_date` 등)가 같은 테이블을 공유합니다.
+여러 워커 프로세스는 배열을 공유 디렉터리의 mmap 파일로 함께 씁니다(shared_tables 모듈).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .metrics import FALLBACKS, STAGE_SECONDS
+from .shared_tables import fingerprint, shared_arrays
+from .solar_terms import (
+    KST,
+    TERM_NAME_BY_LONGITUDE,
+    SolarTermCrossing,
+    _ephemeris,
+    _timescale,
+    ecliptic_frame,
+)
+
+# de421: 1899-07-29 ~ 2053-10-09. 양 끝 며칠은 여유로 비워 둡니다.
+TABLE_START_UTC = datetime(1899, 8, 1, tzinfo=timezone.utc)
+TABLE_END_UTC = datetime(2053, 10, 8, tzinfo=timezone.utc)
+
+_SECONDS_PER_DAY = 86400.0
+_NEWTON_ITERATIONS = 3
+
+
+@dataclass(frozen=True)
+class SolarTermTable:
+    """정렬된 절기 경계 배열.
+
+    - when_utc: 통과 시각(POSIX seconds, float64, 오름차순)
+    - longitude_deg: 통과한 황경(0, 15, ..., 345)
+    - ipchun_utc_by_year: 양력 연도 -> 그 해 입춘(315°) 시각
+    """
+
+    when_utc: np.ndarray
+    longitude_deg: np.ndarray
+    start_utc: float
+    end_utc: float
+    ipchun_utc_by_year: Dict[int, float]
+
+    def __len__(self) -> int:
+        return int(self.when_utc.shape[0])
+
+    def covers(self, start: datetime, end: Optional[datetime] = None) -> bool:
+        """[start, end] 구간의 경계가 모두 테이블 안에 있는지."""
+
+        end = end or start
+        return self.start_utc <= start.timestamp() and end.timestamp() <= self.end_utc
+
+    def last_index_at_or_before(self, when: datetime) -> int:
+        """when 이하(<=)인 마지막 경계의 인덱스. 없으면 -1."""
+
+        return int(np.searchsorted(self.when_utc, when.timestamp(), side="right")) - 1
+
+    def crossing(self, index: int) -> SolarTermCrossing:
+        deg = float(self.longitude_deg[index])
+        return SolarTermCrossing(
+            name=TERM_NAME_BY_LONGITUDE.get(deg, f"TERM_{deg:.0f}"),
+            target_longitude_deg=deg,
+            when_kst=datetime.fromtimestamp(float(self.when_utc[index]), tz=KST),
+        )
+
+    def crossings_in(self, start: datetime, end: datetime) -> List[SolarTermCrossing]:
+        """[start, end) 안의 경계들을 시간순으로 반환."""
+
+        lo = int(np.searchsorted(self.when_utc, start.timestamp(), side="left"))
+        hi = int(np.searchsorted(self.when_utc, end.timestamp(), side="left"))
+        return [self.crossing(i) for i in range(lo, hi)]
+
+    def date_range(self) -> tuple[date, date]:
+        """날짜 단위 조회(달력 등)가 가능한 KST 날짜 범위(양 끝 포함).
+
+        첫날은 직전 경계가 테이블에 있어야 하므로 첫 경계 다음날부터입니다.
+        """
+
+        first = datetime.fromtimestamp(float(self.when_utc[0]), tz=KST).date() + timedelta(days=1)
+        last = datetime.fromtimestamp(self.end_utc, tz=KST).date() - timedelta(days=1)
+        return first, last
+
+    @cached_property
+    def ipchun_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """(연도 배열, 입춘 시각 배열) - 벡터 조회용, 시각 오름차순."""
+
+        years = np.array(sorted(self.ipchun_utc_by_year), dtype=np.int64)
+        when = np.array([self.ipchun_utc_by_year[int(y)] for y in years], dtype=np.float64)
+        return years, when
+
+    def pillar_year_at(self, when: datetime) -> int:
+        """입춘 기준 연주 연도(입춘 이전이면 전년)."""
+
+        year = when.astimezone(KST).year
+        ipchun = self.ipchun_utc_by_year.get(year)
+        if ipchun is not None and when.timestamp() < ipchun:
+            return year - 1
+        return year
+
+
+def _sun_ecliptic_longitudes_deg(seconds_utc: np.ndarray) -> np.ndarray:
+    """POSIX seconds 배열에 대한 태양 황경(0~360) 벡터 평가."""
+
+    ts = _timescale()
+    eph = _ephemeris()
+    # POSIX seconds는 윤초를 세지 않으므로 (일, 초)로 나눠 UTC 달력 시각으로 넘깁니다.
+    days = np.floor(seconds_utc / _SECONDS_PER_DAY)
+    t = ts.utc(1970, 1, 1 + days, 0, 0, seconds_utc - days * _SECONDS_PER_DAY)
+    astrometric = eph["earth"].at(t).observe(eph["sun"])
+    _, lon, _ = astrometric.frame_latlon(ecliptic_frame)
+    return lon.degrees % 360.0
+
+
+def _overrides() -> dict:
+    try:
+        from .solar_term_overrides import OVERRIDES
+    except Exception:  # pragma: no cover
+        OVERRIDES = {}
+    return OVERRIDES
+
+
+def _apply_overrides(when: np.ndarray, lon: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    OVERRIDES = _overrides()
+    when = when.copy()
+    extra_when: List[float] = []
+    extra_lon: List[float] = []
+    for (d, deg), ov in OVERRIDES.items():
+        deg = float(deg % 360.0)
+        day_start = datetime(d.year, d.month, d.day, tzinfo=KST).timestamp()
+        lo = int(np.searchsorted(when, day_start, side="left"))
+        hi = int(np.searchsorted(when, day_start + _SECONDS_PER_DAY, side="left"))
+        matches = [i for i in range(lo, hi) if lon[i] == deg]
+        if matches:
+            when[matches[0]] = ov.when_kst.timestamp()
+        else:
+            extra_when.append(ov.when_kst.timestamp())
+            extra_lon.append(deg)
+
+    if extra_when:
+        when = np.concatenate([when, np.asarray(extra_when)])
+        lon = np.concatenate([lon, np.asarray(extra_lon)])
+    order = np.argsort(when, kind="stable")
+    return when[order], lon[order]
+
+
+def build_solar_term_table(
+    start_utc: datetime = TABLE_START_UTC,
+    end_utc: datetime = TABLE_END_UTC,
+) -> SolarTermTable:
+    """[start_utc, end_utc] 구간의 24절기 통과 시각을 벡터 계산합니다(수 초 소요)."""
+
+    samples = np.arange(start_utc.timestamp(), end_utc.timestamp(), _SECONDS_PER_DAY)
+    lons = _sun_ecliptic_longitudes_deg(samples)
+    unwrapped = np.degrees(np.unwrap(np.radians(lons)))
+
+    k = np.floor(unwrapped / 15.0).astype(np.int64)
+    idx = np.nonzero(np.diff(k))[0]
+    target_unwrapped = k[idx + 1] * 15.0
+    target = target_unwrapped % 360.0
+
+    # 하루 동안 태양은 약 1°만 움직이므로 구간당 경계는 최대 1개입니다.
+    rate = (unwrapped[idx + 1] - unwrapped[idx]) / _SECONDS_PER_DAY
+    when = samples[idx] + (target_unwrapped - unwrapped[idx]) / rate
+    for _ in range(_NEWTON_ITERATIONS):
+        rotated = (_sun_ecliptic_longitudes_deg(when) - target) % 360.0
+        rotated = np.where(rotated >= 180.0, rotated - 360.0, rotated)
+        when = when - rotated / rate
+
+    when, target = _apply_overrides(when, target)
+    return _table_from_arrays(when, target, start_utc, end_utc)
+
+
+def _table_from_arrays(when: np.ndarray, target: np.ndarray, start_utc: datetime, end_utc: datetime) -> SolarTermTable:
+    ipchun_by_year: Dict[int, float] = {}
+    for t in when[target == 315.0]:
+        ipchun_by_year[datetime.fromtimestamp(float(t), tz=KST).year] = float(t)
+
+    return SolarTermTable(
+        when_utc=when,
+        longitude_deg=target,
+        start_utc=start_utc.timestamp(),
+        end_utc=end_utc.timestamp(),
+        ipchun_utc_by_year=ipchun_by_year,
+    )
+
+
+def _table_key() -> str:
+    """기본 테이블 지문: 범위/반복 횟수/override 표가 바뀌면 공유 파일도 새로 만듭니다."""
+
+    overrides = sorted((d.isoformat(), float(deg), ov.when_kst.isoformat()) for (d, deg), ov in _overrides().items())
+    return fingerprint(
+        "solar_term_table", TABLE_START_UTC.isoformat(), TABLE_END_UTC.isoformat(), _NEWTON_ITERATIONS, overrides
+    )
+
+
+def _build_default_arrays() -> Dict[str, np.ndarray]:
+    table = build_solar_term_table()
+    return {"when_utc": table.when_utc, "longitude_deg": table.longitude_deg}
+
+
+@lru_cache(maxsize=1)
+def get_solar_term_table() -> SolarTermTable:
+    """프로세스 당 1회 여는 기본 절기 테이블(공유 파일이 있으면 계산 없이 mmap으로 엽니다)."""
+
+    with STAGE_SECONDS.time(stage="solar_term_table_load"):
+        arrays = shared_arrays("solar_term_table", _table_key(), _build_default_arrays)
+        return _table_from_arrays(arrays["when_utc"], arrays["longitude_deg"], TABLE_START_UTC, TABLE_END_UTC)
+
+
+def solar_term_table_or_none() -> Optional[SolarTermTable]:
+    """테이블을 쓸 수 없는 환경(skyfield/de421 누락)이면 None."""
+
+    try:
+        return get_solar_term_table()
+    except Exception:
+        FALLBACKS.inc(reason="solar_term_table_unavailable")
+        return None
@@ -17,6 +17,9 @@ from typing import Iterable, List, Optional
 
 from datetime import timezone
 
+from .metrics import CACHE_REQUESTS, SKYFIELD_EVALUATIONS, STAGE_SECONDS
+from .shared_tables import crossing_store
+
 try:
     from skyfield.api import Loader, load
     from skyfield.api import utc
@@ -107,6 +110,19 @@ def filter_junggi_crossings(crossings: List[SolarTermCrossing]) -> List[SolarTer
     return result
 
 
+def _table_covering(start: datetime, end: datetime):
+    """[start, end]를 덮는 사전 계산 절기 테이블(없으면 None, Skyfield 스캔으로 폴백)."""
+
+    from .solar_term_table import solar_term_table_or_none  # local import to avoid circular
+
+    table = solar_term_table_or_none()
+    if table is None or not table.covers(start, end):
+        CACHE_REQUESTS.inc(cache="solar_term_table", result="miss")
+        return None
+    CACHE_REQUESTS.inc(cache="solar_term_table", result="hit")
+    return table
+
+
 def _to_kst(dt_utc: datetime) -> datetime:
     # KST = UTC+9, tzinfo는 단순 고정 오프셋으로 둡니다(내부 계산 정확도에는 영향 없음)
         if dt_utc.tzinfo is None:
@@ -127,7 +143,8 @@ def _ephemeris():
     if not SKYFIELD_AVAILABLE:  # pragma: no cover
         raise RuntimeError("skyfield is not installed")
     # 1899~2053 범위(de421)
-    return _skyfield_loader()("de421.bsp")
+    with STAGE_SECONDS.time(stage="ephemeris_load"):
+        return _skyfield_loader()("de421.bsp")
 
 
 @lru_cache(maxsize=1)
@@ -138,6 +155,7 @@ def _timescale():
 
 
 def _sun_ecliptic_longitude_deg(ts_time) -> float:
+    SKYFIELD_EVALUATIONS.inc()
     eph = _ephemeris()
     sun = eph["sun"]
     earth = eph["earth"]
@@ -179,11 +197,38 @@ def find_crossings_in_utc_window(
     기존 방식(각 타겟별 부호 반전)은 0/360 래핑 구간에서 오탐이 생길 수 있어,
     시간축에서 황경을 '단조 증가'하도록 언랩(unwrapped)한 뒤,
     15° 격자선을 넘어서는 순간을 찾아 절기 경계로 기록합니다.
+
+    결과는 워커 프로세스 간 공유 저장소(shared_tables.crossing_store)에 남겨
+    같은 구간을 다른 워커가 다시 계산하지 않게 합니다.
     """
 
     if end_utc <= start_utc:
         return []
 
+    store = crossing_store()
+    if store is not None:
+        stored = store.get(start_utc, end_utc, step_minutes)
+        if stored is not None:
+            CACHE_REQUESTS.inc(cache="crossing_store", result="hit")
+            return [
+                SolarTermCrossing(
+                    name=TERM_NAME_BY_LONGITUDE.get(deg, f"TERM_{deg:.0f}"),
+                    target_longitude_deg=deg,
+                    when_kst=datetime.fromisoformat(when),
+                )
+                for deg, when in stored
+            ]
+        CACHE_REQUESTS.inc(cache="crossing_store", result="miss")
+
+    crossings = _scan_crossings_in_utc_window(start_utc, end_utc, step_minutes)
+    if store is not None:
+        store.put(
+            start_utc, end_utc, step_minutes, [(c.target_longitude_deg, c.when_kst.isoformat()) for c in crossings]
+        )
+    return crossings
+
+
+def _scan_crossings_in_utc_window(start_utc: datetime, end_utc: datetime, step_minutes: int) -> List[SolarTermCrossing]:
     ts = _timescale()
 
     # 샘플링
@@ -196,9 +241,10 @@ def find_crossings_in_utc_window(
         times_utc.append(end_utc)
 
     lons: List[float] = []
-    for t_utc in times_utc:
-        sf_t = ts.from_datetime(t_utc.replace(tzinfo=utc))
-        lons.append(_sun_ecliptic_longitude_deg(sf_t))
+    with STAGE_SECONDS.time(stage="crossing_scan"):
+        for t_utc in times_utc:
+            sf_t = ts.from_datetime(t_utc.replace(tzinfo=utc))
+            lons.append(_sun_ecliptic_longitude_deg(sf_t))
 
     # 언랩: 0~360 래핑을 제거해 시간축으로 단조 증가하도록 만듦
     unwrapped: List[float] = [lons[0]]
@@ -233,20 +279,21 @@ def find_crossings_in_utc_window(
             lo = times_utc[i - 1]
             hi = times_utc[i]
             # 이분 탐색: (lo, hi]에서 unwrapped longitude가 target에 도달하는 순간
-            for _ in range(32):
-                mid = lo + (hi - lo) / 2
-                mid_lon = _sun_ecliptic_longitude_deg(ts.from_datetime(mid.replace(tzinfo=utc)))
-                # mid_lon을 a 기준으로 언랩
-                mid_unwrapped = mid_lon
-                while mid_unwrapped < (a - 180.0):
-                    mid_unwrapped += 360.0
-                while mid_unwrapped > (a + 180.0):
-                    mid_unwrapped -= 360.0
-
-                if mid_unwrapped >= target:
-                    hi = mid
-                else:
-                    lo = mid
+            with STAGE_SECONDS.time(stage="bisection"):
+                for _ in range(32):
+                    mid = lo + (hi - lo) / 2
+                    mid_lon = _sun_ecliptic_longitude_deg(ts.from_datetime(mid.replace(tzinfo=utc)))
+                    # mid_lon을 a 기준으로 언랩
+                    mid_unwrapped = mid_lon
+                    while mid_unwrapped < (a - 180.0):
+                        mid_unwrapped += 360.0
+                    while mid_unwrapped > (a + 180.0):
+                        mid_unwrapped -= 360.0
+
+                    if mid_unwrapped >= target:
+                        hi = mid
+                    else:
+                        lo = mid
             crossings.append(
                 SolarTermCrossing(name=name, target_longitude_deg=target_mod, when_kst=_to_kst(hi))
             )
@@ -270,6 +317,11 @@ def find_crossings_for_kst_date(target_date: date) -> List[SolarTermCrossing]:
     kst_start = datetime(target_date.year, target_date.month, target_date.day, 0, 0, 0, tzinfo=KST)
     kst_end = kst_start + timedelta(days=1)
 
+    # 사전 계산 테이블 구간이면 이분 탐색으로 바로 응답(override 반영 완료 상태)
+    table = _table_covering(kst_start, kst_end)
+    if table is not None:
+        return table.crossings_in(kst_start, kst_end)
+
     # UTC = KST - 9
     start_utc = kst_start.astimezone(utc)
     end_utc = kst_end.astimezone(utc)
@@ -320,6 +372,33 @@ def find_junggi_crossings_for_kst_date(target_date: date) -> List[SolarTermCross
     return filter_junggi_crossings(find_crossings_for_kst_date(target_date))
 
 
+def find_crossings_for_local_date(target_date: date, zone_name: str) -> List[SolarTermCrossing]:
+    """IANA 타임존 기준 특정 날짜(현지 00:00~24:00) 안의 절기 경계들을 반환.
+
+    현지 하루의 시작/끝은 타임존별 전환 배열(`civil_time_table_for_zone`, 캐시)로 구합니다.
+    Asia/Seoul은 기존과 같은 고정 KST 날짜 창을 씁니다.
+    """
+
+    if zone_name == "Asia/Seoul":
+        return find_crossings_for_kst_date(target_date)
+
+    from .civil_time import civil_time_table_for_zone, local_wall_to_kst
+
+    zone = civil_time_table_for_zone(zone_name)
+    day_start = datetime(target_date.year, target_date.month, target_date.day)
+    start = local_wall_to_kst(day_start, zone)
+    end = local_wall_to_kst(day_start + timedelta(days=1), zone)
+
+    table = _table_covering(start, end)
+    if table is not None:
+        return table.crossings_in(start, end)
+    return [
+        c
+        for c in find_crossings_in_utc_window(start.astimezone(utc), end.astimezone(utc), step_minutes=20)
+        if start <= c.when_kst < end
+    ]
+
+
 def find_last_crossing_before_kst(
     dt_kst: datetime,
     *,
@@ -335,6 +414,14 @@ def find_last_crossing_before_kst(
     if dt_kst.tzinfo is None:
         dt_kst = dt_kst.replace(tzinfo=KST)
 
+    window_start = dt_kst - timedelta(days=lookback_days)
+    table = _table_covering(window_start, dt_kst)
+    if table is not None:
+        i = table.last_index_at_or_before(dt_kst)
+        if i < 0 or table.when_utc[i] < window_start.timestamp():
+            return None
+        return table.crossing(i)
+
     # KST -> UTC window
     end_utc = dt_kst.astimezone(utc)
     start_utc = (dt_kst - timedelta(days=lookback_days)).astimezone(utc)
@@ -380,6 +467,16 @@ def find_last_junggi_before_kst(
     if dt_kst.tzinfo is None:
         dt_kst = dt_kst.replace(tzinfo=KST)
 
+    window_start = dt_kst - timedelta(days=lookback_days)
+    table = _table_covering(window_start, dt_kst)
+    if table is not None:
+        i = table.last_index_at_or_before(dt_kst)
+        while i >= 0 and table.when_utc[i] >= window_start.timestamp():
+            if abs(float(table.longitude_deg[i]) % 30.0) < 1e-9:
+                return table.crossing(i)
+            i -= 1
+        return None
+
     last = find_last_crossing_before_kst(dt_kst, lookback_days=lookback_days)
     if not last:
         return None
@@ -417,3 +514,38 @@ def find_last_junggi_before_kst(
     if not xs:
         return None
     return max(xs, key=lambda c: c.when_kst)
+
+
+def find_last_ipchun_before_kst(dt_kst: datetime, *, max_terms: int = 80) -> Optional[SolarTermCrossing]:
+    """주어진 KST 시각 이전(<=)의 가장 최근 입춘(315°) 경계를 찾습니다.
+
+    연주(年柱) 판정용입니다. 테이블 구간이면 배열을 거슬러 올라가고(최대 24칸),
+    아니면 15° 경계를 하나씩 되짚는 프로브로 찾습니다.
+    """
+
+    with STAGE_SECONDS.time(stage="ipchun_probe"):
+        return _find_last_ipchun_before_kst(dt_kst, max_terms)
+
+
+def _find_last_ipchun_before_kst(dt_kst: datetime, max_terms: int) -> Optional[SolarTermCrossing]:
+    if dt_kst.tzinfo is None:
+        dt_kst = dt_kst.replace(tzinfo=KST)
+
+    table = _table_covering(dt_kst - timedelta(days=370), dt_kst)
+    if table is not None:
+        i = table.last_index_at_or_before(dt_kst)
+        while i >= 0:
+            if abs(float(table.longitude_deg[i]) - 315.0) < 1e-6:
+                return table.crossing(i)
+            i -= 1
+        return None
+
+    probe_dt = dt_kst
+    for _ in range(max_terms):
+        last15 = find_last_crossing_before_kst(probe_dt)
+        if not last15:
+            return None
+        if abs(float(last15.target_longitude_deg % 360.0) - 315.0) < 1e-6:
+            return last15
+        probe_dt = last15.when_kst - timedelta(seconds=1)
+    return None
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+"""진태양시(眞太陽時) 보정: 출생지 경도 + 균시차(equation of time).
+
+- KST는 동경 135° 기준이므로 출생지 경도 차이만큼(1° = 4분) 시각이 어긋납니다.
+  예) 서울(126.98°E)은 약 -32분
+- 균시차는 1900~2053년 날짜별 값을 NOAA 근사식으로 한 번에 계산해 배열로 보관하고,
+  조회는 날짜 인덱싱(O(1))입니다(천체력 평가 없음).
+- 보정은 일주/시주(하루 경계와 시지)에만 적용합니다. 연주/월주의 절기 경계는 실제 순간이므로
+  KST 시각 그대로 비교합니다.
+"""
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .shared_tables import fingerprint, shared_arrays
+
+EOT_FIRST_DATE = date(1900, 1, 1)
+EOT_LAST_DATE = date(2053, 12, 31)
+KST_MERIDIAN_DEG = 135.0
+_EOT_RANGE_MESSAGE = f"true solar time is available for {EOT_FIRST_DATE.isoformat()}..{EOT_LAST_DATE.isoformat()}"
+
+# 주요 도시 경도(동경, 도). 한글/영문 이름 모두 받습니다.
+CITY_LONGITUDES: Dict[str, float] = {
+    "서울": 126.978,
+    "부산": 129.075,
+    "인천": 126.705,
+    "대구": 128.601,
+    "대전": 127.385,
+    "광주": 126.853,
+    "울산": 129.311,
+    "수원": 127.029,
+    "세종": 127.289,
+    "청주": 127.489,
+    "전주": 127.148,
+    "춘천": 127.730,
+    "강릉": 128.876,
+    "포항": 129.343,
+    "창원": 128.681,
+    "제주": 126.531,
+}
+_CITY_ALIASES: Dict[str, str] = {
+    "seoul": "서울",
+    "busan": "부산",
+    "incheon": "인천",
+    "daegu": "대구",
+    "daejeon": "대전",
+    "gwangju": "광주",
+    "ulsan": "울산",
+    "suwon": "수원",
+    "sejong": "세종",
+    "cheongju": "청주",
+    "jeonju": "전주",
+    "chuncheon": "춘천",
+    "gangneung": "강릉",
+    "pohang": "포항",
+    "changwon": "창원",
+    "jeju": "제주",
+}
+
+
+@lru_cache(maxsize=1)
+def equation_of_time_table() -> np.ndarray:
+    """EOT_FIRST_DATE부터 날짜별 균시차(분, 겉보기 태양시 - 평균 태양시) 배열(워커 간 공유 mmap)."""
+
+    key = fingerprint("equation_of_time", EOT_FIRST_DATE.isoformat(), EOT_LAST_DATE.isoformat())
+    return shared_arrays("equation_of_time", key, lambda: {"eot": _compute_equation_of_time()})["eot"]
+
+
+def _compute_equation_of_time() -> np.ndarray:
+    days = np.arange(
+        np.datetime64(EOT_FIRST_DATE), np.datetime64(EOT_LAST_DATE + timedelta(days=1)), dtype="datetime64[D]"
+    )
+    year_start = days.astype("datetime64[Y]")
+    years = year_start.astype(np.int64) + 1970
+    day_of_year = (days - year_start.astype("datetime64[D]")).astype(np.float64)
+    days_in_year = np.where((years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0)), 366.0, 365.0)
+
+    # NOAA 근사식(정오 기준), 오차 약 ±0.5분
+    gamma = 2.0 * np.pi / days_in_year * day_of_year
+    return 229.18 * (
+        0.000075
+        + 0.001868 * np.cos(gamma)
+        - 0.032077 * np.sin(gamma)
+        - 0.014615 * np.cos(2 * gamma)
+        - 0.040849 * np.sin(2 * gamma)
+    )
+
+
+def resolve_longitude(longitude: Optional[float], city: Optional[str]) -> Optional[float]:
+    """입력 경도/도시 -> 경도. 둘 다 없으면 None(보정 안 함). 알 수 없는 도시/범위 밖은 ValueError."""
+
+    if longitude is not None:
+        if not -180.0 <= longitude <= 180.0:
+            raise ValueError("longitude must be within -180..180")
+        return float(longitude)
+    if not city:
+        return None
+    key = city.strip()
+    key = _CITY_ALIASES.get(key.lower(), key)
+    if key not in CITY_LONGITUDES:
+        raise ValueError(f"unknown city: {city}")
+    return CITY_LONGITUDES[key]
+
+
+def check_true_solar_date(target: date) -> None:
+    """진태양시 보정이 가능한 날짜(균시차 표 범위)인지 확인합니다. 범위 밖은 ValueError."""
+
+    if not EOT_FIRST_DATE <= target <= EOT_LAST_DATE:
+        raise ValueError(_EOT_RANGE_MESSAGE)
+
+
+def _eot_minutes(ordinals: np.ndarray) -> np.ndarray:
+    table = equation_of_time_table()
+    index = np.asarray(ordinals, dtype=np.int64) - EOT_FIRST_DATE.toordinal()
+    if index.size and (index.min() < 0 or index.max() >= table.shape[0]):
+        raise ValueError(_EOT_RANGE_MESSAGE)
+    return table[index]
+
+
+def true_solar_correction_minutes(target: date, longitude: float) -> float:
+    """KST -> 진태양시 보정량(분) = 경도차 x 4분 + 균시차."""
+
+    return (longitude - KST_MERIDIAN_DEG) * 4.0 + float(_eot_minutes(np.array([target.toordinal()]))[0])
+
+
+def to_true_solar_time(birth_date: date, birth_time: str, longitude: float) -> Tuple[date, str]:
+    """KST 날짜/시각 -> 진태양시 날짜/"HH:MM"(분 단위 반올림)."""
+
+    hour, minute = [int(x) for x in birth_time.split(":")[:2]]
+    wall = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute)
+    corrected = wall + timedelta(minutes=round(true_solar_correction_minutes(birth_date, longitude)))
+    return corrected.date(), f"{corrected:%H:%M}"
+
+
+def true_solar_minutes(kst_minutes: np.ndarray, longitude: float) -> np.ndarray:
+    """KST 벽시계 분 배열 -> 진태양시 벽시계 분 배열(vectorized 모듈 표기와 동일)."""
+
+    kst_minutes = np.asarray(kst_minutes, dtype=np.int64)
+    ordinals = np.floor_divide(kst_minutes, 1440) + date(1970, 1, 1).toordinal()
+    correction = (longitude - KST_MERIDIAN_DEG) * 4.0 + _eot_minutes(ordinals)
+    return kst_minutes + np.rint(correction).astype(np.int64)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+"""벡터화된 4주 인덱스 계산(NumPy).
+
+`calculate_chart`(기본 정책)와 같은 규칙을 배열 단위로 적용합니다.
+- 입력 시각은 KST 벽시계 기준 '분'(POSIX minutes, KST 00:00 = 하루 시작)
+- 출력은 60갑자 인덱스(0=甲子 .. 59=癸亥), 기둥 순서는 (year, month, day, hour)
+- 연주/월주는 사전 계산 절기 테이블을 searchsorted로 조회하고,
+  일주/시주는 날짜/시각 산술로 구합니다.
+
+역검색(pillar_search), 배치 분석처럼 대량의 시각을 한 번에 평가하는 경로가 사용합니다.
+"""
+
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .saju import DAY_SEXAGENARY_OFFSET
+from .solar_term_table import SolarTermTable
+
+PILLAR_KEYS = ("year", "month", "day", "hour")
+
+_DAY_REFERENCE_ORDINAL = date(1900, 1, 31).toordinal()
+_KST_OFFSET_MINUTES = 9 * 60
+_MINUTES_PER_DAY = 1440
+
+# (천간, 지지) -> 60갑자 인덱스. 짝이 맞지 않는 조합(예: 甲丑)은 -1.
+SEXAGENARY_BY_STEM_BRANCH = np.full((10, 12), -1, dtype=np.int16)
+for _i in range(60):
+    SEXAGENARY_BY_STEM_BRANCH[_i % 10, _i % 12] = _i
+
+# 오호둔(五虎遁): 연간 -> 寅월 월간
+_YIN_MONTH_STEM_BY_YEAR_STEM = np.array([2, 4, 6, 8, 0, 2, 4, 6, 8, 0], dtype=np.int16)
+
+# 하루 안의 시지 구간 시작(분). 기본 정책(홀수시 정각은 직전 시지, 23:00은 子시)을 따릅니다.
+# 子 00:00~01:00, 丑 01:01~03:00, ..., 亥 21:01~22:59, (다음날 일주의) 子 23:00~23:59
+HOUR_SLOT_STARTS = np.array([0] + [(2 * h - 1) * 60 + 1 for h in range(1, 12)] + [23 * 60], dtype=np.int64)
+
+
+def day_indices_for_ordinals(ordinals: np.ndarray) -> np.ndarray:
+    """date.toordinal() 배열 -> 일주 60갑자 인덱스."""
+
+    return ((np.asarray(ordinals, dtype=np.int64) - _DAY_REFERENCE_ORDINAL + DAY_SEXAGENARY_OFFSET) % 60).astype(
+        np.int16
+    )
+
+
+def kst_minutes_to_ordinals(kst_minutes: np.ndarray) -> np.ndarray:
+    """KST 벽시계 분 -> 그 시각의 (양력) 날짜 ordinal."""
+
+    return np.floor_divide(kst_minutes, _MINUTES_PER_DAY) + date(1970, 1, 1).toordinal()
+
+
+def ordinals_to_kst_minutes(ordinals: np.ndarray) -> np.ndarray:
+    """날짜 ordinal -> 그 날짜 KST 00:00의 벽시계 분."""
+
+    return (np.asarray(ordinals, dtype=np.int64) - date(1970, 1, 1).toordinal()) * _MINUTES_PER_DAY
+
+
+def _kst_minutes_to_utc_seconds(kst_minutes: np.ndarray) -> np.ndarray:
+    return (np.asarray(kst_minutes, dtype=np.int64) - _KST_OFFSET_MINUTES) * 60.0
+
+
+def year_month_indices_at(table: SolarTermTable, kst_minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """KST 벽시계 분 배열 -> (연주, 월주) 60갑자 인덱스 배열.
+
+    시각이 경계 시각 이상(>=)이면 경계 이후로 봅니다(calculate_chart와 동일).
+    """
+
+    return year_month_indices_at_utc(table, _kst_minutes_to_utc_seconds(kst_minutes))
+
+
+def year_month_indices_at_utc(table: SolarTermTable, seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """POSIX 초 배열 -> (연주, 월주) 60갑자 인덱스 배열(초 단위 시각, 예: 시간 미상의 23:59:59)."""
+
+    seconds = np.asarray(seconds, dtype=np.float64)
+    ipchun_years, ipchun_when = table.ipchun_arrays
+    j = np.searchsorted(ipchun_when, seconds, side="right") - 1
+    years = np.where(j >= 0, ipchun_years[np.clip(j, 0, None)], ipchun_years[0] - 1)
+    year_index = ((years - 1984) % 60).astype(np.int16)
+
+    i = np.searchsorted(table.when_utc, seconds, side="right") - 1
+    k15 = np.rint(table.longitude_deg[np.clip(i, 0, None)] / 15.0).astype(np.int64)
+    month_index = ((k15 - 21) % 24) // 2 + 1  # 寅월=1 .. 丑월=12
+    month_branch = (2 + month_index - 1) % 12
+    month_stem = (_YIN_MONTH_STEM_BY_YEAR_STEM[year_index % 10] + month_index - 1) % 10
+    month_sexagenary = SEXAGENARY_BY_STEM_BRANCH[month_stem, month_branch]
+    return year_index, month_sexagenary
+
+
+def hour_branch_indices(minute_of_day: np.ndarray) -> np.ndarray:
+    """하루 중 분(0..1439) -> 시지 인덱스(0=子..11=亥)."""
+
+    slot = np.searchsorted(HOUR_SLOT_STARTS, minute_of_day, side="right") - 1
+    return np.where(slot == 12, 0, slot).astype(np.int16)
+
+
+def chart_indices_at(
+    table: SolarTermTable, kst_minutes: np.ndarray, day_minutes: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """KST 출생 시각(분) 배열 -> (N, 4) 60갑자 인덱스 배열 [year, month, day, hour].
+
+    day_minutes를 주면(예: `solar_time.true_solar_minutes`) 일주/시주는 그 시각으로,
+    연주/월주는 kst_minutes(실제 순간)로 판정합니다.
+    """
+
+    kst_minutes = np.asarray(kst_minutes, dtype=np.int64)
+    year_index, month_index = year_month_indices_at(table, kst_minutes)
+
+    day_minutes = kst_minutes if day_minutes is None else np.asarray(day_minutes, dtype=np.int64)
+    ordinals = kst_minutes_to_ordinals(day_minutes)
+    minute_of_day = day_minutes - ordinals_to_kst_minutes(ordinals)
+    # 23:00~23:59는 다음날 일주(자시 일주 교체)
+    day_index = day_indices_for_ordinals(ordinals + (minute_of_day >= 23 * 60))
+
+    hour_branch = hour_branch_indices(minute_of_day)
+    hour_stem = ((day_index % 10) * 2 + hour_branch) % 10
+    hour_index = SEXAGENARY_BY_STEM_BRANCH[hour_stem, hour_branch]
+
+    return np.stack([year_index, month_index, day_index, hour_index], axis=1).astype(np.int16)
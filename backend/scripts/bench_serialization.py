@@ -0,0 +1,107 @@
+"""Per-response serialization cost of the analysis payload (CLI benchmark).
+
+Why this exists
+- /api/analysis used to rebuild a pydantic AnalysisResponse from engine dataclasses (validation
+  included) and then dump it to JSON. app/serialization.py writes the same bytes directly.
+- This times both paths on the same precomputed engine results, so engine time is excluded,
+  and checks that the bytes are identical.
+
+Usage (from backend/)
+  python scripts/bench_serialization.py --samples 200 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.daeun import calculate_daeun  # noqa: E402
+from app.relations import pillar_relations, ten_gods  # noqa: E402
+from app.saju import _year_index, analyze, calculate_month_pillars_policy_c  # noqa: E402
+from app.schemas import AnalysisResponse  # noqa: E402
+from app.serialization import daeun_payload, encode_analysis, orjson  # noqa: E402
+
+
+def engine_parts(birth_date: date, birth_time):
+    analysis = analyze(birth_date, birth_time)
+    month_pillars, month_uncertain = calculate_month_pillars_policy_c(
+        birth_date, birth_time, _year_index(birth_date) % 10
+    )
+    try:
+        daeun = calculate_daeun(birth_date, birth_time, "F")
+    except (RuntimeError, ValueError):
+        daeun = None
+    return (
+        analysis,
+        month_pillars,
+        month_uncertain,
+        daeun,
+        ten_gods(analysis.chart),
+        pillar_relations(analysis.chart),
+    )
+
+
+def pydantic_body(analysis, month_pillars, month_uncertain, daeun, gods, relations) -> bytes:
+    """Previous path: dataclass -> __dict__ -> validated pydantic model -> JSON."""
+
+    chart = analysis.chart
+    return AnalysisResponse(
+        chart={
+            "year_pillar": chart.year.__dict__,
+            "month_pillar": chart.month.__dict__,
+            "day_pillar": chart.day.__dict__,
+            "hour_pillar": chart.hour.__dict__ if chart.hour else None,
+        },
+        month_pillars=[p.__dict__ for p in month_pillars],
+        month_uncertain=month_uncertain,
+        hidden_stems=analysis.hidden_stems,
+        element_score=analysis.element_score.__dict__,
+        summary=analysis.summary,
+        routines=analysis.routines,
+        accuracy_note=analysis.accuracy_note,
+        daeun=None if daeun is None else daeun_payload(daeun),
+        ten_gods={key: None if g is None else g.__dict__ for key, g in gods.items()},
+        pillar_relations=[r.__dict__ for r in relations],
+    ).model_dump_json().encode("utf-8")
+
+
+def _time_per_call(fn, samples, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for parts in samples:
+            fn(*parts)
+        best = min(best, (time.perf_counter() - start) / len(samples))
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    samples = []
+    for i in range(args.samples):
+        birth_date = date(1950, 1, 1) + timedelta(days=i * 97)
+        birth_time = None if i % 5 == 0 else f"{(i * 7) % 24:02d}:{(i * 13) % 60:02d}"
+        samples.append(engine_parts(birth_date, birth_time))
+
+    mismatches = sum(pydantic_body(*parts) != encode_analysis(*parts) for parts in samples)
+    before = _time_per_call(pydantic_body, samples, args.repeat)
+    after = _time_per_call(encode_analysis, samples, args.repeat)
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}  samples: {len(samples)}  mismatches: {mismatches}")
+    print(f"pydantic model + model_dump_json: {before * 1e6:8.1f} us/response")
+    print(f"serialization.encode_analysis:    {after * 1e6:8.1f} us/response  ({before / after:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""Generate `app/lunar_table_data.py` (Korean lunisolar month table) offline.
+
+Why this exists
+- `calendar_type=LUNAR` needs lunar -> solar conversion at request time.
+- Evaluating new moons/중기 per request is far too slow, so the table is derived once
+  here (Skyfield + de421) and committed as compact per-year integers.
+
+How months are derived
+- Month starts: local date (Korean standard time of the era) of each new moon.
+- 중기(30° solar terms) come from the precomputed solar-term table.
+- The month containing 동지(270°) is month 11. If 13 months lie between two month-11s,
+  the first month without a 중기 is the leap month (repeats the previous month number).
+
+Usage (from backend/, de421.bsp available)
+  python scripts/build_lunar_table.py > app/lunar_table_data.py
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from skyfield import almanac  # noqa: E402
+
+from app.solar_term_table import TABLE_END_UTC, TABLE_START_UTC, get_solar_term_table  # noqa: E402
+from app.solar_terms import _ephemeris, _timescale  # noqa: E402
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2052  # de421 ends 2053-10, so lunar 2053 cannot be closed (needs 동지 2053).
+
+# Offset used to date new moons / 중기 (no DST). Before 1912 the published Korean tables
+# (KASI) follow the 시헌력 reckoned at UTC+8; later dates use Korean standard time.
+_STANDARD_OFFSETS = [
+    (datetime(1911, 12, 31, 15, 0, tzinfo=timezone.utc), timedelta(hours=9)),
+    (datetime(1954, 3, 20, 15, 0, tzinfo=timezone.utc), timedelta(hours=8, minutes=30)),
+    (datetime(1961, 8, 9, 15, 30, tzinfo=timezone.utc), timedelta(hours=9)),
+]
+_DEFAULT_OFFSET = timedelta(hours=8)
+SYNODIC_MONTH_DAYS = 29.530589
+
+
+def _local_date(when_utc: datetime) -> date:
+    offset = _DEFAULT_OFFSET
+    for start, value in _STANDARD_OFFSETS:
+        if when_utc >= start:
+            offset = value
+    return (when_utc + offset).date()
+
+
+def _new_moon_dates() -> list[date]:
+    ts = _timescale()
+    eph = _ephemeris()
+    t0 = ts.from_datetime(TABLE_START_UTC)
+    t1 = ts.from_datetime(TABLE_END_UTC)
+    times, phases = almanac.find_discrete(t0, t1, almanac.moon_phases(eph))
+    return [_local_date(t.utc_datetime()) for t, phase in zip(times, phases) if phase == 0]
+
+
+def _zhongqi_dates() -> list[tuple[date, float]]:
+    table = get_solar_term_table()
+    result = []
+    for when, deg in zip(table.when_utc, table.longitude_deg):
+        if float(deg) % 30.0 == 0.0:
+            result.append((_local_date(datetime.fromtimestamp(float(when), tz=timezone.utc)), float(deg)))
+    return result
+
+
+def build_months() -> list[tuple[date, int, bool]]:
+    """Return (start date, month number, is_leap) for every complete lunar month."""
+
+    starts = _new_moon_dates()
+    zhongqi = _zhongqi_dates()
+
+    months = []
+    for i in range(len(starts) - 1):
+        terms = [deg for d, deg in zhongqi if starts[i] <= d < starts[i + 1]]
+        months.append({"start": starts[i], "terms": terms})
+
+    m11 = [i for i, m in enumerate(months) if 270.0 in m["terms"]]
+    # The sui after the last computable 동지 runs past the ephemeris. Its length (12 or 13
+    # months) is estimated with mean motions; refuse if a new moon lands too close to 동지.
+    last_ws = next(d for d, deg in reversed(zhongqi) if deg == 270.0)
+    next_ws = last_ws + timedelta(days=365.2422)
+    projected = starts[-1]
+    while projected <= next_ws:
+        projected += timedelta(days=SYNODIC_MONTH_DAYS)
+        if abs((projected - next_ws).days) <= 2:
+            raise RuntimeError("cannot size the final sui from mean motion")
+    extra = int((next_ws - starts[-1]).days // SYNODIC_MONTH_DAYS)
+    m11.append(len(starts) - 1 + extra)
+
+    labelled: list[tuple[date, int, bool]] = []
+    for a, b in zip(m11, m11[1:]):
+        leap_at = None
+        if b - a == 13:
+            leap_at = next(i for i in range(a + 1, min(b, len(months))) if not months[i]["terms"])
+        number = 11
+        for i in range(a, min(b, len(months))):
+            is_leap = i == leap_at
+            if i != a and not is_leap:
+                number = number % 12 + 1
+            labelled.append((months[i]["start"], number, is_leap))
+    return labelled
+
+
+def encode_years(months: list[tuple[date, int, bool]]) -> list[int]:
+    """Per lunar year: (new-year day offset from Jan 1) << 17 | leap month << 13 | 30-day bits."""
+
+    encoded = []
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        first = next(i for i, (d, n, leap) in enumerate(months) if d.year == year and n == 1 and not leap)
+        nxt = next(i for i in range(first + 1, len(months)) if months[i][1] == 1 and not months[i][2])
+        leap_month = 0
+        bits = 0
+        for slot, i in enumerate(range(first, nxt)):
+            length = (months[i + 1][0] - months[i][0]).days
+            if length == 30:
+                bits |= 1 << slot
+            if months[i][2]:
+                leap_month = months[i][1]
+        offset = (months[first][0] - date(year, 1, 1)).days
+        encoded.append((offset << 17) | (leap_month << 13) | bits)
+    return encoded
+
+
+def main() -> int:
+    encoded = encode_years(build_months())
+    print('"""Korean lunisolar month table (generated by scripts/build_lunar_table.py; do not edit).')
+    print()
+    print("Per lunar year from LUNAR_TABLE_FIRST_YEAR:")
+    print("- bits 17..: lunar new year (month 1, day 1) as days after January 1 of the same solar year")
+    print("- bits 13..16: leap month number (0 = none); the leap month follows its regular month")
+    print("- bits 0..12: month lengths in calendar order including the leap month (1 = 30 days, 0 = 29)")
+    print('"""')
+    print()
+    print(f"LUNAR_TABLE_FIRST_YEAR = {FIRST_YEAR}")
+    print(f"LUNAR_TABLE_LAST_YEAR = {LAST_YEAR}")
+    print()
+    print("LUNAR_YEAR_INFO = (")
+    for i in range(0, len(encoded), 6):
+        print("    " + " ".join(f"0x{v:06x}," for v in encoded[i : i + 6]))
+    print(")")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from backend.app.daeun import calculate_daeun
+from backend.app.relations import pillar_relations, ten_gods
+from backend.app.saju import _year_date_for_pillar, _year_index, analyze, calculate_month_pillars_policy_c
+
+
+def analysis_parts(birth_date: date, birth_time: Optional[str], *, with_daeun: bool = True) -> tuple:
+    """`/api/analysis` 응답을 만드는 엔진 결과(encode_analysis 인자 순서). 월주 후보는 입춘 기준 연간."""
+
+    analysis = analyze(birth_date, birth_time)
+    month_pillars, month_uncertain = calculate_month_pillars_policy_c(
+        birth_date, birth_time, _year_index(_year_date_for_pillar(birth_date, birth_time)) % 10
+    )
+    daeun = calculate_daeun(birth_date, birth_time, "M") if with_daeun else None
+    return analysis, month_pillars, month_uncertain, daeun, ten_gods(analysis.chart), pillar_relations(analysis.chart)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.app import metrics
+from backend.app.admission import AdmissionConfig, AdmissionGate, AdmissionRejected
+
+
+def _gate(name: str, concurrency: int, queue: int, max_wait_ms: float = 1000.0) -> AdmissionGate:
+    return AdmissionGate(name, AdmissionConfig(concurrency=concurrency, queue=queue, max_wait_ms=max_wait_ms))
+
+
+async def _hold(gate: AdmissionGate, seconds: float, order: list, label: str) -> None:
+    await gate.acquire()
+    order.append(label)
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        gate.release(seconds)
+
+
+def test_excess_requests_queue_in_fifo_order() -> None:
+    gate = _gate("test_fifo", concurrency=1, queue=4)
+    order: list = []
+
+    async def scenario():
+        tasks = [asyncio.create_task(_hold(gate, 0.01, order, str(i))) for i in range(4)]
+        await asyncio.sleep(0)
+        assert gate.active == 1 and gate.queued == 3
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["0", "1", "2", "3"]
+    assert gate.active == 0 and gate.queued == 0
+
+
+def test_full_queue_is_rejected_immediately_with_retry_after() -> None:
+    gate = _gate("test_full", concurrency=1, queue=1)
+    rejected = metrics.ADMISSION_REJECTED.value(endpoint="test_full", reason="queue_full")
+
+    async def scenario():
+        holder = asyncio.create_task(_hold(gate, 0.05, [], "a"))
+        waiter = asyncio.create_task(_hold(gate, 0.0, [], "b"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as info:
+            await gate.acquire()
+        await asyncio.gather(holder, waiter)
+        return info.value
+
+    exc = asyncio.run(scenario())
+    assert exc.reason == "queue_full" and 1 <= exc.retry_after <= 60
+    assert metrics.ADMISSION_REJECTED.value(endpoint="test_full", reason="queue_full") == rejected + 1
+
+
+def test_waiting_longer_than_max_wait_is_rejected() -> None:
+    gate = _gate("test_timeout", concurrency=1, queue=4, max_wait_ms=20)
+
+    async def scenario():
+        holder = asyncio.create_task(_hold(gate, 0.2, [], "a"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as info:
+            await gate.acquire()
+        assert gate.queued == 0
+        await holder
+        return info.value
+
+    assert asyncio.run(scenario()).reason == "timeout"
+    assert gate.active == 0
+
+
+def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    gate = _gate("test_cancel", concurrency=1, queue=4)
+
+    async def scenario():
+        holder = asyncio.create_task(_hold(gate, 0.02, [], "a"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await holder
+        await gate.acquire()  # 자리가 반납되어 바로 들어갑니다.
+        gate.release()
+
+    asyncio.run(scenario())
+    assert gate.active == 0 and gate.queued == 0
+
+
+def test_config_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SAJU_ADMISSION_CONCURRENCY", "8")
+    monkeypatch.setenv("SAJU_ADMISSION_ANALYSIS_QUEUE", "3")
+    assert AdmissionConfig.from_env("analysis") == AdmissionConfig(concurrency=8, queue=3, max_wait_ms=5000.0)
+    monkeypatch.delenv("SAJU_ADMISSION_CONCURRENCY")
+    assert AdmissionConfig.from_env("stats").concurrency == 2
+
+
+def test_streaming_endpoints_hold_the_slot_until_the_body_is_sent() -> None:
+    pytest.importorskip("skyfield")
+    from backend.app import main
+
+    app = main.app
+    calendar = main.admission.gate("calendar")
+
+    async def call(query: bytes) -> tuple:
+        statuses: list = []
+        active_while_streaming: list = []
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.sleep(3600)  # 연결 끊김 없음
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+            elif message["type"] == "http.response.body" and message.get("body"):
+                active_while_streaming.append(calendar.active)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/calendar",
+            "raw_path": b"/api/calendar",
+            "root_path": "",
+            "query_string": query,
+            "headers": [],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        await app(scope, receive, send)
+        return statuses, active_while_streaming
+
+    ok_status, active = asyncio.run(call(b"from=1990-01-01&to=1999-12-31&format=csv"))
+    assert ok_status == [200]
+    assert len(active) > 1 and set(active) == {1}
+    assert calendar.active == 0
+
+    # 스트리밍 전에 끝나는 오류(400)도 자리를 바로 반납합니다.
+    bad_status, _ = asyncio.run(call(b"from=1990-13-01&to=1999-12-31"))
+    assert bad_status == [400]
+    assert calendar.active == 0
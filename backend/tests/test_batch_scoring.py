@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import os
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from backend.app.batch_scoring import PILLAR_COLUMNS, RESULT_COLUMNS, parse_row, score_rows
+from backend.app.jobs import JobConfig, JobManager, JobsFull, read_status, run_job
+from backend.app.saju import calculate_chart, calculate_elements
+
+
+def _reference(row: dict) -> dict:
+    parsed = parse_row(row)
+    chart = calculate_chart(
+        parsed.birth_date,
+        parsed.birth_time,
+        timezone=parsed.timezone,
+        historical_offset=parsed.historical_offset,
+        longitude=parsed.longitude,
+    )
+    score = calculate_elements(chart)
+    pillars = [chart.year, chart.month, chart.day, chart.hour]
+    result = {column: "" if p is None else p.stem + p.branch for column, p in zip(PILLAR_COLUMNS, pillars)}
+    result.update(score.elements_norm)
+    result["deficiency"] = score.top_deficiencies[0]
+    result["excess"] = score.top_excesses[0]
+    return result
+
+
+def test_rows_match_calculate_chart() -> None:
+    rng = random.Random(7)
+    rows = [
+        # 입춘 당일(경계 전후), 자시 일주 교체, 시간 미상의 경계일
+        {"birth_date": "1993-02-04", "birth_time": "05:30"},
+        {"birth_date": "1993-02-04", "birth_time": "05:40"},
+        {"birth_date": "1993-02-04", "birth_time": ""},
+        {"birth_date": "1995-08-28", "birth_time": "23:40"},
+        {"birth_date": "1988-05-15", "birth_time": "01:10", "use_historical_offset": "true"},
+        {"birth_date": "1995-08-28", "birth_time": "00:10", "city": "Busan"},
+        {"birth_date": "1995-08-28", "birth_time": "07:15", "timezone": "America/New_York"},
+        {"birth_date": "1990-01-01", "birth_time": "12:00", "calendar_type": "LUNAR"},
+    ]
+    for _ in range(300):
+        day = date(1901, 3, 1) + timedelta(days=rng.randrange(150 * 365))
+        rows.append(
+            {
+                "birth_date": day.isoformat(),
+                "birth_time": rng.choice(["", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"]),
+                "use_historical_offset": rng.choice(["", "true"]),
+                "longitude": rng.choice(["", "126.98", "129.1"]),
+            }
+        )
+    results = score_rows(rows)
+    for row, result in zip(rows, results):
+        assert result == _reference(row), row
+
+
+@pytest.mark.parametrize(
+    "row, message",
+    [
+        ({"birth_date": "1995-13-01"}, "birth_date must be YYYY-MM-DD"),
+        ({"birth_date": "1995-08-28", "birth_time": "25:00"}, "birth_time must be HH:MM"),
+        ({"birth_date": "1995-08-28", "longitude": "east"}, "longitude must be a number"),
+        ({"birth_date": "1995-08-28", "city": "Atlantis"}, "unknown city: Atlantis"),
+        ({"birth_date": "1995-08-28", "use_historical_offset": "maybe"}, "use_historical_offset must be true or false"),
+    ],
+)
+def test_invalid_rows_report_errors(row: dict, message: str) -> None:
+    valid = {"birth_date": "1995-08-28", "birth_time": "05:30"}
+    bad, good = score_rows([row, valid])
+    assert bad == {"error": message}
+    assert good == _reference(valid)
+
+
+def _write_job(tmp_path, body: str, fmt: str = "csv") -> str:
+    manager = JobManager(JobConfig(directory=str(tmp_path), workers=0))
+
+    async def chunks():
+        yield body.encode("utf-8")
+
+    async def submit():
+        status = await manager.submit(chunks(), fmt)
+        # 백그라운드 실행은 여기서 기다리지 않고 run_job을 직접 부릅니다.
+        for task in list(manager._tasks):
+            task.cancel()
+        return status
+
+    status = asyncio.run(submit())
+    return os.path.join(str(tmp_path), status.id)
+
+
+def test_run_job_writes_results_in_chunks(tmp_path) -> None:
+    lines = ["name,birth_date,birth_time"] + [f"p{i},1990-03-{1 + i % 28:02d},{i % 24:02d}:05" for i in range(25)]
+    lines.append("broken,1990-02-30,")
+    directory = _write_job(tmp_path, "\n".join(lines) + "\n")
+
+    status = run_job(directory, "csv", chunk_rows=10)
+    assert (status.state, status.rows, status.error_rows) == ("done", 26, 1)
+    assert read_status(directory) == status
+
+    with open(os.path.join(directory, "result.csv"), encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == ["name", "birth_date", "birth_time"] + RESULT_COLUMNS
+        output = list(reader)
+    assert [row["name"] for row in output] == [f"p{i}" for i in range(25)] + ["broken"]
+    expected = _reference({"birth_date": "1990-03-01", "birth_time": "00:05"})
+    assert output[0]["day_pillar"] == expected["day_pillar"]
+    assert float(output[0]["wood"]) == expected["wood"]
+    assert output[-1]["error"] == "birth_date must be YYYY-MM-DD"
+
+
+def test_run_job_fails_without_birth_date(tmp_path) -> None:
+    directory = _write_job(tmp_path, "name,birth_time\np0,05:30\n")
+    status = run_job(directory, "csv", chunk_rows=10)
+    assert status.state == "failed"
+    assert "missing columns: birth_date" in status.error
+    assert not os.path.exists(os.path.join(directory, "result.csv"))
+
+
+def test_cancelled_job_stops(tmp_path) -> None:
+    directory = _write_job(tmp_path, "birth_date\n1990-03-01\n")
+    open(os.path.join(directory, "cancel"), "w").close()
+    assert run_job(directory, "csv", chunk_rows=10).state == "cancelled"
+
+
+def test_submit_limits(tmp_path) -> None:
+    manager = JobManager(JobConfig(directory=str(tmp_path), workers=0, max_active=1))
+
+    async def chunks():
+        yield b"birth_date\n1990-03-01\n"
+
+    async def submit_two():
+        await manager.submit(chunks(), "csv")
+        with pytest.raises(JobsFull):
+            await manager.submit(chunks(), "csv")
+        with pytest.raises(ValueError):
+            await manager.submit(chunks(), "xlsx")
+        await asyncio.gather(*manager._tasks)
+
+    asyncio.run(submit_two())
+    assert manager.active == 0
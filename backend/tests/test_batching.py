@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.app.batching import BatchConfig, MicroBatcher
+
+
+def test_concurrent_items_share_one_handler_call() -> None:
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, BatchConfig(window_ms=20, max_size=100))
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+
+    assert asyncio.run(scenario()) == [i * 2 for i in range(10)]
+    assert calls == [list(range(10))]
+    assert batcher.stats()["largest_batch"] == 10
+
+
+def test_max_size_flushes_without_waiting_for_window() -> None:
+    sizes = []
+
+    def handler(items):
+        sizes.append(len(items))
+        return list(items)
+
+    batcher = MicroBatcher(handler, BatchConfig(window_ms=10_000, max_size=4))
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(8))), timeout=1.0)
+
+    assert asyncio.run(scenario()) == list(range(8))
+    assert sizes == [4, 4]
+
+
+def test_item_errors_stay_with_their_request() -> None:
+    def handler(items):
+        return [ValueError(f"bad {item}") if item % 2 else item for item in items]
+
+    batcher = MicroBatcher(handler, BatchConfig(window_ms=5, max_size=10))
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(4)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError) and str(results[3]) == "bad 3"
+
+
+def test_batch_failure_reaches_every_request() -> None:
+    class Overloaded(RuntimeError):
+        pass
+
+    async def run(fn, items):
+        raise Overloaded("full")
+
+    batcher = MicroBatcher(lambda items: items, BatchConfig(window_ms=5, max_size=10), run=run)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, Overloaded) for r in asyncio.run(scenario()))
+
+
+def test_config_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SAJU_BATCH_WINDOW_MS", "0")
+    monkeypatch.setenv("SAJU_BATCH_MAX_SIZE", "0")
+    assert BatchConfig.from_env() == BatchConfig(window_ms=0.0, max_size=1)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.app.saju import calculate_chart, iter_calendar_days
+
+
+def _s(pillar) -> str:
+    return pillar.stem + pillar.branch
+
+
+def test_calendar_ipchun_day_matches_calculate_chart() -> None:
+    # 1993-02-04: 입춘 절입(04:37, 앱 override)으로 연주/월주가 그날 안에서 바뀝니다.
+    days = list(iter_calendar_days(date(1993, 2, 3), date(1993, 2, 5)))
+    assert [d.date for d in days] == [date(1993, 2, 3), date(1993, 2, 4), date(1993, 2, 5)]
+
+    ipchun_day = days[1]
+    assert ipchun_day.boundary is not None
+    assert ipchun_day.boundary.name == "입춘"
+    assert ipchun_day.boundary.when_kst.strftime("%H:%M") == "04:37"
+    assert days[0].boundary is None and days[2].boundary is None
+
+    before = calculate_chart(date(1993, 2, 4), "00:00")
+    after = calculate_chart(date(1993, 2, 4), "23:59")
+    assert _s(ipchun_day.year_start) == _s(before.year) == "壬申"
+    assert _s(ipchun_day.month_start) == _s(before.month) == "癸丑"
+    assert _s(ipchun_day.year_end) == _s(after.year) == "癸酉"
+    assert _s(ipchun_day.month_end) == _s(after.month) == "甲寅"
+    assert _s(ipchun_day.day) == _s(before.day) == "丙辰"
+
+
+def test_calendar_hour_pillars_match_calculate_chart() -> None:
+    (day,) = iter_calendar_days(date(1995, 8, 28), date(1995, 8, 28))
+
+    assert len(day.hour_pillars) == 12
+    assert _s(day.hour_pillars[3]) == _s(calculate_chart(date(1995, 8, 28), "05:30").hour) == "辛卯"
+    assert _s(day.hour_pillars[6]) == _s(calculate_chart(date(1995, 8, 28), "12:10").hour)
+
+
+def test_calendar_rejects_range_outside_table() -> None:
+    with pytest.raises(ValueError):
+        next(iter_calendar_days(date(1850, 1, 1), date(1850, 1, 2)))
+    with pytest.raises(ValueError):
+        next(iter_calendar_days(date(2000, 1, 2), date(2000, 1, 1)))
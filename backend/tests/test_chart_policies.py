@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.app.saju import ChartPolicy, calculate_chart, evaluate_chart_policies
+
+
+def _pillar_str(pillar) -> str:
+    return pillar.stem + pillar.branch if pillar else ""
+
+
+def test_default_policy_matches_calculate_chart() -> None:
+    # 입춘 절입일(1993-02-04) 23:40: 기존 calculate_chart 결과와 기본 정책 결과가 같아야 합니다.
+    chart = calculate_chart(date(1993, 2, 4), "23:40")
+    result = evaluate_chart_policies(date(1993, 2, 4), "23:40", ["default"])
+
+    default = result.charts["default"]
+    assert _pillar_str(default.year) == _pillar_str(chart.year)
+    assert _pillar_str(default.month) == _pillar_str(chart.month)
+    assert _pillar_str(default.day) == _pillar_str(chart.day)
+    assert _pillar_str(default.hour) == _pillar_str(chart.hour)
+    assert result.divergent_pillars == []
+
+
+def test_policies_flag_divergent_pillars() -> None:
+    # 23:40 출생은 자시 일주 교체 여부(midnight_day)에 따라 일주가 갈립니다.
+    result = evaluate_chart_policies(date(1993, 2, 4), "23:40", ["default", "midnight_day"])
+
+    assert result.divergent_pillars == ["day"]
+    assert _pillar_str(result.charts["default"].day) == "丁巳"
+    assert _pillar_str(result.charts["midnight_day"].day) == "丙辰"
+    # 야자시여도 시주는 다음날 일간 기준 子시(庚子)로 유지됩니다.
+    assert _pillar_str(result.charts["midnight_day"].hour) == "庚子"
+
+
+def test_odd_hour_on_the_hour_policy() -> None:
+    result = evaluate_chart_policies(date(1993, 2, 4), "15:00", ["default", "strict_hour"])
+
+    assert result.charts["default"].hour.branch == "未"
+    assert result.charts["strict_hour"].hour.branch == "申"
+    assert result.divergent_pillars == ["hour"]
+
+
+def test_crossing_lookups_are_shared_across_policies(monkeypatch: pytest.MonkeyPatch) -> None:
+    from backend.app import saju as saju_module
+
+    calls = {"policy_c": 0}
+    original = saju_module.calculate_month_pillars_policy_c
+
+    def _counting(*args, **kwargs):
+        calls["policy_c"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(saju_module, "calculate_month_pillars_policy_c", _counting)
+
+    policies = [
+        ChartPolicy(name="a"),
+        ChartPolicy(name="b", zi_day_rollover=False),
+        ChartPolicy(name="c", odd_hour_inclusive=False),
+    ]
+    evaluate_chart_policies(date(1993, 2, 4), "04:36", policies)
+
+    assert calls["policy_c"] == 1
+
+
+def test_unknown_policy_name_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        evaluate_chart_policies(date(1993, 2, 4), "04:36", ["no_such_policy"])
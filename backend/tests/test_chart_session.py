@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.app.chart_session import ChartSession, chart_state
+from backend.app.saju import calculate_chart
+
+
+def _time(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+@pytest.mark.parametrize(
+    "birth_date, options",
+    [
+        (date(1993, 2, 4), {}),  # 입춘 절입일(연/월주가 하루 안에서 바뀜)
+        (date(1995, 8, 28), {"longitude": 126.98}),
+        (date(1988, 9, 7), {"historical_offset": True}),
+        (date(1993, 2, 3), {"timezone": "America/New_York"}),
+    ],
+)
+def test_session_chart_matches_calculate_chart(birth_date: date, options: dict) -> None:
+    session = ChartSession()
+    for birth_time in [_time(m) for m in range(0, 1440, 7)] + [None]:
+        chart, _ = session.chart(birth_date, birth_time, **options)
+        assert chart == calculate_chart(birth_date, birth_time, **options), birth_time
+
+
+def test_minute_edits_reuse_context_and_send_diffs() -> None:
+    session = ChartSession()
+    first = session.update(date(1995, 8, 28), "05:30")
+    assert first.full and not first.reused_context
+    assert first.changes == chart_state(calculate_chart(date(1995, 8, 28), "05:30"))
+
+    assert session.is_warm(date(1995, 8, 28), "05:31")
+    same_hour = session.update(date(1995, 8, 28), "05:31")
+    assert not same_hour.full and same_hour.reused_context
+    assert same_hour.changes == {}
+
+    next_hour = session.update(date(1995, 8, 28), "07:31")
+    assert next_hour.reused_context
+    assert set(next_hour.changes) >= {"hour", "elements_norm", "ten_gods"}
+    assert "year" not in next_hour.changes and "month" not in next_hour.changes
+    assert next_hour.changes["hour"] == chart_state(calculate_chart(date(1995, 8, 28), "07:31"))["hour"]
+
+
+def test_boundary_crossing_computes_new_segment_once() -> None:
+    session = ChartSession()
+    session.update(date(1993, 2, 4), "04:00")
+    assert not session.is_warm(date(1993, 2, 4), "05:00")  # 입춘(04:37 무렵) 이후는 새 구간
+    crossed = session.update(date(1993, 2, 4), "05:00")
+    assert not crossed.reused_context
+    assert {"year", "month"} <= set(crossed.changes)
+    assert session.is_warm(date(1993, 2, 4), "06:00")
+    assert session.is_warm(date(1993, 2, 4), "03:00")
+
+
+def test_date_change_builds_new_context_and_evicts_old() -> None:
+    session = ChartSession(max_contexts=2)
+    for day in (1, 2, 3):
+        session.update(date(2000, 5, day), "12:00")
+    assert not session.is_warm(date(2000, 5, 1), "12:00")
+    assert session.is_warm(date(2000, 5, 3), "12:00")
+    session.reset()
+    assert session.update(date(2000, 5, 3), "12:00").full
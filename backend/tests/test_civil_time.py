@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.civil_time import KOREA_CIVIL_TIME, to_fixed_kst, wall_minutes_to_kst_minutes
+from backend.app.saju import calculate_chart
+
+
+def _wall_minutes(dt: datetime) -> int:
+    return (dt - datetime(1970, 1, 1)) // timedelta(minutes=1)
+
+
+@pytest.mark.parametrize(
+    ("wall", "offset_hours", "is_dst"),
+    [
+        (datetime(1905, 1, 1, 12, 0), 8 + 27 / 60 + 52 / 3600, False),
+        (datetime(1910, 1, 1, 12, 0), 8.5, False),
+        (datetime(1948, 7, 1, 12, 0), 10.0, True),
+        (datetime(1958, 7, 1, 12, 0), 9.5, True),
+        (datetime(1958, 12, 1, 12, 0), 8.5, False),
+        (datetime(1988, 9, 7, 19, 2), 10.0, True),
+        (datetime(1988, 10, 20, 12, 0), 9.0, False),
+        # 서머타임 종료(1988-10-09 03:00 -> 02:00)로 두 번 나오는 02:30은 서머타임으로 해석
+        (datetime(1988, 10, 9, 2, 30), 10.0, True),
+        # 서머타임 시작(1987-05-10 02:00 -> 03:00)으로 건너뛴 02:30은 이전 오프셋
+        (datetime(1987, 5, 10, 2, 30), 9.0, False),
+    ],
+)
+def test_offset_at_wall(wall: datetime, offset_hours: float, is_dst: bool) -> None:
+    offset, dst = KOREA_CIVIL_TIME.offset_at_wall(wall)
+
+    assert offset == round(offset_hours * 3600)
+    assert dst is is_dst
+
+
+def test_offsets_match_zoneinfo_when_available() -> None:
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        seoul = zoneinfo.ZoneInfo("Asia/Seoul")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("tz database is not installed")
+
+    walls = [datetime(1900, 1, 1) + timedelta(hours=7 * i + 0.5) for i in range(0, 200_000, 37)]
+    for key in KOREA_CIVIL_TIME.wall_keys[1:]:
+        base = datetime(1970, 1, 1) + timedelta(seconds=float(key))
+        walls.extend(base + timedelta(minutes=m) for m in range(-90, 91, 10))
+
+    for wall in walls:
+        assert KOREA_CIVIL_TIME.offset_at_wall(wall)[0] == wall.replace(tzinfo=seoul).utcoffset().total_seconds()
+
+
+def test_vectorized_conversion_matches_scalar() -> None:
+    walls = [datetime(1988, 9, 7, 19, 2), datetime(1960, 6, 1, 0, 10), datetime(1990, 6, 1, 0, 10)]
+    converted = wall_minutes_to_kst_minutes(np.array([_wall_minutes(w) for w in walls]))
+
+    for wall, kst_minutes in zip(walls, converted):
+        fixed_date, fixed_time, _ = to_fixed_kst(wall.date(), wall.strftime("%H:%M"))
+        expected = datetime.combine(fixed_date, datetime.strptime(fixed_time, "%H:%M").time())
+        assert int(kst_minutes) == _wall_minutes(expected)
+
+
+def test_historical_offset_is_opt_in_for_charts() -> None:
+    # 1988-09-07 19:02 서머타임 -> KST 18:02 (시지 戌 -> 酉)
+    assert calculate_chart(date(1988, 9, 7), "19:02").hour.branch == "戌"
+    corrected = calculate_chart(date(1988, 9, 7), "19:02", historical_offset=True)
+    assert corrected.hour.branch == "酉"
+
+    # 1960-06-01 00:10(UTC+9:30)은 KST 5월 31일 23:40 -> 자시, 일주는 6월 1일 그대로
+    fixed_date, fixed_time, note = to_fixed_kst(date(1960, 6, 1), "00:10")
+    assert (fixed_date, fixed_time) == (date(1960, 5, 31), "23:40")
+    assert note and "서머타임" in note
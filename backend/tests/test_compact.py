@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+pytest.importorskip("msgpack")
+
+from backend.app import compact  # noqa: E402
+from backend.app.compatibility import top_k_matches  # noqa: E402
+from backend.app.daily_fortune import daily_feed, daily_feed_interactions  # noqa: E402
+from backend.app.relations import chart_indices, relation_names  # noqa: E402
+from backend.app.response_cache import etag_for  # noqa: E402
+from backend.app.saju import (  # noqa: E402
+    ELEMENTS,
+    analyze,
+    build_original_result,
+    summary_for_element,
+)
+from backend.app.serialization import encode_analysis  # noqa: E402
+from backend.tests.helpers_responses import analysis_parts  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, compact.JSON_MEDIA_TYPE),
+        ("*/*", compact.JSON_MEDIA_TYPE),
+        ("application/json", compact.JSON_MEDIA_TYPE),
+        ("application/msgpack", compact.MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack", compact.MSGPACK_MEDIA_TYPE),
+        ("application/msgpack, application/json", compact.MSGPACK_MEDIA_TYPE),
+        ("application/json, application/msgpack;q=0.5", compact.JSON_MEDIA_TYPE),
+        ("application/msgpack;q=0", compact.JSON_MEDIA_TYPE),
+        ("application/msgpack;q=0.9, */*;q=0.1", compact.MSGPACK_MEDIA_TYPE),
+    ],
+)
+def test_negotiate(accept, expected: str) -> None:
+    assert compact.negotiate(accept) == expected
+
+
+def test_negotiate_falls_back_to_json_without_msgpack(monkeypatch) -> None:
+    monkeypatch.setattr(compact, "msgpack", None)
+    assert compact.negotiate("application/msgpack") == compact.JSON_MEDIA_TYPE
+
+
+@pytest.mark.parametrize(
+    "birth_date, birth_time, with_daeun",
+    [
+        (date(1995, 8, 28), "05:30", True),
+        (date(1993, 2, 4), None, True),
+        (date(1988, 9, 20), "23:40", False),
+        (date(2024, 1, 15), None, False),  # 1월~입춘 전: 월주 후보는 전년 연간 기준
+    ],
+)
+def test_analysis_decodes_to_json_values(birth_date: date, birth_time, with_daeun: bool) -> None:
+    parts = analysis_parts(birth_date, birth_time, with_daeun=with_daeun)
+    body = compact.encode_analysis(*parts)
+    expected = json.loads(encode_analysis(*parts))
+    decoded = compact.unpackb(body)
+    tables = compact.tables()
+
+    def pillar(i):
+        return None if i < 0 else {"stem": tables["stems"][i % 10], "branch": tables["branches"][i % 12]}
+
+    assert decoded["v"] == compact.COMPACT_VERSION
+    keys = ["year_pillar", "month_pillar", "day_pillar", "hour_pillar"]
+    assert {k: pillar(i) for k, i in zip(keys, decoded["chart"])} == expected["chart"]
+    assert [pillar(i) for i in decoded["month_pillars"]] == expected["month_pillars"]
+    assert expected["month_pillars"][-1] == expected["chart"]["month_pillar"]
+    assert decoded["month_uncertain"] == expected["month_uncertain"]
+
+    score = expected["element_score"]
+    assert dict(zip(ELEMENTS, decoded["elements_raw"])) == score["elements_raw"]
+    assert dict(zip(ELEMENTS, decoded["elements_norm"])) == score["elements_norm"]
+    assert {e: tables["status_levels"][s] for e, s in zip(ELEMENTS, decoded["status"])} == score["status"]
+    assert [ELEMENTS[i] for i in decoded["top_deficiencies"]] == score["top_deficiencies"]
+    assert [ELEMENTS[i] for i in decoded["top_excesses"]] == score["top_excesses"]
+    focus = decoded["top_deficiencies"][0]
+    assert tables["summaries"][focus] == expected["summary"] == summary_for_element(ELEMENTS[focus])
+    assert {"primary": tables["routines"][focus]} == expected["routines"]
+    assert decoded["accuracy_note"] == expected["accuracy_note"]
+
+    for key, i in zip(keys, decoded["chart"]):
+        branch_key = key.replace("pillar", "branch")
+        if i >= 0:
+            hidden = [[tables["stems"][s], ratio] for s, ratio in tables["hidden_stems"][i % 12]]
+            assert hidden == expected["hidden_stems"][branch_key]
+
+    if expected["daeun"] is None:
+        assert decoded["daeun"] is None
+    else:
+        daeun = decoded["daeun"]
+        assert ("forward" if daeun["forward"] else "backward") == expected["daeun"]["direction"]
+        assert [
+            {"age": a, "start_date": d, **pillar(p)}
+            for a, d, p in zip(daeun["ages"], daeun["start_dates"], daeun["pillars"])
+        ] == expected["daeun"]["pillars"]
+
+    def god(g):
+        if g is None:
+            return None
+        return {"stem": "일간" if g[0] < 0 else tables["ten_gods"][g[0]], "branch": tables["ten_gods"][g[1]]}
+
+    gods = {key: god(g) for key, g in zip(tables["pillar_keys"], decoded["ten_gods"])}
+    assert gods == expected["ten_gods"]
+    assert [
+        {"first": tables["pillar_keys"][a], "second": tables["pillar_keys"][b], "relations": relation_names(bits)}
+        for a, b, bits in decoded["pillar_relations"]
+    ] == expected["pillar_relations"]
+
+    assert len(body) < len(encode_analysis(*parts)) / 2
+
+
+def test_original_pillars_are_indices() -> None:
+    original = build_original_result(date(1995, 8, 28), "05:30", None)
+    body = compact.encode_original(original, [], False)
+    decoded = compact.unpackb(body)
+    tables = compact.tables()
+    for key, i in zip(tables["pillar_keys"], decoded["pillars"]):
+        pillar = original.pillars[key]
+        assert (tables["stems"][i % 10], tables["branches"][i % 12]) == (pillar.stem, pillar.branch)
+        assert ELEMENTS[tables["stem_elements"][i % 10]] == pillar.stem_element
+        assert ELEMENTS[tables["branch_elements"][i % 12]] == pillar.branch_element
+    assert decoded["raw_text"] == original.raw_text
+
+
+def test_daily_columns_match_feed() -> None:
+    natal = chart_indices(analyze(date(1995, 8, 28), "05:30").chart)
+    tables = compact.tables()
+    start = date(2024, 1, 1)
+    feed = daily_feed(natal, start, 10)
+    decoded = compact.unpackb(
+        compact.encode_daily([e.day for e in feed], daily_feed_interactions(natal, start, 10))
+    )
+    assert decoded["dates"] == [e.day.isoformat() for e in feed]
+    for i, entry in enumerate(feed):
+        index = decoded["day_pillars"][i]
+        assert (tables["stems"][index % 10], tables["branches"][index % 12]) == (entry.pillar.stem, entry.pillar.branch)
+        assert tables["ten_gods"][decoded["ten_gods"][i]] == entry.ten_god
+        assert dict(zip(ELEMENTS, decoded["element_delta"][i])) == entry.element_delta
+        assert decoded["balance_delta"][i] == entry.balance_delta
+        named = {k: relation_names(b) for k, b in zip(tables["pillar_keys"], decoded["relations"][i]) if b}
+        assert named == entry.relations
+
+
+def test_matches_are_row_arrays() -> None:
+    rng = np.random.default_rng(0)
+    members = rng.integers(0, 60, size=(3, 4))
+    candidates = rng.integers(0, 60, size=(20, 4))
+    matches = top_k_matches(members, candidates, 5)
+    decoded = compact.unpackb(compact.encode_matches(matches.indices, matches.scores))
+    assert decoded["candidates"] == matches.indices.tolist()
+    assert decoded["scores"] == [[round(float(v), 2) for v in row] for row in matches.scores]
+
+
+def test_representations_have_distinct_etags() -> None:
+    json_etag = etag_for("/api/analysis", "birth_date=1995-08-28")
+    assert json_etag == etag_for("/api/analysis", "birth_date=1995-08-28", "")
+    assert json_etag != etag_for("/api/analysis", "birth_date=1995-08-28", compact.MSGPACK_MEDIA_TYPE)
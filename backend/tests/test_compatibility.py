@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from backend.app.compatibility import (
+    BRANCH_RELATIONS,
+    compatibility_scores,
+    element_vectors,
+    top_k_matches,
+)
+from backend.app.relations import chart_indices
+from backend.app.saju import ELEMENTS, BRANCHES, calculate_chart, calculate_elements
+
+
+def _random_indices(rng: np.random.Generator, n: int) -> np.ndarray:
+    indices = rng.integers(0, 60, size=(n, 4)).astype(np.int16)
+    indices[rng.random(n) < 0.2, 3] = -1  # 시주 미상
+    return indices
+
+
+@pytest.mark.parametrize("birth_time", ["22:59", None])
+def test_element_vectors_match_calculate_elements(birth_time) -> None:
+    chart = calculate_chart(date(1995, 8, 28), birth_time)
+    vector = element_vectors(chart_indices(chart)[None, :])[0]
+    expected = calculate_elements(chart).elements_norm
+
+    assert vector * 100 == pytest.approx([expected[e] for e in ELEMENTS], abs=0.01)
+
+
+def test_branch_relations_table() -> None:
+    b = BRANCHES.index
+    assert BRANCH_RELATIONS[b("子"), b("丑")] == 1.0
+    assert BRANCH_RELATIONS[b("寅"), b("亥")] == 1.0
+    assert BRANCH_RELATIONS[b("子"), b("午")] == -1.0
+    assert BRANCH_RELATIONS[b("子"), b("子")] == 0.0
+    assert (BRANCH_RELATIONS == BRANCH_RELATIONS.T).all()
+
+
+def test_scores_are_bounded_and_reward_day_branch_combine() -> None:
+    rng = np.random.default_rng(1)
+    scores = compatibility_scores(_random_indices(rng, 200), _random_indices(rng, 300))
+    assert scores.shape == (200, 300)
+    assert scores.min() >= 0.0 and scores.max() <= 100.0
+
+    # 일주 乙丑 기준: 상대 일주 丙子(丑과 육합)가 辛未(丑과 충)보다 높습니다.
+    base = np.array([[11, 20, 1, 35]], dtype=np.int16)
+    others = np.array([[11, 20, 12, 35], [11, 20, 7, 35]], dtype=np.int16)
+    pair = compatibility_scores(base, others)[0]
+    assert pair[0] > pair[1]
+
+
+@pytest.mark.parametrize("chunk_elements", [None, 5000, 7])
+def test_chunked_top_k_matches_full_matrix(chunk_elements) -> None:
+    rng = np.random.default_rng(2)
+    a, b = _random_indices(rng, 300), _random_indices(rng, 900)
+    full = compatibility_scores(a, b)
+
+    matches = top_k_matches(a, b, 5, chunk_elements=chunk_elements)
+
+    assert matches.scores.shape == (300, 5)
+    assert np.allclose(matches.scores, -np.sort(-full, axis=1)[:, :5], atol=1e-4)
+    assert np.allclose(np.take_along_axis(full, matches.indices, axis=1), matches.scores)
+    assert (np.diff(matches.scores, axis=1) <= 0).all()
+
+
+def test_top_k_excludes_self_and_clamps_k() -> None:
+    rng = np.random.default_rng(3)
+    pool = _random_indices(rng, 50)
+
+    matches = top_k_matches(pool, pool, 3, exclude_same_index=True, chunk_elements=100)
+    assert not (matches.indices == np.arange(50)[:, None]).any()
+
+    assert top_k_matches(pool[:2], pool[:3], 10).scores.shape == (2, 3)
+    with pytest.raises(ValueError):
+        top_k_matches(pool, pool, 0)
+    with pytest.raises(ValueError):
+        element_vectors(np.array([[0, 0, 60, 0]]))
+
+
+@pytest.mark.parametrize("birth_time", ["25:00", "12:60", "abc", "12:5x", "7"])
+def test_invalid_birth_time_is_a_bad_request(birth_time) -> None:
+    from fastapi import HTTPException
+
+    from backend.app.main import _natal_chart
+    from backend.app.schemas import ChartInput
+
+    with pytest.raises(HTTPException) as excinfo:
+        _natal_chart(ChartInput(birth_date="1990-03-01", gender="M", birth_time=birth_time))
+    assert (excinfo.value.status_code, excinfo.value.detail) == (400, "birth_time must be HH:MM")
+    assert _natal_chart(ChartInput(birth_date="1990-03-01", gender="M", birth_time="07:05")).hour is not None
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.daeun import calculate_daeun, daeun_indices_many
+from backend.app.saju import BRANCHES, STEMS
+from backend.app.solar_term_table import get_solar_term_table
+
+
+def _s(p) -> str:
+    return p.stem + p.branch
+
+
+def test_daeun_direction_follows_year_polarity_and_gender() -> None:
+    # 乙亥年(음년) 甲申월: 남자 역행(직전 절 입추), 여자 순행(다음 절 백로)
+    male = calculate_daeun(date(1995, 8, 28), "22:59", "M")
+    female = calculate_daeun(date(1995, 8, 28), "22:59", "F")
+
+    assert not male.forward and male.term_name == "입추"
+    assert [_s(p.pillar) for p in male.pillars[:3]] == ["癸未", "壬午", "辛巳"]
+    assert male.start_age == 7
+    assert male.start_age_years == pytest.approx(6.86, abs=0.01)
+
+    assert female.forward and female.term_name == "백로"
+    assert [_s(p.pillar) for p in female.pillars[:3]] == ["乙酉", "丙戌", "丁亥"]
+    assert female.start_age == 4
+
+    assert len(male.pillars) == 10
+    assert [p.age for p in male.pillars] == list(range(7, 107, 10))
+
+
+def test_batch_daeun_matches_scalar() -> None:
+    cases = [
+        (date(1995, 8, 28), "22:59", "M"),
+        (date(1995, 8, 28), "22:59", "F"),
+        (date(1993, 2, 4), "04:40", "M"),
+        (date(1988, 9, 7), "19:02", "F"),
+        (date(2001, 3, 6), "14:20", "M"),
+    ]
+    minutes = np.array(
+        [
+            (datetime.combine(d, datetime.strptime(t, "%H:%M").time()) - datetime(1970, 1, 1)) // timedelta(minutes=1)
+            for d, t, _ in cases
+        ]
+    )
+    forward, years, pillars = daeun_indices_many(
+        get_solar_term_table(), minutes, np.array([g == "M" for _, _, g in cases])
+    )
+
+    for i, (d, t, g) in enumerate(cases):
+        result = calculate_daeun(d, t, g)
+        assert bool(forward[i]) == result.forward
+        assert years[i] == pytest.approx(result.start_age_years, abs=1e-6)
+        assert [STEMS[k % 10] + BRANCHES[k % 12] for k in pillars[i]] == [_s(p.pillar) for p in result.pillars]
+
+
+def test_invalid_gender_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        calculate_daeun(date(1995, 8, 28), "22:59", "X")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.daily_fortune import (
+    daily_feed,
+    daily_feed_for_users,
+    daily_interactions_for_date,
+)
+from backend.app.relations import chart_indices
+from backend.app.saju import ELEMENTS, calculate_chart, calculate_elements
+
+NATAL = calculate_chart(date(1995, 8, 28), "22:59")  # 乙亥 甲申 辛卯 己亥
+
+
+def test_feed_day_pillars_match_calculate_chart() -> None:
+    start = date(2024, 2, 27)
+    feed = daily_feed(chart_indices(NATAL), start, 5)
+
+    assert [f.day for f in feed] == [start + timedelta(days=i) for i in range(5)]
+    for entry in feed:
+        day = calculate_chart(entry.day, "12:00").day
+        assert (entry.pillar.stem, entry.pillar.branch) == (day.stem, day.branch)
+
+
+def test_feed_interactions_with_natal_chart() -> None:
+    entry = daily_feed(chart_indices(NATAL), date(2026, 10, 19), 1)[0]  # 丙寅일
+
+    assert (entry.pillar.stem, entry.pillar.branch) == ("丙", "寅")
+    assert entry.ten_god == "정관"  # 辛 일간에 丙
+    assert entry.relations["month"] == ["clash", "punish"]  # 寅申
+    assert entry.relations["day"] == ["stem_combine"]  # 丙辛
+    assert sum(entry.element_delta.values()) == pytest.approx(0.0, abs=0.05)
+    assert entry.element_delta["fire"] > 0  # 원국에 없는 화를 보완
+    assert entry.balance_delta > 0
+
+
+def test_element_delta_is_relative_to_calculate_elements() -> None:
+    natal = calculate_elements(NATAL).elements_norm
+    entry = daily_feed(chart_indices(NATAL), date(2026, 10, 19), 1)[0]
+    # 일진을 더한 비율 = 원국 비율 + 변화량(0~100 범위 유지)
+    for element in ELEMENTS:
+        assert 0.0 <= natal[element] + entry.element_delta[element] <= 100.0
+
+
+def test_batch_for_date_matches_single_user_feed() -> None:
+    charts = [NATAL, calculate_chart(date(1988, 9, 7), None), calculate_chart(date(2001, 3, 6), "14:20")]
+    natal = np.stack([chart_indices(c) for c in charts])
+    target = date(2026, 10, 20)
+
+    batch = daily_feed_for_users(natal, target)
+    for chart, entry in zip(charts, batch):
+        assert entry == daily_feed(chart_indices(chart), target, 1)[0]
+
+    arrays = daily_interactions_for_date(np.repeat(natal, 1000, axis=0), target)
+    assert arrays.relations.shape == (3000, 4)
+    assert (arrays.relations[1000:2000, 3] == 0).all()  # 시주 미상
+
+
+def test_feed_day_limit() -> None:
+    with pytest.raises(ValueError):
+        daily_feed(chart_indices(NATAL), date(2026, 1, 1), 0)
+
+
+def test_feed_endpoint_runs_on_the_engine_executor(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    from backend.app import main
+
+    calls = []
+    run = main.engine.run
+
+    async def recording_run(fn, *args, **kwargs):
+        calls.append(fn.__name__)
+        return await run(fn, *args, **kwargs)
+
+    monkeypatch.setattr(main.engine, "run", recording_run)
+    with TestClient(main.app) as client:
+        response = client.post(
+            "/api/daily",
+            json={
+                "birth_date": "1995-08-28",
+                "birth_time": "22:59",
+                "gender": "M",
+                "start_date": "2026-10-19",
+                "days": 3,
+            },
+        )
+        bad = client.post("/api/daily", json={"birth_date": "1995-08-28", "gender": "X", "days": 3})
+
+    assert response.status_code == 200
+    assert calls == ["_daily_feed"]  # 입력 검증(400)은 루프에서, 원국과 피드 계산은 실행기에서
+    days = response.json()["days"]
+    assert [d["date"] for d in days] == ["2026-10-19", "2026-10-20", "2026-10-21"]
+    assert (days[0]["stem"], days[0]["branch"], days[0]["ten_god"]) == ("丙", "寅", "정관")
+    assert bad.status_code == 400
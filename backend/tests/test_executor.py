@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from backend.app.executor import EngineConfig, EngineExecutor, EngineOverloaded
+from backend.app.saju import calculate_chart
+
+
+def test_thread_mode_runs_off_the_event_loop() -> None:
+    executor = EngineExecutor(EngineConfig(workers=0, max_pending=4))
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        result = await executor.run(time.sleep, 0.2)
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(scenario())
+    assert result is None
+    assert ticks >= 5  # 엔진 호출 동안에도 이벤트 루프가 돌았습니다.
+
+
+def test_thread_mode_start_prewarms_the_tables(monkeypatch) -> None:
+    from backend.app import executor as executor_module
+
+    warmed = []
+    monkeypatch.setattr(executor_module, "warm_engine", lambda: warmed.append(threading.get_ident()))
+    executor = EngineExecutor(EngineConfig(workers=0, max_pending=4))
+    executor.start()
+
+    assert warmed == [threading.get_ident()]
+    assert not executor.uses_processes
+
+
+def test_bounded_queue_rejects_when_full() -> None:
+    executor = EngineExecutor(EngineConfig(workers=0, max_pending=1))
+
+    async def scenario():
+        first = asyncio.create_task(executor.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+        with pytest.raises(EngineOverloaded):
+            await executor.run(time.sleep, 0)
+        await first
+        assert executor.pending == 0
+        await executor.run(time.sleep, 0)
+
+    asyncio.run(scenario())
+
+
+def test_process_pool_runs_engine_calls_in_workers() -> None:
+    executor = EngineExecutor(EngineConfig(workers=1, max_pending=4))
+    executor.start()
+    try:
+        assert executor.uses_processes
+
+        async def scenario():
+            pid = await executor.run(os.getpid)
+            chart = await executor.run(calculate_chart, date(1995, 8, 28), "22:59")
+            with pytest.raises(ValueError):
+                await executor.run(date.fromisoformat, "not-a-date")
+            return pid, chart
+
+        pid, chart = asyncio.run(scenario())
+        assert pid != os.getpid()
+        assert (chart.day.stem, chart.day.branch) == ("辛", "卯")
+    finally:
+        executor.shutdown()
+    assert not executor.uses_processes
+
+
+def test_crashed_pool_restarts_off_the_event_loop(monkeypatch) -> None:
+    executor = EngineExecutor(EngineConfig(workers=1, max_pending=4))
+    executor.start()
+    start = executor.start
+    restart_threads = []
+
+    def slow_start() -> None:
+        restart_threads.append(threading.get_ident())
+        time.sleep(0.2)
+        start()
+
+    monkeypatch.setattr(executor, "start", slow_start)
+    try:
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            with pytest.raises(RuntimeError, match="crashed"):
+                await executor.run(os._exit, 1)
+            task.cancel()
+            return ticks, await executor.run(os.getpid)
+
+        ticks, pid = asyncio.run(scenario())
+        assert ticks >= 5  # 새 풀을 준비하는 동안에도 이벤트 루프가 돌았습니다.
+        assert restart_threads and restart_threads[0] != threading.get_ident()
+        assert pid != os.getpid() and executor.uses_processes
+    finally:
+        executor.shutdown()
+
+
+def test_config_from_env(monkeypatch) -> None:
+    monkeypatch.setenv("SAJU_ENGINE_WORKERS", "3")
+    monkeypatch.delenv("SAJU_ENGINE_MAX_PENDING", raising=False)
+    assert EngineConfig.from_env() == EngineConfig(workers=3, max_pending=24)
+
+    monkeypatch.setenv("SAJU_ENGINE_MAX_PENDING", "5")
+    assert EngineConfig.from_env().max_pending == 5
@@ -8,8 +8,8 @@ from backend.app.saju import analyze
 
 
 def test_timezone_fallback_adds_accuracy_note_warning():
-    # Asia/Seoul 이외 timezone은 KST로 폴백하고 경고를 남겨야 합니다.
-    result = analyze(date(1990, 5, 17), "09:30", timezone="UTC")
+    # 알 수 없는 timezone은 KST로 폴백하고 경고를 남겨야 합니다.
+    result = analyze(date(1990, 5, 17), "09:30", timezone="Mars/Olympus_Mons")
     assert result.accuracy_note
     assert "KST(Asia/Seoul)" in result.accuracy_note
 
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+import pytest
+
+from backend.app.fortune import element_relation, iter_fortune_timeline, timeline_end_limit
+from backend.app.saju import calculate_chart
+from backend.app.solar_term_table import get_solar_term_table
+from backend.app.solar_terms import KST
+
+
+def _s(p) -> str:
+    return p.stem + p.branch
+
+
+CHART = calculate_chart(date(1995, 8, 28), "22:59")
+BORN = datetime(1995, 8, 28, 22, 59, tzinfo=KST)
+
+
+def test_timeline_starts_with_running_year_and_month() -> None:
+    entries = list(islice(iter_fortune_timeline(CHART, BORN, BORN + timedelta(days=400)), 4))
+
+    assert [(e.kind, _s(e.pillar)) for e in entries] == [
+        ("year", "乙亥"),
+        ("month", "甲申"),
+        ("month", "乙酉"),
+        ("month", "丙戌"),
+    ]
+    assert entries[0].start_kst.date() == date(1995, 2, 4)
+    assert entries[1].start_kst <= BORN < entries[1].end_kst
+    assert entries[1].end_kst == entries[2].start_kst
+
+
+def test_year_entries_switch_at_ipchun_before_that_years_months() -> None:
+    entries = list(iter_fortune_timeline(CHART, BORN, datetime(1997, 1, 1, tzinfo=KST)))
+    years = [e for e in entries if e.kind == "year"]
+
+    assert [_s(e.pillar) for e in years] == ["乙亥", "丙子"]
+    i = entries.index(years[1])
+    assert entries[i + 1].kind == "month"
+    assert entries[i + 1].start_kst == years[1].start_kst
+    assert _s(entries[i + 1].pillar) == "庚寅"
+
+
+def test_month_entries_match_calculate_chart() -> None:
+    for entry in iter_fortune_timeline(CHART, BORN, datetime(2000, 1, 1, tzinfo=KST)):
+        if entry.kind != "month":
+            continue
+        probe = entry.start_kst + timedelta(days=3)
+        chart = calculate_chart(probe.date(), f"{probe:%H:%M}")
+        assert _s(chart.month) == _s(entry.pillar)
+
+
+def test_interactions_with_natal_chart() -> None:
+    # 일간 辛(금): 乙(목)은 금이 극하는 관계, 丙(화)은 금을 극하는 관계
+    assert element_relation("metal", "wood") == "controls"
+    assert element_relation("metal", "fire") == "controlled_by"
+
+    entries = list(iter_fortune_timeline(CHART, datetime(1998, 3, 1, tzinfo=KST), datetime(1998, 3, 2, tzinfo=KST)))
+    year = entries[0]
+    assert _s(year.pillar) == "戊寅"
+    assert year.clashes == ["month"]  # 寅申沖
+    assert year.combines == ["year", "hour"]  # 寅亥合(연지·시지 亥)
+
+
+def test_century_timeline_is_lazy_and_months_only_optional() -> None:
+    table = get_solar_term_table()
+    end = timeline_end_limit(table)
+    entries = list(iter_fortune_timeline(CHART, BORN, end, table=table))
+    years = [e for e in entries if e.kind == "year"]
+    months = [e for e in entries if e.kind == "month"]
+
+    assert len(years) == end.year - 1995
+    assert abs(len(months) - 12 * len(years)) <= 12
+    assert len(list(iter_fortune_timeline(CHART, BORN, end, include_months=False, table=table))) == len(years)
+
+
+def test_timeline_range_errors() -> None:
+    with pytest.raises(ValueError):
+        next(iter_fortune_timeline(CHART, BORN, BORN))
+    with pytest.raises(ValueError):
+        next(iter_fortune_timeline(CHART, datetime(1850, 1, 1, tzinfo=KST), BORN))
+
+
+def test_timeline_endpoint_builds_the_chart_on_the_engine_executor(monkeypatch) -> None:
+    import json
+
+    from fastapi.testclient import TestClient
+
+    from backend.app import main
+
+    calls = []
+    run = main.engine.run
+
+    async def recording_run(fn, *args, **kwargs):
+        calls.append(fn.__name__)
+        return await run(fn, *args, **kwargs)
+
+    monkeypatch.setattr(main.engine, "run", recording_run)
+    body = {"birth_date": "1995-08-28", "birth_time": "22:59", "gender": "M", "years": 2}
+    with TestClient(main.app) as client:
+        response = client.post("/api/fortune/timeline", json=body)
+        bad = client.post("/api/fortune/timeline", json={**body, "gender": "X"})
+
+    assert response.status_code == 200
+    assert calls == ["_timeline_head"]  # 원국과 첫 항목은 응답 전에 실행기에서
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    end = datetime.fromisoformat(response.headers["X-Timeline-End"])
+    assert rows == [main._fortune_row(e) for e in iter_fortune_timeline(CHART, BORN, end)]
+    assert bad.status_code == 400
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from backend.app.lunar_calendar import LunarDate, lunar_to_solar, lunar_to_solar_many, solar_to_lunar
+from backend.app.saju import analyze, calculate_chart, resolve_birth_date
+
+
+def test_known_lunar_to_solar_conversions() -> None:
+    assert lunar_to_solar(1990, 5, 17) == date(1990, 6, 9)
+    assert lunar_to_solar(1995, 8, 3) == date(1995, 8, 28)
+    # 윤달: 2020년 윤4월, 2023년 윤2월
+    assert lunar_to_solar(2020, 4, 1, is_leap_month=True) == date(2020, 5, 23)
+    assert lunar_to_solar(2020, 5, 1) == date(2020, 6, 21)
+    assert lunar_to_solar(2023, 2, 1, is_leap_month=True) == date(2023, 3, 22)
+    # 1912년 이전(UTC+8 기준 시헌력)
+    assert lunar_to_solar(1903, 9, 1) == date(1903, 10, 20)
+
+
+def test_solar_to_lunar_round_trip() -> None:
+    assert solar_to_lunar(date(1995, 8, 28)) == LunarDate(1995, 8, 3, False)
+    assert solar_to_lunar(date(2020, 5, 23)) == LunarDate(2020, 4, 1, True)
+
+    for ordinal in range(date(1960, 1, 1).toordinal(), date(1962, 1, 1).toordinal()):
+        lunar = solar_to_lunar(date.fromordinal(ordinal))
+        assert lunar_to_solar(lunar.year, lunar.month, lunar.day, lunar.is_leap_month).toordinal() == ordinal
+
+
+@pytest.mark.parametrize(
+    ("year", "month", "day", "leap"),
+    [
+        (1990, 5, 31, False),  # 30일이 최대
+        (1990, 4, 30, False),  # 1990년 음력 4월은 작은달(29일)
+        (1990, 6, 1, True),  # 1990년 윤달은 5월
+        (1899, 1, 1, False),  # 표 범위 밖
+        (1990, 13, 1, False),
+    ],
+)
+def test_invalid_lunar_dates_raise(year: int, month: int, day: int, leap: bool) -> None:
+    with pytest.raises(ValueError):
+        lunar_to_solar(year, month, day, leap)
+
+
+def test_bulk_conversion_matches_scalar() -> None:
+    years = np.array([1990, 1995, 2020, 2020, 1990, 1990])
+    months = np.array([5, 8, 4, 4, 6, 5])
+    days = np.array([17, 3, 1, 1, 1, 31])
+    leaps = np.array([False, False, True, False, True, False])
+
+    ordinals = lunar_to_solar_many(years, months, days, leaps)
+
+    assert [date.fromordinal(int(o)) for o in ordinals[:4]] == [
+        date(1990, 6, 9),
+        date(1995, 8, 28),
+        date(2020, 5, 23),
+        lunar_to_solar(2020, 4, 1),
+    ]
+    assert ordinals[4] == -1 and ordinals[5] == -1
+
+
+def test_lunar_calendar_type_is_applied_to_chart() -> None:
+    solar = calculate_chart(date(1995, 8, 28), "22:59")
+    lunar = calculate_chart(date(1995, 8, 3), "22:59", calendar_type="LUNAR")
+
+    assert lunar == solar
+
+    analysis = analyze(date(1995, 8, 3), "22:59", calendar_type="LUNAR")
+    assert analysis.chart == solar
+    assert "양력 1995-08-28" in (analysis.accuracy_note or "")
+
+
+def test_resolve_birth_date_accepts_tuples() -> None:
+    # 음력 2월 30일은 date로 만들 수 없어 (연, 월, 일)로 넘깁니다.
+    assert resolve_birth_date((1990, 2, 30), "LUNAR") == date(1990, 3, 26)
+    assert resolve_birth_date((1995, 8, 3), " lunar ") == date(1995, 8, 28)
+    assert resolve_birth_date((1995, 8, 28), None) == date(1995, 8, 28)
+    with pytest.raises(ValueError):
+        resolve_birth_date((1995, 2, 30), "SOLAR")
+
+
+def test_analysis_endpoint_reports_lunar_conversion() -> None:
+    from fastapi.testclient import TestClient
+
+    from backend.app.main import app
+
+    with TestClient(app) as client:
+        lunar = client.post("/api/analysis", json={"birth_date": "1990-04-23", "gender": "M", "calendar_type": "LUNAR"})
+        solar = client.post("/api/analysis", json={"birth_date": "1990-05-17", "gender": "M"})
+        # 음력 2월 30일(양력 달력에 없는 날짜)
+        leap_day = client.post(
+            "/api/analysis",
+            json={"birth_date": "1990-02-30", "gender": "M", "calendar_type": "LUNAR", "birth_time": "10:00"},
+        )
+
+    assert lunar.status_code == 200
+    assert lunar.json()["accuracy_note"].startswith("음력 1990-04-23을 양력 1990-05-17로 변환해 계산했습니다")
+    assert lunar.json()["chart"] == solar.json()["chart"]
+    assert "양력" not in (solar.json()["accuracy_note"] or "")
+    assert leap_day.json()["accuracy_note"] == "음력 1990-02-30을 양력 1990-03-26로 변환해 계산했습니다"
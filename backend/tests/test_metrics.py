@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import date
+
+from backend.app import metrics, saju
+from backend.app.metrics import Counter, Histogram
+
+
+def test_render_prometheus_text() -> None:
+    hist = Histogram("test_render_seconds", "Test histogram.", ("stage",), buckets=(0.1, 1.0))
+    counter = Counter("test_render_total", "Test counter.", ("cache", "result"))
+    hist.observe(0.05, stage="a")
+    hist.observe(0.5, stage="a")
+    hist.observe(2.0, stage="a")
+    counter.inc(cache="x", result="hit")
+    counter.inc(2, cache="x", result="hit")
+
+    lines = metrics.render().splitlines()
+    assert "# TYPE test_render_seconds histogram" in lines
+    assert 'test_render_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_render_seconds_bucket{stage="a",le="1.0"} 2' in lines
+    assert 'test_render_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_render_seconds_count{stage="a"} 3' in lines
+    assert 'test_render_seconds_sum{stage="a"} 2.55' in lines
+    assert 'test_render_total{cache="x",result="hit"} 3' in lines
+
+
+def test_drain_and_merge_move_values_between_processes() -> None:
+    hist = Histogram("test_merge_seconds", "Test histogram.", ("stage",), buckets=(1.0,))
+    counter = Counter("test_merge_total", "Test counter.")
+    hist.observe(0.5, stage="s")
+    counter.inc()
+
+    snapshot = metrics.drain()
+    assert hist.count(stage="s") == 0 and counter.value() == 0
+
+    metrics.merge(snapshot)
+    metrics.merge(snapshot)
+    assert hist.count(stage="s") == 2
+    assert counter.value() == 2
+
+
+def test_analyze_records_scoring_and_fallback(monkeypatch) -> None:
+    scoring = metrics.STAGE_SECONDS.count(stage="scoring")
+    fallbacks = metrics.FALLBACKS.value(reason="solar_terms_unavailable")
+
+    def unavailable(_):
+        raise RuntimeError("no ephemeris")
+
+    monkeypatch.setattr(saju, "find_junggi_crossings_for_kst_date", unavailable)
+    result = saju.analyze(date(1995, 8, 28), "05:30")
+
+    assert "폴백" in result.accuracy_note
+    assert metrics.STAGE_SECONDS.count(stage="scoring") == scoring + 1
+    assert metrics.FALLBACKS.value(reason="solar_terms_unavailable") == fallbacks + 1
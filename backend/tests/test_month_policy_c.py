@@ -83,3 +83,39 @@ def test_policy_known_time_is_single() -> None:
 
     assert month_uncertain is False
     assert len(month_pillars) == 1
+
+
+def test_month_pillars_use_ipchun_year_before_ipchun() -> None:
+    # 1월~입춘 전 출생은 전년 연간으로 월간을 정합니다(2024-01-15: 癸卯年 乙丑月, 甲辰年 기준이면 丁丑).
+    import json
+
+    from backend.app.main import _analysis_response, _original_response
+    from backend.app.schemas import ChartInput, OriginalInput
+
+    birth_date = date(2024, 1, 15)
+    analysis = json.loads(_analysis_response(birth_date, None, ChartInput(birth_date="2024-01-15", gender="M")))
+    assert analysis["chart"]["month_pillar"] == {"stem": "乙", "branch": "丑"}
+    assert analysis["month_pillars"] == [{"stem": "乙", "branch": "丑"}]
+
+    original = _original_response(birth_date, None, OriginalInput(birth_date="2024-01-15", gender="M"))
+    assert [p.stem + p.branch for p in original.month_pillars] == ["乙丑"]
+
+
+def test_month_candidates_on_ipchun_day_use_each_side_year() -> None:
+    # 입춘 당일 시간 미상: 경계 이전 후보는 전년 연간(만세력 달력 00:00 월주와 같음), 이후 후보는 새해 연간
+    import json
+
+    from backend.app.main import _analysis_response
+    from backend.app.saju import calculate_chart, iter_calendar_days
+    from backend.app.schemas import ChartInput
+
+    for birth_date, expected in [(date(2024, 2, 4), ["乙丑", "丙寅"]), (date(1993, 2, 4), ["癸丑", "甲寅"])]:
+        payload = ChartInput(birth_date=birth_date.isoformat(), gender="M")
+        body = json.loads(_analysis_response(birth_date, None, payload))
+        assert [p["stem"] + p["branch"] for p in body["month_pillars"]] == expected
+        assert body["month_uncertain"] is True
+
+        day = next(iter_calendar_days(birth_date, birth_date))
+        assert [day.month_start.stem + day.month_start.branch, day.month_end.stem + day.month_end.branch] == expected
+    early = calculate_chart(date(2024, 2, 4), "00:30").month
+    assert early.stem + early.branch == "乙丑"
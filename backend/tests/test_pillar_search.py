@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.pillar_search import PillarPattern, parse_pillar_pattern, search_pillar_pattern
+from backend.app.saju import BRANCHES, STEMS, calculate_chart
+from backend.app.solar_term_table import get_solar_term_table
+from backend.app.vectorized import chart_indices_at, ordinals_to_kst_minutes
+
+
+def _s(index: int) -> str:
+    return STEMS[index % 10] + BRANCHES[index % 12]
+
+
+def test_vectorized_chart_indices_match_calculate_chart() -> None:
+    # 자시 경계, 홀수시 정각, 입춘 절입(04:37) 전후를 포함합니다.
+    cases = [
+        (date(1995, 8, 28), "05:30"),
+        (date(1995, 8, 28), "23:01"),
+        (date(1993, 2, 4), "04:36"),
+        (date(1993, 2, 4), "04:37"),
+        (date(1993, 2, 4), "15:00"),
+        (date(1990, 1, 15), "01:00"),
+        (date(1988, 9, 7), "19:04"),
+    ]
+    minutes = np.array(
+        [
+            ordinals_to_kst_minutes(np.array([d.toordinal()]))[0] + int(t[:2]) * 60 + int(t[3:])
+            for d, t in cases
+        ]
+    )
+    indices = chart_indices_at(get_solar_term_table(), minutes)
+
+    for (d, t), row in zip(cases, indices):
+        chart = calculate_chart(d, t)
+        expected = [chart.year, chart.month, chart.day, chart.hour]
+        assert [_s(int(i)) for i in row] == [p.stem + p.branch for p in expected], (d, t)
+
+
+def test_full_pattern_finds_sample_birth_interval() -> None:
+    # 1995-08-28 05:30 -> 乙亥 / 甲申 / 辛卯 / 辛卯 (卯시 05:01~07:00)
+    intervals = search_pillar_pattern(
+        PillarPattern(year="乙亥", month="甲申", day="辛卯", hour="辛卯"),
+        date(1900, 1, 1),
+        date(2053, 10, 1),
+    )
+
+    assert len(intervals) == 1
+    assert intervals[0].start_kst.replace(tzinfo=None) == datetime(1995, 8, 28, 5, 1)
+    assert intervals[0].end_kst.replace(tzinfo=None) == datetime(1995, 8, 28, 7, 1)
+
+
+def test_interval_starts_at_solar_term_boundary() -> None:
+    # 癸酉년 甲寅월은 1993-02-04 04:37(입춘 override)부터 시작합니다.
+    intervals = search_pillar_pattern({"year": "癸酉", "month": "甲寅"}, date(1993, 1, 1), date(1993, 12, 31))
+
+    assert len(intervals) == 1
+    assert intervals[0].start_kst.replace(tzinfo=None) == datetime(1993, 2, 4, 4, 37)
+    last_minute = intervals[0].end_kst - timedelta(minutes=1)
+    assert calculate_chart(last_minute.date(), last_minute.strftime("%H:%M")).month.branch == "寅"
+
+
+def test_wildcards_and_invalid_patterns() -> None:
+    assert parse_pillar_pattern("甲*") == (0, None)
+    assert parse_pillar_pattern("?子") == (None, 0)
+    assert parse_pillar_pattern("*") == (None, None)
+    with pytest.raises(ValueError):
+        parse_pillar_pattern("가나")
+
+    # 일주 辛卯 + 시지 卯: 60일마다 한 번씩 나타납니다.
+    intervals = search_pillar_pattern({"day": "辛卯", "hour": "*卯"}, date(1995, 1, 1), date(1995, 12, 31))
+    assert 6 <= len(intervals) <= 7
+    for interval in intervals:
+        chart = calculate_chart(interval.start_kst.date(), interval.start_kst.strftime("%H:%M"))
+        assert chart.day.stem + chart.day.branch == "辛卯"
+        assert chart.hour is not None and chart.hour.branch == "卯"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from backend.app.population_stats import HTTP_MAX_SAMPLES, STATUS_LEVELS, StatsConfig, population_statistics
+from backend.app.saju import ELEMENTS, calculate_chart, calculate_elements
+
+
+def test_unknown_time_statuses_match_calculate_elements() -> None:
+    start = date(1993, 1, 1)
+    stats = population_statistics(start, date(1993, 3, 31), include_hour=False)
+    days = [start + timedelta(days=i) for i in range(90)]
+    statuses = [calculate_elements(calculate_chart(d, None)).status for d in days]
+
+    assert stats.overall.count == 90
+    for element in ELEMENTS:
+        counts = Counter(s[element] for s in statuses)
+        for level in STATUS_LEVELS:
+            assert stats.overall.status_share[element][level] == pytest.approx(counts[level] / 90, abs=1e-6)
+
+
+def test_hourly_grid_matches_calculate_elements_sample() -> None:
+    stats = population_statistics(date(1995, 8, 28), date(1995, 8, 28), step_minutes=120, bin_width=0.1)
+    assert stats.overall.count == 12
+
+    expected = Counter()
+    for hour in range(0, 24, 2):
+        norm = calculate_elements(calculate_chart(date(1995, 8, 28), f"{hour:02d}:00")).elements_norm
+        expected[min(int(norm["water"] / 0.1), 999)] += 1
+    histogram = stats.overall.histogram["water"]
+    assert {i: n for i, n in enumerate(histogram) if n} == dict(expected)
+
+
+def test_group_by_year_histograms_and_quantiles() -> None:
+    stats = population_statistics(date(1980, 12, 30), date(1981, 1, 2), group_by="year", bin_width=10)
+
+    assert {k: g.count for k, g in stats.groups.items()} == {"1980": 48, "1981": 48}
+    assert stats.bin_edges == [float(i * 10) for i in range(11)]
+    for element in ELEMENTS:
+        assert sum(stats.overall.histogram[element]) == 96
+        q = stats.overall.quantiles[element]
+        assert 0.0 <= q["0.05"] <= q["0.5"] <= q["0.95"] <= 100.0
+
+
+def test_chunked_parallel_matches_serial() -> None:
+    serial = population_statistics(date(1990, 1, 1), date(1990, 6, 30), group_by="year")
+    parallel = population_statistics(date(1990, 1, 1), date(1990, 6, 30), group_by="year", workers=2, chunk_samples=500)
+    assert parallel == serial
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        population_statistics(date(1990, 1, 2), date(1990, 1, 1))
+    with pytest.raises(ValueError):
+        population_statistics(date(1990, 1, 1), date(1990, 1, 2), bin_width=3)
+    with pytest.raises(ValueError):
+        population_statistics(date(1990, 1, 1), date(1990, 1, 2), group_by="month")
+    with pytest.raises(ValueError):
+        population_statistics(date(1850, 1, 1), date(1850, 1, 2))
+
+
+def test_sample_cap_and_server_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 1시간 격자 10일 = 240개
+    assert population_statistics(date(1990, 1, 1), date(1990, 1, 10), max_samples=240).overall.count == 240
+    with pytest.raises(ValueError, match="max 239 samples"):
+        population_statistics(date(1990, 1, 1), date(1990, 1, 10), max_samples=239)
+
+    monkeypatch.delenv("SAJU_STATS_WORKERS", raising=False)
+    monkeypatch.delenv("SAJU_STATS_MAX_SAMPLES", raising=False)
+    assert StatsConfig.from_env() == StatsConfig(workers=1, max_samples=HTTP_MAX_SAMPLES)
+    monkeypatch.setenv("SAJU_STATS_WORKERS", "4")
+    monkeypatch.setenv("SAJU_STATS_MAX_SAMPLES", "1000")
+    assert StatsConfig.from_env() == StatsConfig(workers=4, max_samples=1000)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import marshal
+import pstats
+import time
+from datetime import date
+
+from backend.app import metrics, profiling
+from backend.app.profiling import ProfileStore, profiled_call, server_timing, traced_call
+from backend.app.saju import analyze
+
+
+def _staged(value):
+    with metrics.STAGE_SECONDS.time(stage="scoring"):
+        time.sleep(0.002)
+    return value
+
+
+def test_traced_call_collects_stage_times() -> None:
+    result, stages = traced_call(_staged, 7)
+    assert result == 7
+    assert stages["scoring"] >= 0.002
+    assert stages["engine"] >= stages["scoring"]
+    # 블록 밖에서는 모으지 않습니다.
+    assert metrics._TRACE.get() is None
+
+
+def test_server_timing_header_in_milliseconds() -> None:
+    assert server_timing({"chart": 0.0012345, "engine": 0.01}) == "chart;dur=1.234, engine;dur=10.000"
+
+
+def test_profiled_call_returns_pstats_artifact(tmp_path) -> None:
+    result, stages, artifact = profiled_call(analyze, date(1995, 8, 28), "05:30")
+    assert result.chart.day.stem == "辛"
+    assert "chart" in stages
+
+    path = tmp_path / "analysis.prof"
+    path.write_bytes(artifact)
+    functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+    assert {"analyze", "calculate_chart"} <= functions
+    assert marshal.loads(artifact)
+
+
+def test_profile_token_is_required(monkeypatch) -> None:
+    monkeypatch.delenv("SAJU_PROFILE_TOKEN", raising=False)
+    assert profiling.profile_requested({}, {}) is None
+    assert profiling.profile_requested({"x-saju-profile": "anything"}, {}) is False
+
+    monkeypatch.setenv("SAJU_PROFILE_TOKEN", "secret")
+    assert profiling.profile_requested({"x-saju-profile": "wrong"}, {}) is False
+    assert profiling.profile_requested({}, {"profile": "secret"}) is True
+
+
+def test_profile_store_keeps_recent_entries() -> None:
+    store = ProfileStore(max_entries=2)
+    ids = [store.put(bytes([i])) for i in range(3)]
+    assert store.get(ids[0]) is None
+    assert store.get(ids[2]) == b"\x02"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+
+from backend.app.relations import (
+    BRANCH_RELATION_BITS,
+    CLASH,
+    COMBINE,
+    HARM,
+    PILLAR_RELATION_BITS,
+    PUNISH,
+    STEM_CLASH,
+    STEM_COMBINE,
+    TEN_GOD_BY_STEM,
+    TEN_GOD_NAMES,
+    chart_indices,
+    pillar_relations,
+    pillar_relations_many,
+    ten_gods,
+    ten_gods_many,
+)
+from backend.app.saju import BRANCHES, STEMS, calculate_chart
+
+
+def _god(day: str, other: str) -> str:
+    return TEN_GOD_NAMES[TEN_GOD_BY_STEM[STEMS.index(day), STEMS.index(other)]]
+
+
+def test_ten_god_table() -> None:
+    # 甲 일간에서 甲..癸가 비견, 겁재, 식신, ..., 정인 순서입니다.
+    assert [_god("甲", s) for s in STEMS] == TEN_GOD_NAMES
+    assert _god("辛", "乙") == "편재"
+    assert _god("辛", "丙") == "정관"
+    assert _god("辛", "戊") == "정인"
+
+
+def test_branch_and_stem_relation_bits() -> None:
+    b = BRANCHES.index
+    assert BRANCH_RELATION_BITS[b("子"), b("丑")] & COMBINE
+    assert BRANCH_RELATION_BITS[b("子"), b("午")] & CLASH
+    assert BRANCH_RELATION_BITS[b("寅"), b("巳")] == PUNISH | HARM
+    assert BRANCH_RELATION_BITS[b("辰"), b("辰")] == PUNISH
+    assert (BRANCH_RELATION_BITS == BRANCH_RELATION_BITS.T).all()
+
+    # 甲子 x 己丑: 천간합 + 육합 / 甲子 x 庚午: 천간충 + 충
+    assert PILLAR_RELATION_BITS[0, 25] == STEM_COMBINE | COMBINE
+    assert PILLAR_RELATION_BITS[0, 6] == STEM_CLASH | CLASH
+    # 戊는 충이 없습니다.
+    assert not PILLAR_RELATION_BITS[4, 0] & STEM_CLASH
+
+
+def test_chart_sections() -> None:
+    chart = calculate_chart(date(1995, 8, 28), "22:59")  # 乙亥 甲申 辛卯 己亥
+
+    gods = ten_gods(chart)
+    assert (gods["year"].stem, gods["year"].branch) == ("편재", "상관")
+    assert (gods["day"].stem, gods["day"].branch) == ("일간", "편재")
+    assert (gods["hour"].stem, gods["hour"].branch) == ("편인", "상관")
+
+    relations = {(r.first, r.second): r.relations for r in pillar_relations(chart)}
+    assert relations == {
+        ("year", "month"): ["harm"],
+        ("year", "day"): ["stem_clash"],
+        ("year", "hour"): ["punish"],
+        ("month", "hour"): ["harm", "stem_combine"],
+    }
+
+    no_hour = calculate_chart(date(1995, 8, 28), None)
+    assert ten_gods(no_hour)["hour"] is None
+    assert all("hour" not in (r.first, r.second) for r in pillar_relations(no_hour))
+
+
+def test_batch_matches_scalar() -> None:
+    charts = [calculate_chart(date(1990 + i, 1 + i % 12, 1 + i), f"{i % 24:02d}:30") for i in range(20)]
+    charts.append(calculate_chart(date(1995, 8, 28), None))
+    indices = np.stack([chart_indices(c) for c in charts])
+
+    gods = ten_gods_many(indices)
+    bits = pillar_relations_many(indices)
+    for row, chart in enumerate(charts):
+        scalar = ten_gods(chart)
+        for p, key in enumerate(["year", "month", "day", "hour"]):
+            if scalar[key] is None:
+                assert (gods[row, p] == -1).all()
+                continue
+            if key != "day":
+                assert TEN_GOD_NAMES[gods[row, p, 0]] == scalar[key].stem
+            assert TEN_GOD_NAMES[gods[row, p, 1]] == scalar[key].branch
+        assert int(np.count_nonzero(bits[row])) == len(pillar_relations(chart))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qsl
+
+from backend.app.response_cache import ResponseCache, canonical_query, etag_for, etag_matches
+from backend.app.schemas import ChartInput
+
+
+def test_canonical_query_is_order_and_default_insensitive() -> None:
+    a = ChartInput(birth_date="1995-08-28", gender="M", birth_time="22:59", timezone="Asia/Seoul")
+    b = ChartInput(gender="M", birth_time="22:59", birth_date="1995-08-28", calendar_type="SOLAR")
+    c = ChartInput(birth_date="1995-08-28", gender="M", birth_time="22:59", use_historical_offset=True)
+
+    assert canonical_query(a) == canonical_query(b) == "birth_date=1995-08-28&birth_time=22%3A59&gender=M"
+    assert dict(parse_qsl(canonical_query(c)))["use_historical_offset"] == "true"
+    assert canonical_query(a) != canonical_query(c)
+
+    named = ChartInput(birth_date="1995-08-28", gender="M", birth_time="22:59", name="홍길동")
+    assert canonical_query(named, exclude=("name",)) == canonical_query(a)
+
+
+def test_etag_depends_on_path_and_input() -> None:
+    tag = etag_for("/api/analysis", "birth_date=1995-08-28&gender=M")
+    assert tag.startswith('"') and tag.endswith('"')
+    assert tag == etag_for("/api/analysis", "birth_date=1995-08-28&gender=M")
+    assert tag != etag_for("/api/original", "birth_date=1995-08-28&gender=M")
+    assert tag != etag_for("/api/analysis", "birth_date=1995-08-29&gender=M")
+
+    assert etag_matches(tag, tag)
+    assert etag_matches(f'"other", W/{tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches(None, tag)
+    assert not etag_matches('"other"', tag)
+
+
+def test_cache_evicts_least_recently_used_by_entries_and_bytes() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1111")
+    cache.put("b", b"2222")
+    assert cache.get("a") == b"1111"  # a가 최근 사용
+    cache.put("c", b"33")
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.put("d", b"4444444")  # 바이트 한도 초과 -> 오래된 것부터 축출
+    assert cache.size_bytes <= 10
+    assert cache.get("d") == b"4444444"
+    assert cache.get("a") is None
+
+    cache.put("huge", b"x" * 11)  # 한도보다 큰 본문은 저장하지 않습니다.
+    assert cache.get("huge") is None
+    assert cache.hits == 2 and cache.misses == 3
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = ResponseCache(max_entries=0)
+    cache.put("a", b"1")
+    assert cache.get("a") is None
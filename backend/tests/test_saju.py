@@ -22,3 +22,13 @@ def test_analysis_has_routines():
     result = analyze(date(1990, 5, 17), "09:30")
     assert "primary" in result.routines
     assert len(result.routines["primary"]) == 4
+
+
+def test_year_pillar_before_ipchun_uses_previous_year():
+    # 1월~입춘 전 출생은 전년 연주(1990-01-15 -> 己巳년, 丑월)
+    chart = calculate_chart(date(1990, 1, 15), "05:30")
+    assert chart.year.stem + chart.year.branch == "己巳"
+    assert chart.month.stem + chart.month.branch == "丁丑"
+
+    unknown_time = calculate_chart(date(1990, 1, 15), None)
+    assert unknown_time.year.stem + unknown_time.year.branch == "己巳"
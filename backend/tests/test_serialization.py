@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+
+from backend.app import serialization
+from backend.app.schemas import AnalysisResponse
+from backend.app.serialization import daeun_payload, encode_analysis
+from backend.tests.helpers_responses import analysis_parts
+
+
+def _pydantic_body(analysis, month_pillars, month_uncertain, daeun, gods, relations) -> bytes:
+    chart = analysis.chart
+    return AnalysisResponse(
+        chart={
+            "year_pillar": chart.year.__dict__,
+            "month_pillar": chart.month.__dict__,
+            "day_pillar": chart.day.__dict__,
+            "hour_pillar": chart.hour.__dict__ if chart.hour else None,
+        },
+        month_pillars=[p.__dict__ for p in month_pillars],
+        month_uncertain=month_uncertain,
+        hidden_stems=analysis.hidden_stems,
+        element_score=analysis.element_score.__dict__,
+        summary=analysis.summary,
+        routines=analysis.routines,
+        accuracy_note=analysis.accuracy_note,
+        daeun=None if daeun is None else daeun_payload(daeun),
+        ten_gods={key: None if g is None else g.__dict__ for key, g in gods.items()},
+        pillar_relations=[r.__dict__ for r in relations],
+    ).model_dump_json().encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "birth_date, birth_time, with_daeun",
+    [
+        (date(1995, 8, 28), "05:30", True),
+        (date(1993, 2, 4), None, True),  # 시간 미상 + 절기 경계일(월주 후보 2개)
+        (date(1988, 9, 20), "23:40", False),
+    ],
+)
+def test_fast_path_matches_pydantic_bytes(birth_date: date, birth_time, with_daeun: bool) -> None:
+    parts = analysis_parts(birth_date, birth_time, with_daeun=with_daeun)
+    body = encode_analysis(*parts)
+    assert body == _pydantic_body(*parts)
+    assert AnalysisResponse.model_validate_json(body).model_dump_json().encode("utf-8") == body
+
+
+def test_json_fallback_matches_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    value = {"a": [1.0, 0.1 + 0.2, None, True], "한글": "木", "n": 3}
+    fast = serialization.dumps(value)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps(value) == fast
+    assert json.loads(fast) == value
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from backend.app import shared_tables, solar_terms
+from backend.app.shared_tables import CrossingStore, SharedConfig, crossing_store, fingerprint, shared_arrays
+from backend.app.solar_term_table import _table_key, build_solar_term_table, get_solar_term_table
+
+
+def _counting_build(log_path: str):
+    def build():
+        with open(log_path, "a") as f:
+            f.write(f"{os.getpid()}\n")
+        return {"values": np.arange(10, dtype=np.float64), "flags": np.array([1, 0, 1], dtype=np.int8)}
+
+    return build
+
+
+def _open_in_child(directory: str, log_path: str) -> None:
+    arrays = shared_arrays("test", "k", _counting_build(log_path), config=SharedConfig(directory=directory))
+    assert float(arrays["values"].sum()) == 45.0
+
+
+def test_arrays_are_built_once_and_opened_read_only(tmp_path) -> None:
+    config = SharedConfig(directory=str(tmp_path / "shared"))
+    log = str(tmp_path / "builds.log")
+    first = shared_arrays("test", "k", _counting_build(log), config=config)
+    second = shared_arrays("test", "k", _counting_build(log), config=config)
+
+    assert open(log).read().count("\n") == 1
+    for arrays in (first, second):
+        assert type(arrays["values"]) is np.ndarray
+        assert not arrays["values"].flags.writeable
+        np.testing.assert_array_equal(arrays["values"], np.arange(10))
+        np.testing.assert_array_equal(arrays["flags"], [1, 0, 1])
+    # 다른 키는 다른 파일
+    shared_arrays("test", "other", _counting_build(log), config=config)
+    assert open(log).read().count("\n") == 2
+
+
+def test_concurrent_processes_build_once(tmp_path) -> None:
+    directory = str(tmp_path / "shared")
+    log = str(tmp_path / "builds.log")
+    context = multiprocessing.get_context("fork")
+    children = [context.Process(target=_open_in_child, args=(directory, log)) for _ in range(4)]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join(30)
+        assert child.exitcode == 0
+    assert open(log).read().count("\n") == 1
+
+
+def test_disabled_or_unwritable_directory_builds_in_process(tmp_path) -> None:
+    log = str(tmp_path / "builds.log")
+    disabled = SharedConfig(directory=str(tmp_path / "shared"), enabled=False)
+    assert shared_arrays("test", "k", _counting_build(log), config=disabled)["values"].flags.writeable
+    assert not os.path.exists(disabled.directory)
+
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    unwritable = SharedConfig(directory=str(blocker / "shared"))
+    arrays = shared_arrays("test", "k", _counting_build(log), config=unwritable)
+    np.testing.assert_array_equal(arrays["values"], np.arange(10))
+    assert open(log).read().count("\n") == 2
+
+
+def test_directory_is_private_and_untrusted_directory_is_not_used(tmp_path) -> None:
+    log = str(tmp_path / "builds.log")
+    private = SharedConfig(directory=str(tmp_path / "private"))
+    shared_arrays("test", "k", _counting_build(log), config=private)
+    assert os.stat(private.directory).st_mode & 0o777 == 0o700
+
+    # 다른 사용자가 쓸 수 있는 디렉터리(미리 심어 둔 테이블)는 읽지 않고 프로세스 안에서 계산합니다.
+    open_dir = tmp_path / "open"
+    planted = open_dir / "test-k"
+    planted.mkdir(parents=True)
+    np.save(str(planted / "values.npy"), np.zeros(10))
+    open_dir.chmod(0o777)
+    untrusted = SharedConfig(directory=str(open_dir))
+    arrays = shared_arrays("test", "k", _counting_build(log), config=untrusted)
+    np.testing.assert_array_equal(arrays["values"], np.arange(10))
+    assert arrays["values"].flags.writeable
+    assert crossing_store(untrusted) is None
+    assert open(log).read().count("\n") == 2
+
+
+def test_fingerprint_changes_with_inputs() -> None:
+    assert fingerprint("a", 1) == fingerprint("a", 1)
+    assert fingerprint("a", 1) != fingerprint("a", 2)
+    assert len(_table_key()) == 16
+
+
+def test_shared_solar_term_table_matches_build() -> None:
+    table = get_solar_term_table()
+    built = build_solar_term_table()
+    np.testing.assert_array_equal(table.when_utc, built.when_utc)
+    np.testing.assert_array_equal(table.longitude_deg, built.longitude_deg)
+    assert table.ipchun_utc_by_year == built.ipchun_utc_by_year
+
+
+def test_crossing_store_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "crossings.sqlite")
+    start = datetime(2024, 2, 3, 12, tzinfo=timezone.utc)
+    end = datetime(2024, 2, 4, 12, tzinfo=timezone.utc)
+    writer, reader = CrossingStore(path), CrossingStore(path)
+    assert reader.get(start, end, 60) is None
+    writer.put(start, end, 60, [(315.0, "2024-02-04T17:27:00+09:00")])
+    assert reader.get(start, end, 60) == [(315.0, "2024-02-04T17:27:00+09:00")]
+    assert reader.get(start.replace(tzinfo=None), end.replace(tzinfo=None), 60) is not None
+    assert reader.get(start, end, 30) is None
+
+
+def test_crossings_are_reused_from_store(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("skyfield")
+    monkeypatch.setattr(shared_tables, "shared_config", SharedConfig(directory=str(tmp_path)))
+    start = datetime(2024, 2, 3, 12, tzinfo=timezone.utc)
+    end = datetime(2024, 2, 4, 12, tzinfo=timezone.utc)
+    computed = solar_terms.find_crossings_in_utc_window(start, end, step_minutes=60)
+    assert [c.name for c in computed] == ["입춘"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("crossings should come from the shared store")
+
+    monkeypatch.setattr(solar_terms, "_scan_crossings_in_utc_window", fail)
+    assert solar_terms.find_crossings_in_utc_window(start, end, step_minutes=60) == computed
+    # 다른 연결(다른 프로세스와 같은 경로)도 같은 값을 봅니다.
+    assert CrossingStore(crossing_store().path).get(start, end, 60) == [
+        (c.target_longitude_deg, c.when_kst.isoformat()) for c in computed
+    ]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.app.single_flight import SingleFlight
+
+
+def test_concurrent_identical_keys_run_once() -> None:
+    flights = SingleFlight()
+    runs = 0
+
+    async def compute():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.05)
+        return b"body"
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("k", compute) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == [b"body"] * 5
+    assert runs == 1
+    assert flights.stats() == {"calls": 5, "executions": 1, "coalesced": 4, "inflight": 0}
+
+
+def test_distinct_keys_and_later_calls_run_separately() -> None:
+    flights = SingleFlight()
+
+    async def compute(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def scenario():
+        first = await asyncio.gather(flights.do("a", lambda: compute(1)), flights.do("b", lambda: compute(2)))
+        second = await flights.do("a", lambda: compute(3))
+        return first, second
+
+    assert asyncio.run(scenario()) == ([1, 2], 3)
+    assert flights.executions == 3
+    assert flights.coalesced == 0
+
+
+def test_exception_is_shared_by_all_waiters() -> None:
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flights.executions == 1
+    assert flights.inflight == 0
+
+
+def test_cancelled_leader_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def scenario():
+        leader = asyncio.create_task(flights.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
+    assert flights.executions == 1
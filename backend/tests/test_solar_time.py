@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.app.saju import BRANCHES, STEMS, calculate_chart
+from backend.app.solar_term_table import get_solar_term_table
+from backend.app.solar_time import (
+    EOT_FIRST_DATE,
+    check_true_solar_date,
+    equation_of_time_table,
+    resolve_longitude,
+    to_true_solar_time,
+    true_solar_minutes,
+)
+from backend.app.vectorized import chart_indices_at
+
+
+def _minutes(dt: datetime) -> int:
+    return (dt - datetime(1970, 1, 1)) // timedelta(minutes=1)
+
+
+def test_equation_of_time_extremes() -> None:
+    eot = equation_of_time_table()
+
+    def at(d: date) -> float:
+        return float(eot[d.toordinal() - EOT_FIRST_DATE.toordinal()])
+
+    # 2월 중순 약 -14분, 11월 초 약 +16분
+    assert at(date(2000, 2, 11)) == pytest.approx(-14.2, abs=0.5)
+    assert at(date(2000, 11, 3)) == pytest.approx(16.4, abs=0.5)
+
+
+def test_city_and_longitude_resolution() -> None:
+    assert resolve_longitude(None, "서울") == pytest.approx(126.978)
+    assert resolve_longitude(None, "Busan") == pytest.approx(129.075)
+    assert resolve_longitude(127.0, "서울") == 127.0
+    assert resolve_longitude(None, None) is None
+    with pytest.raises(ValueError):
+        resolve_longitude(None, "atlantis")
+
+
+def test_out_of_range_dates_with_longitude_are_bad_requests() -> None:
+    from fastapi import HTTPException
+
+    from backend.app.main import _birth_longitude
+    from backend.app.schemas import ChartInput, OriginalInput
+
+    check_true_solar_date(date(1900, 1, 1))
+    with pytest.raises(ValueError, match="1900-01-01..2053-12-31"):
+        check_true_solar_date(date(2054, 1, 1))
+
+    # 균시차 표 밖 날짜 + 경도/도시는 500이 아니라 400
+    for payload, birth_date in [
+        (ChartInput(birth_date="1850-03-01", gender="M", birth_time="10:00", city="Seoul"), date(1850, 3, 1)),
+        (OriginalInput(birth_date="2060-03-01", gender="F", longitude=127.0), date(2060, 3, 1)),
+    ]:
+        with pytest.raises(HTTPException) as excinfo:
+            _birth_longitude(payload, birth_date)
+        assert excinfo.value.status_code == 400
+    # 경도가 없으면 보정하지 않으므로 범위와 무관
+    assert _birth_longitude(ChartInput(birth_date="1850-03-01", gender="M"), date(1850, 3, 1)) is None
+
+
+def test_true_solar_time_moves_day_and_hour_only() -> None:
+    # 서울 1995-08-28 23:10 KST -> 진태양시 약 22:36(亥시, 당일 일주)
+    assert to_true_solar_time(date(1995, 8, 28), "23:10", 126.978) == (date(1995, 8, 28), "22:36")
+
+    kst = calculate_chart(date(1995, 8, 28), "23:10")
+    solar = calculate_chart(date(1995, 8, 28), "23:10", longitude=126.978)
+
+    assert (kst.year, kst.month) == (solar.year, solar.month)
+    assert kst.hour.branch == "子"
+    assert solar.hour.branch == "亥"
+    assert kst.day != solar.day
+
+
+def test_vectorized_true_solar_matches_scalar() -> None:
+    cases = [
+        (date(1995, 8, 28), "23:10"),
+        (date(1993, 2, 4), "04:40"),
+        (date(2001, 3, 6), "00:20"),
+        (date(1988, 11, 3), "13:05"),
+    ]
+    minutes = np.array([_minutes(datetime.combine(d, datetime.strptime(t, "%H:%M").time())) for d, t in cases])
+    indices = chart_indices_at(get_solar_term_table(), minutes, true_solar_minutes(minutes, 126.978))
+
+    for (d, t), row in zip(cases, indices):
+        chart = calculate_chart(d, t, longitude=126.978)
+        got = [STEMS[i % 10] + BRANCHES[i % 12] for i in row]
+        assert got == [p.stem + p.branch for p in (chart.year, chart.month, chart.day, chart.hour)]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from backend.app.civil_time import civil_time_table_for_zone
+from backend.app.saju import analyze, calculate_chart, calculate_month_pillars_policy_c
+from backend.app.solar_terms import find_crossings_for_local_date
+
+zoneinfo = pytest.importorskip("zoneinfo")
+try:
+    zoneinfo.ZoneInfo("America/New_York")
+except zoneinfo.ZoneInfoNotFoundError:  # pragma: no cover
+    pytest.skip("tz database is not installed", allow_module_level=True)
+
+
+def test_zone_tables_are_compiled_once() -> None:
+    assert civil_time_table_for_zone("America/New_York") is civil_time_table_for_zone("America/New_York")
+    with pytest.raises(ValueError):
+        civil_time_table_for_zone("Mars/Olympus_Mons")
+
+
+def test_foreign_zone_uses_instant_for_year_month_and_local_standard_time_for_day_hour() -> None:
+    # 뉴욕 1990-05-17 09:30(EDT, UTC-4) = KST 1990-05-17 22:30, 현지 표준시 08:30
+    chart = calculate_chart(date(1990, 5, 17), "09:30", timezone="America/New_York")
+    kst_chart = calculate_chart(date(1990, 5, 17), "22:30")
+    local_standard = calculate_chart(date(1990, 5, 17), "08:30")
+
+    assert (chart.year, chart.month) == (kst_chart.year, kst_chart.month)
+    assert (chart.day, chart.hour) == (local_standard.day, local_standard.hour)
+    assert analyze(date(1990, 5, 17), "09:30", timezone="America/New_York").accuracy_note is None
+
+
+def test_policy_c_day_window_follows_requested_zone() -> None:
+    # 1993 입춘: KST 02-04 04:37 = 뉴욕 02-03 14:37(EST)
+    assert find_crossings_for_local_date(date(1993, 2, 3), "America/New_York")
+    assert not find_crossings_for_local_date(date(1993, 2, 4), "America/New_York")
+
+    pillars, uncertain = calculate_month_pillars_policy_c(date(1993, 2, 3), None, 9, timezone="America/New_York")
+    assert uncertain and [p.branch for p in pillars] == ["丑", "寅"]
+
+    pillars, uncertain = calculate_month_pillars_policy_c(date(1993, 2, 4), None, 9, timezone="America/New_York")
+    assert not uncertain and pillars[0].branch == "寅"
+
+
+def test_year_pillar_uses_instant_across_ipchun() -> None:
+    # 뉴욕 1993-02-03 14:00(EST) = KST 02-04 04:00, 입춘(04:37) 이전 -> 壬申年
+    before = calculate_chart(date(1993, 2, 3), "14:00", timezone="America/New_York")
+    after = calculate_chart(date(1993, 2, 3), "15:00", timezone="America/New_York")
+
+    assert before.year.stem + before.year.branch == "壬申"
+    assert after.year.stem + after.year.branch == "癸酉"